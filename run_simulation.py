@@ -147,6 +147,8 @@ def main():
     parser = argparse.ArgumentParser(description="Bio-Sim: Human Microbiome Simulation")
     parser.add_argument("--config", help="Path to configuration file")
     parser.add_argument("--load", help="Path to saved simulation file to load")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run without a window or frame rate cap (for benchmarks and batch runs)")
     args = parser.parse_args()
     
     try:
@@ -164,6 +166,10 @@ def main():
         
         print(f"Loaded configuration with {len(config)} top-level keys")
         
+        if args.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            config.setdefault("simulation", {})["headless"] = True
+        
         # Display initial settings
         max_organisms = config.get("simulation_settings", {}).get("max_organisms", 0)
         performance_mode = config.get("simulation_settings", {}).get("performance_mode", False)
@@ -3,7 +3,10 @@ Environment Module for Bio-Sim
 Handles environmental conditions and their effects on organisms
 """
 
+import math
 import numpy as np
+from src.organisms.organism_arrays import OrganismArrays
+from src.environment.spatial_index import SpatialIndex
 
 class Environment:
     """
@@ -40,6 +43,16 @@ class Environment:
         
         # Reference to the simulation (will be set by the simulation)
         self.simulation = None
+        
+        # Structure-of-arrays snapshot of organism state (refreshed once per tick)
+        self.organism_arrays = OrganismArrays()
+        
+        # Grid of organism positions shared by all neighbourhood queries (rebuilt once per tick)
+        self.spatial_index = SpatialIndex()
+        
+        # Whether the index still matches organism positions; cleared once organisms
+        # may have moved or been added since it was built
+        self.spatial_index_current = False
     
     def _initialize_conditions(self):
         """Initialize the environmental conditions grids"""
@@ -106,12 +119,14 @@ class Environment:
         for x in range(max(0, center_x - radius), min(self.grid_res, center_x + radius + 1)):
             for y in range(max(0, center_y - radius), min(self.grid_res, center_y + radius + 1)):
                 # Calculate distance from center
-                dist = np.sqrt((x - center_x)**2 + (y - center_y)**2)
+                dx = x - center_x
+                dy = y - center_y
+                dist_sq = dx*dx + dy*dy
                 
                 # Apply if within radius
-                if dist <= radius:
+                if dist_sq <= radius * radius:
                     # Intensity falls off with distance
-                    factor = (radius - dist) / radius
+                    factor = (radius - math.sqrt(dist_sq)) / radius
                     grid[x, y] += intensity * factor
     
     def update_environment_type(self, env_type):
@@ -189,6 +204,41 @@ class Environment:
         if self.tick_count % 500 == 0:
             self._create_environmental_shift()
             
+    def update_soa(self, organisms):
+        """
+        Refresh the structure-of-arrays snapshot of organism state.
+        Called by the simulation once per tick, after organisms have moved.
+        
+        Args:
+            organisms (list): All organisms in the simulation
+        """
+        self.organism_arrays.update(organisms)
+    
+    def update_spatial_index(self, organisms, positions=None):
+        """
+        Rebuild the shared spatial index of organism positions.
+        Called by the simulation once per tick, after organisms have moved.
+        
+        Args:
+            organisms (list): All organisms in the simulation
+            positions (tuple, optional): (xs, ys, alive) arrays aligned with
+                organisms, e.g. from OrganismArrays.positions(); the grid is
+                then bucketed with array operations
+        """
+        if positions is None:
+            self.spatial_index.rebuild(organisms)
+        else:
+            self.spatial_index.rebuild_from_arrays(organisms, *positions)
+        self.spatial_index_current = True
+        
+    def invalidate_spatial_index(self):
+        """
+        Mark the spatial index as out of date.
+        Called by the simulation once organisms may have moved or been added
+        since the index was built; the next nearby query rebuilds it first.
+        """
+        self.spatial_index_current = False
+        
     def _update_transition(self):
         """Update environmental transition"""
         self.transition_current += 1
@@ -310,6 +360,31 @@ class Environment:
             "flow_rate": self.flow_rate_grid[cell_x, cell_y]
         }
     
+    def sample_conditions(self, xs, ys, fields=("temperature", "ph_level", "nutrients", "flow_rate")):
+        """
+        Get environmental conditions at many world coordinates at once
+        
+        Equivalent to calling get_conditions_at for each point, but the grid cells
+        are found and read with whole-array operations.
+        
+        Args:
+            xs, ys (ndarray): World coordinates
+            fields (tuple): Names of the conditions to sample (keys of get_conditions_at)
+            
+        Returns:
+            dict: Array of values per requested condition, aligned with the coordinates
+        """
+        last = self.grid_res - 1
+        cell_x = np.clip(np.floor_divide(xs, self.cell_width), 0, last).astype(np.intp)
+        cell_y = np.clip(np.floor_divide(ys, self.cell_height), 0, last).astype(np.intp)
+        grids = {
+            "temperature": self.temperature_grid,
+            "ph_level": self.ph_grid,
+            "nutrients": self.nutrient_grid,
+            "flow_rate": self.flow_rate_grid
+        }
+        return {field: grids[field][cell_x, cell_y] for field in fields}
+    
     def consume_nutrients(self, x, y, amount):
         """
         Consume nutrients at the specified location
@@ -362,8 +437,9 @@ class Environment:
         """
         Get organisms near the specified coordinates.
         
-        This method delegates to the simulation's spatial grid for finding nearby organisms.
-        If the simulation reference is not set, returns an empty list.
+        This method uses the shared spatial index, first rebuilding it from the
+        simulation's organism list if organisms may have moved or been added since
+        it was built. If the simulation reference is not set, returns an empty list.
         
         Args:
             x (float): Center x coordinate
@@ -377,19 +453,8 @@ class Environment:
             print(f"WARNING: Environment.get_nearby_organisms called at ({x:.1f}, {y:.1f}) but simulation is not set")
             return []
             
-        # Use the simulation's current organisms list
-        nearby = []
-        for organism in self.simulation.organisms:
-            if not organism.is_alive:
-                continue
-                
-            # Calculate distance
-            dx = organism.x - x
-            dy = organism.y - y
-            distance = (dx**2 + dy**2)**0.5
-            
-            # Add if within radius
-            if distance <= radius:
-                nearby.append(organism)
-                
-        return nearby 
\ No newline at end of file
+        # Organisms that moved or were born since the index was built would be
+        # missing from (or misplaced in) its cells, so bring it up to date first
+        if not self.spatial_index_current:
+            self.update_spatial_index(self.simulation.organisms)
+        return self.spatial_index.query(x, y, radius)
@@ -0,0 +1,251 @@
+"""
+Spatial Index Module for Bio-Sim
+Uniform grid over organism positions, brought up to date once per simulation
+tick and shared by every neighbourhood query made during that tick
+"""
+
+from operator import itemgetter
+
+import numpy as np
+
+# Incremental updates are used while at most this fraction of organisms change cell
+_INCREMENTAL_MOVE_FRACTION = 0.1
+
+
+class SpatialIndex:
+    """
+    Uniform grid mapping (cell_x, cell_y) keys to the living organisms in that cell.
+    rebuild() fills the grid from scratch. rebuild_from_arrays() does the same
+    from position arrays, but when the living organisms are unchanged since its
+    last build and few of them (at most _INCREMENTAL_MOVE_FRACTION) changed
+    cell, it moves just those organisms between buckets instead; otherwise it
+    falls back to a full rebuild.
+    """
+
+    def __init__(self, cell_size=50):
+        """
+        Initialize an empty index
+
+        Args:
+            cell_size (int): Width and height of each grid cell in world units
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+        # Living organisms and their packed cell keys from the last array build
+        self._members = None
+        self._keys = None
+
+    def cell_key(self, x, y):
+        """
+        Get the grid cell containing a point
+
+        Args:
+            x (float): World x coordinate
+            y (float): World y coordinate
+
+        Returns:
+            tuple: (cell_x, cell_y)
+        """
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def rebuild(self, organisms):
+        """
+        Re-bucket all living organisms by their current position
+
+        Args:
+            organisms (list): All organisms in the simulation
+        """
+        cells = {}
+        count = 0
+        cell_size = self.cell_size
+        for organism in organisms:
+            if not organism.is_alive:
+                continue
+            cell_key = (int(organism.x // cell_size), int(organism.y // cell_size))
+            bucket = cells.get(cell_key)
+            if bucket is None:
+                cells[cell_key] = [organism]
+            else:
+                bucket.append(organism)
+            count += 1
+        self.cells = cells
+        self.count = count
+        self._members = None
+
+    def _cell_keys(self, xs, ys):
+        """Get the cell coordinates of many points, and each cell packed into one int64 key"""
+        cell_xs = np.floor_divide(xs, self.cell_size).astype(np.int64)
+        cell_ys = np.floor_divide(ys, self.cell_size).astype(np.int64)
+        return cell_xs, cell_ys, (cell_xs << 32) + cell_ys
+
+    def crowded_cells(self, xs, ys, minimum):
+        """
+        Get the cells holding at least a given number of points
+
+        Points are counted by packed integer cell key with one sort, rather than
+        by walking the buckets.
+
+        Args:
+            xs (ndarray): X coordinate of each point
+            ys (ndarray): Y coordinate of each point
+            minimum (int): Number of points a cell needs
+
+        Returns:
+            list: (cell_x, cell_y) keys of the crowded cells
+        """
+        if len(xs) < minimum:
+            return []
+        _, _, keys = self._cell_keys(xs, ys)
+        keys, counts = np.unique(keys, return_counts=True)
+        cell_xs, cell_ys = _unpack_keys(keys[counts >= minimum])
+        return list(zip(cell_xs.tolist(), cell_ys.tolist()))
+
+    def rebuild_from_arrays(self, organisms, xs, ys, alive):
+        """
+        Re-bucket living organisms from position arrays aligned with the list
+
+        Cell keys are computed for every organism at once and the organisms are
+        grouped with a stable sort, so buckets hold the same organisms in the
+        same order as rebuild() would produce.
+
+        When the living organisms are the same as at the last call and only a
+        few have changed cell, just those are moved between buckets instead.
+        Buckets then hold the same organisms as a full build, but a moved
+        organism sits at the end of its new bucket.
+
+        Args:
+            organisms (list): All organisms in the simulation
+            xs (ndarray): X coordinate of each organism
+            ys (ndarray): Y coordinate of each organism
+            alive (ndarray): Whether each organism is alive
+        """
+        live = np.flatnonzero(alive)
+        if live.size < 2:
+            self.rebuild([organisms[i] for i in live.tolist()])
+            return
+        cell_xs, cell_ys, keys = self._cell_keys(xs[live], ys[live])
+        members = itemgetter(*live.tolist())(organisms)
+
+        # Tuple comparison checks identity first, so this is a cheap pointer scan
+        if members == self._members:
+            moved = np.flatnonzero(keys != self._keys)
+            if moved.size <= live.size * _INCREMENTAL_MOVE_FRACTION:
+                self._move(members, moved, self._keys[moved], keys[moved])
+                self._keys = keys
+                return
+        self._members = members
+        self._keys = keys
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        ends = np.append(starts[1:], keys.size)
+        # Cells are inserted in order of their first organism, as rebuild() does
+        firsts = order[starts]
+        cell_order = np.argsort(firsts)
+        ordered = itemgetter(*order.tolist())(members)
+        cell_xs = cell_xs[firsts].tolist()
+        cell_ys = cell_ys[firsts].tolist()
+        starts = starts.tolist()
+        ends = ends.tolist()
+        cells = {}
+        for group in cell_order.tolist():
+            cells[(cell_xs[group], cell_ys[group])] = list(ordered[starts[group]:ends[group]])
+        self.cells = cells
+        self.count = int(live.size)
+
+    def _move(self, members, moved, old_keys, new_keys):
+        """Move the organisms at the given member indices from their old cells to their new ones"""
+        cells = self.cells
+        old_cells = zip(*(axis.tolist() for axis in _unpack_keys(old_keys)))
+        new_cells = zip(*(axis.tolist() for axis in _unpack_keys(new_keys)))
+        for index, old_cell, new_cell in zip(moved.tolist(), old_cells, new_cells):
+            organism = members[index]
+            bucket = cells[old_cell]
+            if len(bucket) == 1:
+                del cells[old_cell]
+            else:
+                # Remove by identity; organisms may define their own equality
+                for position, other in enumerate(bucket):
+                    if other is organism:
+                        del bucket[position]
+                        break
+            bucket = cells.get(new_cell)
+            if bucket is None:
+                cells[new_cell] = [organism]
+            else:
+                bucket.append(organism)
+
+    def neighbors(self, x, y):
+        """
+        Get the organisms in the 3x3 block of cells around a point
+
+        Organisms are not distance-checked, so callers apply their own range test.
+
+        Args:
+            x (float): World x coordinate
+            y (float): World y coordinate
+
+        Returns:
+            list: Organisms bucketed in the surrounding cells
+        """
+        cell_x, cell_y = self.cell_key(x, y)
+        cells = self.cells
+        nearby = []
+        for cx in range(cell_x - 1, cell_x + 2):
+            for cy in range(cell_y - 1, cell_y + 2):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    nearby.extend(bucket)
+        return nearby
+
+    def query(self, x, y, radius):
+        """
+        Get the living organisms within a radius of a point
+
+        Only the cells overlapping the query circle are visited; distances are
+        checked against the organisms' current positions.
+
+        Args:
+            x (float): Center x coordinate
+            y (float): Center y coordinate
+            radius (float): Radius to search within
+
+        Returns:
+            list: Organisms within the radius
+        """
+        cell_size = self.cell_size
+        min_x = int((x - radius) // cell_size)
+        max_x = int((x + radius) // cell_size)
+        min_y = int((y - radius) // cell_size)
+        max_y = int((y + radius) // cell_size)
+        radius_sq = radius * radius
+        cells = self.cells
+
+        nearby = []
+        # Small queries visit a handful of cells; very large ones visit only occupied cells
+        if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(cells):
+            buckets = (cells.get((cx, cy)) for cx in range(min_x, max_x + 1)
+                       for cy in range(min_y, max_y + 1))
+        else:
+            buckets = (bucket for (cx, cy), bucket in cells.items()
+                       if min_x <= cx <= max_x and min_y <= cy <= max_y)
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for organism in bucket:
+                if not organism.is_alive:
+                    continue
+                dx = organism.x - x
+                dy = organism.y - y
+                if dx*dx + dy*dy <= radius_sq:
+                    nearby.append(organism)
+        return nearby
+
+
+def _unpack_keys(keys):
+    """Split packed cell keys (cell_x * 2**32 + cell_y) back into cell_x and cell_y arrays"""
+    # Offsetting by 2**31 before the shift recovers cell_x when cell_y is negative
+    cell_xs = (keys + (1 << 31)) >> 32
+    return cell_xs, keys - (cell_xs << 32)
@@ -0,0 +1,314 @@
+"""
+Scan Kernels Module for Bio-Sim
+Fused threat-scoring kernels used by the immune cell target scans, and the
+distance filter for the simulation's interaction pairs.
+Numba is optional: when it is installed the kernels are JIT-compiled
+(and warmed up at import), otherwise an equivalent NumPy implementation is used.
+"""
+
+import functools
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def within_radius(dx, dy, r2):
+    """
+    Mask of offsets that lie within a radius
+
+    An axis-aligned bounding-box test rejects far offsets first, so squared
+    distances are only formed for the few that fall inside the box.
+
+    Args:
+        dx, dy (ndarray): Offsets from the center
+        r2 (float): Squared radius
+
+    Returns:
+        ndarray: Boolean mask, True where dx*dx + dy*dy <= r2
+    """
+    radius = np.sqrt(r2)
+    inside = np.flatnonzero((np.abs(dx) <= radius) & (np.abs(dy) <= radius))
+    mask = np.zeros(dx.shape[0], dtype=bool)
+    box_dx = dx[inside]
+    box_dy = dy[inside]
+    mask[inside] = box_dx*box_dx + box_dy*box_dy <= r2
+    return mask
+
+
+def minimum_image(d, size):
+    """
+    Shortest offset across the edges of a wrapped world axis
+
+    Rounding d / size to the nearest whole world picks the nearer image without
+    branching, so the same expression serves scalars and whole arrays.
+
+    Args:
+        d (float or ndarray): Offset along the axis, within (-size, size)
+        size (float): World size along the axis
+
+    Returns:
+        float or ndarray: Offset to the nearest image, within [-size/2, size/2]
+    """
+    return d - size * np.rint(d / size)
+
+
+@functools.lru_cache(maxsize=8)
+def _condition_multipliers(marked_bonus):
+    """
+    Combined score multiplier for each set of candidate conditions
+
+    Entries are indexed by a 3-bit code: 1 = antibody-marked virus,
+    2 = remembered, 4 = damaged (below 70% health).
+    """
+    bits = np.arange(8)
+    multipliers = np.where(bits & 1, marked_bonus, 1.0)
+    multipliers *= np.where(bits & 2, 2.0, 1.0)
+    multipliers *= np.where(bits & 4, 1.3, 1.0)
+    return multipliers
+
+
+def _best_threat_numpy(self_x, self_y, xs, ys, codes, alive, marked, health_ratio,
+                       mem, r2, target_table, weights, is_virus, marked_bonus=3.0):
+    """
+    Find the highest threat among candidate organisms
+
+    Candidates are range-checked on squared distances; the square root for
+    each threat score (detection radius over distance) is taken only for
+    the candidates inside the radius.
+
+    Args:
+        self_x, self_y (float): Position of the scanning cell
+        xs, ys (ndarray): Candidate positions
+        codes (ndarray): Candidate type codes
+        alive, marked (ndarray): Candidate alive / antibody-marked flags
+        health_ratio (ndarray): Candidate health as a fraction of maximum
+        mem (ndarray): Remembered-candidate flags, or an empty array if none
+        r2 (float): Squared detection radius
+        target_table (ndarray): Boolean table of targetable type codes
+        weights (ndarray): Threat multiplier per type code
+        is_virus (ndarray): Boolean table of virus type codes
+        marked_bonus (float): Threat multiplier for antibody-marked viruses
+
+    Returns:
+        tuple: (index, score) of the best candidate, or (-1, 0.0) if none qualify
+    """
+    dx = xs - self_x
+    dy = ys - self_y
+
+    # Bounding-box prefilter: squared distances are only formed for living
+    # targets inside the box around the detection circle
+    radius = np.sqrt(r2)
+    candidates = np.flatnonzero((np.abs(dx) <= radius) & (np.abs(dy) <= radius) &
+                                alive & target_table[codes])
+    box_dx = dx[candidates]
+    box_dy = dy[candidates]
+    d2 = box_dx*box_dx + box_dy*box_dy
+    in_range = d2 <= r2
+    candidates = candidates[in_range]
+    if candidates.size == 0:
+        return -1, 0.0
+    d2 = d2[in_range]
+
+    # The per-type weight and the combined multiplier for each candidate's
+    # conditions are both table lookups, so scoring has no per-candidate branching
+    candidate_codes = codes[candidates]
+    conditions = (marked[candidates] & is_virus[candidate_codes]).astype(np.intp)
+    if mem.size:
+        conditions |= mem[candidates] << 1
+    conditions |= (health_ratio[candidates] < 0.7) << 2
+    # Threat falls off with distance, not squared distance, or the type weights
+    # would no longer rank candidates the same way
+    scores = radius / np.sqrt(np.maximum(1.0, d2))
+    scores *= weights[candidate_codes]
+    scores *= _condition_multipliers(marked_bonus)[conditions]
+
+    best = np.argmax(scores)
+    return int(candidates[best]), float(scores[best])
+
+
+def _best_proximity_threat_numpy(self_x, self_y, xs, ys, codes, alive, health,
+                                 width, height, radius, threat_levels):
+    """
+    Find the highest threat among candidates, weighted by proximity (Neutrophil scoring)
+
+    Distances take the shorter path across the world edges.
+
+    Args:
+        self_x, self_y (float): Position of the scanning cell
+        xs, ys (ndarray): Candidate positions
+        codes (ndarray): Candidate type codes
+        alive (ndarray): Candidate alive flags
+        health (ndarray): Candidate health
+        width, height (float): World size
+        radius (float): Detection radius
+        threat_levels (ndarray): Base threat level per type code (0 for non-threats)
+
+    Returns:
+        int: Index of the best candidate (first one on ties), or -1 if none qualify
+    """
+    # Within the world, min(d, size - d) is the wrapped offset
+    dx = np.abs(xs - self_x)
+    dy = np.abs(ys - self_y)
+    np.minimum(dx, width - dx, out=dx)
+    np.minimum(dy, height - dy, out=dy)
+
+    threat_level = threat_levels[codes]
+    candidates = np.flatnonzero((dx <= radius) & (dy <= radius) & alive & (threat_level > 0))
+    box_dx = dx[candidates]
+    box_dy = dy[candidates]
+    distance_sq = box_dx*box_dx + box_dy*box_dy
+    in_range = distance_sq <= radius * radius
+    candidates = candidates[in_range]
+    if candidates.size == 0:
+        return -1
+
+    distance = np.sqrt(distance_sq[in_range])
+    proximity_factor = np.maximum(0, 1 - distance / radius)
+    scores = threat_level[candidates] * proximity_factor ** 1.5
+    scores *= np.where(health[candidates] < 50, 1.3, 1.0)
+    return int(candidates[np.argmax(scores)])
+
+
+def _close_pairs_numpy(xs, ys, sizes, first, second, interaction_radius):
+    """
+    Mask of candidate pairs whose organisms are within interaction reach
+
+    Args:
+        xs, ys (ndarray): Organism positions
+        sizes (ndarray): Organism sizes
+        first, second (ndarray): Indices of the two organisms in each pair
+        interaction_radius (float): Extra distance allowed between organism edges
+
+    Returns:
+        ndarray: Boolean mask, True where the pair's distance is within
+            both sizes plus the interaction radius
+    """
+    dx = xs[first] - xs[second]
+    dy = ys[first] - ys[second]
+    reach = sizes[first] + sizes[second] + interaction_radius
+    return dx*dx + dy*dy <= reach*reach
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _best_proximity_threat_numba(self_x, self_y, xs, ys, codes, alive, health,
+                                     width, height, radius, threat_levels):
+        """Compiled equivalent of _best_proximity_threat_numpy as a single fused loop"""
+        r2 = radius * radius
+        best_index = -1
+        best_score = 0.0
+        for i in range(xs.shape[0]):
+            level = threat_levels[codes[i]]
+            if not alive[i] or level <= 0:
+                continue
+            dx = abs(xs[i] - self_x)
+            dx = min(dx, width - dx)
+            if dx > radius:
+                continue
+            dy = abs(ys[i] - self_y)
+            dy = min(dy, height - dy)
+            if dy > radius:
+                continue
+            d2 = dx*dx + dy*dy
+            if d2 > r2:
+                continue
+            proximity = max(0.0, 1.0 - np.sqrt(d2) / radius)
+            score = level * proximity ** 1.5
+            if health[i] < 50:
+                score *= 1.3
+            if best_index < 0 or score > best_score:
+                best_index = i
+                best_score = score
+        return best_index
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _best_threat_numba(self_x, self_y, xs, ys, codes, alive, marked, health_ratio,
+                           mem, r2, target_table, weights, is_virus, marked_bonus=3.0):
+        """Compiled equivalent of _best_threat_numpy as a single fused loop"""
+        # Scans pass only their in-range candidates, a handful per cell, so a
+        # serial loop beats spreading the work over threads
+        has_memory = mem.shape[0] > 0
+        radius = np.sqrt(r2)
+        best_index = -1
+        best_score = 0.0
+        for i in range(xs.shape[0]):
+            code = codes[i]
+            if not alive[i] or not target_table[code]:
+                continue
+            # Bounding-box rejects come before any multiply
+            dx = xs[i] - self_x
+            if dx > radius or dx < -radius:
+                continue
+            dy = ys[i] - self_y
+            if dy > radius or dy < -radius:
+                continue
+            d2 = dx*dx + dy*dy
+            if d2 > r2:
+                continue
+            score = radius / math.sqrt(max(1.0, d2)) * weights[code]
+            if marked[i] and is_virus[code]:
+                score *= marked_bonus
+            if has_memory and mem[i]:
+                score *= 2.0
+            if health_ratio[i] < 0.7:
+                score *= 1.3
+            if best_index < 0 or score > best_score:
+                best_index = i
+                best_score = score
+        return best_index, best_score
+
+    @njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+    def _close_pairs_numba(xs, ys, sizes, first, second, interaction_radius):
+        """Compiled equivalent of _close_pairs_numpy; pairs are independent, so they are split over threads"""
+        close = np.empty(first.shape[0], dtype=np.bool_)
+        for k in prange(first.shape[0]):
+            i = first[k]
+            j = second[k]
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            reach = sizes[i] + sizes[j] + interaction_radius
+            close[k] = dx*dx + dy*dy <= reach*reach
+        return close
+
+    best_threat = _best_threat_numba
+    best_proximity_threat = _best_proximity_threat_numba
+    close_pairs = _close_pairs_numba
+else:
+    best_threat = _best_threat_numpy
+    best_proximity_threat = _best_proximity_threat_numpy
+    close_pairs = _close_pairs_numpy
+
+
+def _warm_up():
+    """
+    Run each kernel once on tiny inputs of the types the immune cell scans pass
+
+    Compiled kernels are specialized (or loaded from the on-disk cache) here rather
+    than on the first simulation frame, which would otherwise stall while JIT
+    compilation runs.
+    """
+    xs = np.zeros(4, dtype=np.float32)
+    codes = np.zeros(4, dtype=np.int8)
+    # Alive/marked columns arrive as bool views; detection radii (and so their
+    # squares) and world sizes are ints
+    flags = np.ones(4, dtype=bool)
+    table = np.zeros(256, dtype=bool)
+    best_threat(0.0, 0.0, xs, xs, codes, flags, flags, xs, np.zeros(4, dtype=bool), 1,
+                table, np.ones(256), table, 3.0)
+    best_proximity_threat(0.0, 0.0, xs, xs, codes, flags, xs, 800, 600, 1,
+                          np.zeros(256, dtype=np.int64))
+    indices = np.arange(4, dtype=np.intp)
+    close_pairs(np.zeros(4), np.zeros(4), np.ones(4), indices, indices, 10.0)
+
+
+if HAVE_NUMBA:
+    try:
+        _warm_up()
+    except Exception:
+        # A failed warm-up only means the kernels compile on first use instead
+        pass
@@ -8,6 +8,21 @@ import pygame
 from pygame import gfxdraw
 import random
 from src.organisms.organism import Organism
+from src.organisms import organism_types
+from src.organisms.organism_types import type_code_of, code_mask_for_names
+
+# Type codes each branch of Bacteria.interact applies to, matching the
+# get_type() strings those branches select: body cells, the types reporting
+# "bacteria", and the immune cells that fight back. T-Cells report the
+# Neutrophil type, so like neutrophils they fall in none of these
+_ATTACKABLE_CELL_MASK = code_mask_for_names(["BodyCell", "RedBloodCell", "EpithelialCell"])
+_COMPETING_BACTERIA_MASK = (code_mask_for_names(["EColi", "Streptococcus", "BeneficialBacteria"]) |
+                            1 << organism_types.BACTERIA)
+_IMMUNE_ATTACKER_MASK = code_mask_for_names(["Macrophage"])
+
+# Bacteria that do extra damage to body cells: the types whose get_type() reports
+# "Salmonella" or "Staphylococcus" (the others report "bacteria" or "beneficial_bacteria")
+_SEVERE_BACTERIA_CODES = (organism_types.SALMONELLA, organism_types.STAPHYLOCOCCUS)
 
 class Bacteria(Organism):
     """
@@ -44,18 +59,8 @@ class Bacteria(Organism):
     
     def _apply_dna_effects(self):
         """Apply effects of the DNA sequence to the bacteria's properties"""
-        # Count bases in DNA to determine traits
-        base_counts = {
-            'A': self.dna.count('A'),
-            'T': self.dna.count('T'),
-            'G': self.dna.count('G'),
-            'C': self.dna.count('C')
-        }
-        
-        # Normalize counts
-        total = sum(base_counts.values())
-        for base in base_counts:
-            base_counts[base] /= total
+        # Base composition of the DNA determines traits
+        base_counts = self._base_composition()
         
         # Apply effects based on DNA composition
         # More A: Better reproduction
@@ -186,24 +191,25 @@ class Bacteria(Organism):
         if not self.is_alive:
             return
             
-        # Get type of other organism
-        other_type = getattr(other_organism, 'get_type', lambda: 'unknown')()
+        # Get type of other organism (an integer code, resolved once per class)
+        other_code = type_code_of(other_organism)
+        other_bit = 1 << other_code
         
         # Bacteria can attack cells
-        if "cell" in other_type.lower() and not "white" in other_type.lower():
+        if other_bit & _ATTACKABLE_CELL_MASK:
             # Harmful bacteria attack body cells
             if self.get_type() != "BeneficialBacteria":
-                # Calculate distance
+                # Calculate squared distance
                 dx = self.x - other_organism.x
                 dy = self.y - other_organism.y
-                distance = np.sqrt(dx**2 + dy**2)
+                reach = self.size + other_organism.size + 5
                 
                 # If close enough, damage cell
-                if distance <= self.size + other_organism.size + 5:
+                if dx*dx + dy*dy <= reach*reach:
                     damage = 0.8  # Increased from lower value
                     
                     # More dangerous bacteria cause more damage
-                    if self.get_type() == "Salmonella" or self.get_type() == "Staphylococcus":
+                    if self.type_code in _SEVERE_BACTERIA_CODES:
                         damage = 1.5  # Increased from lower value
                     
                     # Apply damage if target can take damage
@@ -219,7 +225,7 @@ class Bacteria(Organism):
             return
         
         # Special interaction with red blood cells - some bacteria attack RBCs
-        if other_type == "RedBloodCell" and hasattr(other_organism, 'take_damage'):
+        if other_code == organism_types.RED_BLOOD_CELL and hasattr(other_organism, 'take_damage'):
             # Only some bacteria attack red blood cells
             bacteria_type = self.get_type()
             if bacteria_type in ["EColi", "Streptococcus"]:  # These bacteria can attack RBCs
@@ -234,7 +240,7 @@ class Bacteria(Organism):
                 self.energy += 3
                 
         # Interaction with other bacteria
-        if "bacteria" in other_type.lower():
+        if other_bit & _COMPETING_BACTERIA_MASK:
             # Competition for resources
             # The stronger bacteria (more energy/health) takes resources from the weaker
             my_strength = self.energy * (self.health / 100)
@@ -247,12 +253,12 @@ class Bacteria(Organism):
                     other_organism.energy -= 2
             
         # Can be attacked by immune cells
-        if "whiteb" in other_type.lower() or "tcell" in other_type.lower() or "macro" in other_type.lower():
+        if other_bit & _IMMUNE_ATTACKER_MASK:
             # Check if this type of bacteria is targeted by this immune cell
             targeted = True  # Default assumption
             
             # T-Cells target specific bacteria more effectively
-            if "tcell" in other_type.lower() and hasattr(other_organism, 'targets'):
+            if other_code == organism_types.TCELL and hasattr(other_organism, 'targets'):
                 if self.get_type() not in getattr(other_organism, 'targets', [self.get_type()]):
                     targeted = False
             
@@ -261,7 +267,7 @@ class Bacteria(Organism):
                 attack_chance = 0.1  # Base chance
                 
                 # Macrophages are better at engulfing bacteria
-                if "macro" in other_type.lower():
+                if other_code == organism_types.MACROPHAGE:
                     attack_chance = 0.25
                 
                 # Check if attack succeeds
@@ -331,12 +337,12 @@ class EColi(Bacteria):
         import pygame
         
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Rod shape - elongated rectangle rather than circle
@@ -433,12 +439,12 @@ class Streptococcus(Bacteria):
         import math
         
         # Calculate screen position for the lead cell
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Get direction vector based on movement
@@ -460,8 +466,8 @@ class Streptococcus(Bacteria):
             cell_y = screen_y - int(math.sin(angle) * radius * 1.8 * i)
             
             # Skip if this cell is off screen
-            if (cell_x < -20 or cell_x > screen.get_width() + 20 or
-                cell_y < -20 or cell_y > screen.get_height() + 20):
+            if (cell_x < -20 or cell_x > screen_w + 20 or
+                cell_y < -20 or cell_y > screen_h + 20):
                 continue
             
             # Draw cell
@@ -521,12 +527,12 @@ class Staphylococcus(Bacteria):
             return
             
         # Calculate screen position for the center
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
             
         # Scale size with zoom
@@ -592,8 +598,9 @@ class Salmonella(Bacteria):
         
         # Additional distinctive flagella pattern
         if self.is_alive:
-            screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-            screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+            screen_w = screen.get_width()
+            screen_h = screen.get_height()
+            screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
             display_size = max(2, int(self.size * zoom))
             
             # Calculate direction from velocity
@@ -710,12 +717,12 @@ class BeneficialBacteria(Bacteria):
         import math
         
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Size and color
@@ -7,6 +7,7 @@ import pygame
 import math
 import numpy as np
 from src.organisms.organism import Organism
+from src.organisms.organism_types import PLATELET, type_code_of
 
 class BodyCell(Organism):
     """
@@ -284,8 +285,7 @@ class RedBloodCell(BodyCell):
         screen_width, screen_height = screen.get_size()
         
         # Calculate screen position with proper centering
-        screen_x = int((self.x - camera_x) * zoom + screen_width / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen_height / 2)
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_width * 0.5, screen_height * 0.5)
         
         # Skip rendering if off screen
         if (screen_x + self.size * zoom < 0 or screen_x - self.size * zoom > screen_width or
@@ -401,8 +401,7 @@ class EpithelialCell(BodyCell):
         screen_width, screen_height = screen.get_size()
         
         # Calculate screen position with proper centering
-        screen_x = int((self.x - camera_x) * zoom + screen_width / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen_height / 2)
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_width * 0.5, screen_height * 0.5)
         
         # Skip rendering if off screen
         if (screen_x + self.size * zoom < 0 or screen_x - self.size * zoom > screen_width or
@@ -547,19 +546,21 @@ class Platelet(BodyCell):
             
         self.nearby_platelets = []
         
+        # Neighbour blocks hold only organisms alive at the last index rebuild, so
+        # the only entry to skip is this platelet itself, by identity
         for org in organisms:
-            if org.id == self.id:
+            if org is self:
                 continue
                 
             # Only care about other platelets
-            if org.get_type() == "Platelet":
-                # Calculate distance
+            if type_code_of(org) == PLATELET:
+                # Calculate squared distance
                 dx = self.x - org.x
                 dy = self.y - org.y
-                distance = math.sqrt(dx*dx + dy*dy)
+                reach = self.size * 4
                 
                 # If close enough and both activated, they can aggregate
-                if distance < self.size * 4 and org.activated:
+                if dx*dx + dy*dy < reach*reach and org.activated:
                     self.nearby_platelets.append(org)
                     
                     # Increment aggregation count if not already counting this platelet
@@ -586,8 +587,7 @@ class Platelet(BodyCell):
         screen_width, screen_height = screen.get_size()
         
         # Calculate screen position with proper centering
-        screen_x = int((self.x - camera_x) * zoom + screen_width / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen_height / 2)
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_width * 0.5, screen_height * 0.5)
         
         # Skip rendering if off screen
         if (screen_x + self.size * zoom < 0 or screen_x - self.size * zoom > screen_width or
@@ -632,8 +632,7 @@ class Platelet(BodyCell):
         if self.activated and self.aggregation_count > 0:
             for platelet in self.nearby_platelets:
                 # Calculate other platelet's screen position with proper centering
-                other_x = int((platelet.x - camera_x) * zoom + screen_width / 2)
-                other_y = int((platelet.y - camera_y) * zoom + screen_height / 2)
+                other_x, other_y = platelet.screen_position(camera_x, camera_y, zoom, screen_width * 0.5, screen_height * 0.5)
                 pygame.draw.line(screen, (210, 170, 210), (screen_x, screen_y), (other_x, other_y), 1)
     
     def get_type(self):
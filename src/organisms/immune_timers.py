@@ -0,0 +1,90 @@
+"""
+Immune Timers Module for Bio-Sim
+Stores per-cell countdown timers in NumPy arrays so every immune cell's
+cooldowns can be ticked with one vectorized operation per simulation step
+"""
+
+import weakref
+import numpy as np
+
+
+class ImmuneTimers:
+    """
+    Table of integer countdown timers indexed by cell slot.
+    Each cell owns one slot for its lifetime; tick() decrements every timer
+    of every cell at once and clamps at zero.
+    
+    All fields are rows of one 2-D block, so a tick is two in-place operations
+    over a single contiguous buffer; cooldowns maps each field name to its row.
+    """
+
+    FIELDS = ("attack_cooldown", "antibody_cooldown")
+
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty timer table
+
+        Args:
+            capacity (int): Number of cell slots to preallocate
+        """
+        self.capacity = capacity
+        self._set_block(np.zeros((len(self.FIELDS), capacity), dtype=np.int32))
+        self._in_use = np.zeros(capacity, dtype=bool)
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def _set_block(self, block):
+        """Install a timer block and point each field at its row"""
+        self._block = block
+        self.cooldowns = {name: block[row] for row, name in enumerate(self.FIELDS)}
+
+    def _grow(self):
+        """Double the number of slots, keeping existing timers"""
+        old_capacity = self.capacity
+        self.capacity = old_capacity * 2
+        grown = np.zeros((len(self.FIELDS), self.capacity), dtype=self._block.dtype)
+        grown[:, :old_capacity] = self._block
+        self._set_block(grown)
+        in_use = np.zeros(self.capacity, dtype=bool)
+        in_use[:old_capacity] = self._in_use
+        self._in_use = in_use
+        self._free.extend(range(self.capacity - 1, old_capacity - 1, -1))
+
+    def allocate(self, owner):
+        """
+        Reserve a slot for a cell; the slot is released when the cell is garbage collected
+
+        Args:
+            owner: The cell that will own the slot
+
+        Returns:
+            int: The slot index
+        """
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self._in_use[slot] = True
+        weakref.finalize(owner, self.release, slot)
+        return slot
+
+    def release(self, slot):
+        """
+        Return a slot to the free list and clear its timers
+
+        Args:
+            slot (int): The slot index
+        """
+        if not self._in_use[slot]:
+            return
+        self._in_use[slot] = False
+        self._block[:, slot] = 0
+        self._free.append(slot)
+
+    def tick(self):
+        """Count every timer down by one, stopping at zero"""
+        block = self._block
+        block -= 1
+        np.maximum(block, 0, out=block)
+
+
+# Shared table used by all immune cells in the process
+IMMUNE_TIMERS = ImmuneTimers()
@@ -0,0 +1,170 @@
+"""
+Memory Table Module for Bio-Sim
+Open-addressed hash table of remembered organism keys with expiry ages, kept
+in flat int64 buffers so immune cell scans can test every candidate at once
+"""
+
+from array import array
+import numpy as np
+
+# Fibonacci hashing multiplier (2**64 / golden ratio)
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# Key value marking an unused slot; keys are id() values, which are never negative
+_EMPTY = -1
+
+# Batches up to this size are probed key by key; array setup costs more than it saves
+_SCALAR_PROBE_LIMIT = 8
+
+
+class MemoryTable:
+    """
+    Set of organism keys, each with the age at which it is forgotten.
+    Slots are probed linearly from a multiplicative hash of the key; the table
+    doubles once it is half full. Expiry is checked against the earliest
+    expiry age, so cells with nothing due pay a single comparison per tick.
+    
+    Keys and expiry ages live in preallocated array('q') buffers: writes are
+    plain stores into an existing slot, and vectorized queries wrap the same
+    memory as NumPy arrays without copying.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty table
+
+        Args:
+            capacity (int): Initial number of slots (a power of two)
+        """
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Allocate empty slot arrays with the given power-of-two capacity"""
+        self.capacity = capacity
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self.keys = array('q', [_EMPTY]) * capacity
+        self.expiry = array('q', [0]) * capacity
+        self.count = 0
+        self.max_probe = 0
+        self.next_expiry = None
+
+    def _slot(self, key):
+        """Get the home slot for a key"""
+        return ((key * _GOLDEN) & _MASK64) >> self._shift
+
+    def _slots(self, keys):
+        """Get the home slots for an int64 array of keys"""
+        return ((keys.astype(np.uint64) * np.uint64(_GOLDEN)) >> np.uint64(self._shift)).astype(np.intp)
+
+    def _find(self, key):
+        """Get the slot holding a key, or the empty slot where it would go"""
+        keys = self.keys
+        mask = self.capacity - 1
+        slot = self._slot(key)
+        probe = 0
+        while keys[slot] != _EMPTY and keys[slot] != key:
+            slot = (slot + 1) & mask
+            probe += 1
+        return slot, probe
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        slot, _ = self._find(key)
+        return self.keys[slot] == key
+
+    def __iter__(self):
+        return (key for key in self.keys if key != _EMPTY)
+
+    def remember(self, key, expires):
+        """
+        Add a key, or push back its expiry if it is already remembered
+
+        Args:
+            key (int): Organism key (its id())
+            expires (int): Age at which the key is forgotten
+        """
+        if (self.count + 1) * 2 > self.capacity:
+            self._rehash(self.capacity * 2)
+        slot, probe = self._find(key)
+        keys = self.keys
+        if keys[slot] == _EMPTY:
+            keys[slot] = key
+            self.count += 1
+            self.max_probe = max(self.max_probe, probe)
+        self.expiry[slot] = expires
+        if self.next_expiry is None or expires < self.next_expiry:
+            self.next_expiry = expires
+
+    def contains_many(self, keys):
+        """
+        Test many keys for membership at once
+
+        Args:
+            keys (list or ndarray): Organism keys (int64 if an array)
+
+        Returns:
+            ndarray: Boolean array, True where the key is remembered
+        """
+        if len(keys) <= _SCALAR_PROBE_LIMIT:
+            if isinstance(keys, np.ndarray):
+                keys = keys.tolist()
+            return np.array([key in self for key in keys], dtype=bool)
+        keys = np.asarray(keys, dtype=np.int64)
+        slots = self._slots(keys)
+        table = np.frombuffer(self.keys, dtype=np.int64)
+        mask = self.capacity - 1
+        found = np.zeros(keys.shape[0], dtype=bool)
+        # No key sits further than max_probe slots from home, so that bounds the probe loop
+        for probe in range(self.max_probe + 1):
+            found |= table[(slots + probe) & mask] == keys
+        return found
+
+    def expire(self, age):
+        """
+        Forget every key whose expiry age has been reached
+
+        Args:
+            age (int): Current age of the remembering cell
+
+        Returns:
+            int: Number of keys forgotten
+        """
+        if self.next_expiry is None or self.next_expiry > age:
+            return 0
+        live = np.frombuffer(self.keys, dtype=np.int64) != _EMPTY
+        expired = live & (np.frombuffer(self.expiry, dtype=np.int64) <= age)
+        forgotten = int(np.count_nonzero(expired))
+        # Removing keys would break probe chains, so survivors are reinserted
+        self._rehash(self.capacity, live & ~expired)
+        return forgotten
+
+    def clear(self):
+        """Forget every key"""
+        self._allocate(self.capacity)
+
+    def _rehash(self, capacity, keep=None):
+        """Rebuild the table at the given capacity, keeping the selected slots"""
+        keys = np.frombuffer(self.keys, dtype=np.int64)
+        if keep is None:
+            keep = keys != _EMPTY
+        expiry = np.frombuffer(self.expiry, dtype=np.int64)[keep]
+        keys = keys[keep]
+        self._allocate(capacity)
+        if keys.size == 0:
+            return
+        
+        # The first key for each home slot is stored there with one scatter; only
+        # keys colliding with it are probed in Python
+        slots = self._slots(keys)
+        _, first = np.unique(slots, return_index=True)
+        np.frombuffer(self.keys, dtype=np.int64)[slots[first]] = keys[first]
+        np.frombuffer(self.expiry, dtype=np.int64)[slots[first]] = expiry[first]
+        self.count = first.size
+        self.next_expiry = int(expiry.min())
+        colliding = np.ones(keys.size, dtype=bool)
+        colliding[first] = False
+        for key, expires in zip(keys[colliding].tolist(), expiry[colliding].tolist()):
+            self.remember(key, expires)
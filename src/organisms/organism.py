@@ -5,7 +5,33 @@ Defines the core Organism class that all microorganisms inherit from
 
 import numpy as np
 from abc import ABC, abstractmethod
+from collections import Counter
 import uuid
+from src.organisms.organism_types import class_type_info
+
+# Standard normal draws handed out from a pre-generated batch, refilled when drained;
+# movement jitter takes a couple per organism per tick, far cheaper than scalar
+# np.random.normal() calls
+_NOISE_POOL_SIZE = 4096
+_NOISE_POOL = iter(())
+
+
+def noise(sigma):
+    """
+    Normal draw with mean 0 from the shared batch
+    
+    Args:
+        sigma (float): Standard deviation
+        
+    Returns:
+        float: The scaled draw
+    """
+    global _NOISE_POOL
+    try:
+        return next(_NOISE_POOL) * sigma
+    except StopIteration:
+        _NOISE_POOL = iter(np.random.standard_normal(_NOISE_POOL_SIZE).tolist())
+        return next(_NOISE_POOL) * sigma
 
 class Organism(ABC):
     """
@@ -13,6 +39,16 @@ class Organism(ABC):
     All specific organism types should inherit from this class.
     """
     
+    # Core state lives in slots for fast attribute access. Every instance still
+    # has a __dict__ (treatments add boosts, tests replace methods on instances),
+    # so this does not shrink organisms; the dict just stays empty in normal use
+    __slots__ = ("__dict__", "__weakref__", "id", "x", "y", "size", "color", "base_speed",
+                 "velocity", "age", "energy", "health", "is_alive", "type_code", "type_tags",
+                 "dna", "nn_weights", "_soa_slot", "_screen_frame", "_screen_pos")
+    
+    # Number of the frame the renderer is currently drawing; 0 outside a render pass
+    render_frame = 0
+    
     def __init__(self, x, y, size, color, speed, dna_length=100):
         """
         Initialize a new organism
@@ -40,12 +76,49 @@ class Organism(ABC):
         self.health = 100.0
         self.is_alive = True
         
+        # Resolve the organism's type once so hot paths can classify it with integer tests
+        self.type_code, self.type_tags = class_type_info(self.__class__)
+        
+        # Screen position memoized for one render frame (see screen_position)
+        self._screen_frame = 0
+        self._screen_pos = None
+        
         # Generate DNA sequence
         self.dna = self._generate_dna(dna_length)
         
         # Initialize neural network weights
         self.nn_weights = self._initialize_neural_network()
         
+    @classmethod
+    def begin_render_frame(cls):
+        """Start a new render frame, invalidating every memoized screen position"""
+        Organism.render_frame += 1
+        
+    def screen_position(self, camera_x, camera_y, zoom, half_w, half_h):
+        """
+        Get the organism's position on screen
+        
+        Within a render frame the projection is computed once and shared by every
+        caller, e.g. the organism's own render and immune cells drawing lines to it.
+        
+        Args:
+            camera_x (float): Camera x position
+            camera_y (float): Camera y position
+            zoom (float): Zoom level
+            half_w, half_h (float): Half the screen width and height
+            
+        Returns:
+            tuple: (screen_x, screen_y)
+        """
+        frame = Organism.render_frame
+        if frame and self._screen_frame == frame:
+            return self._screen_pos
+        position = (int((self.x - camera_x) * zoom + half_w), int((self.y - camera_y) * zoom + half_h))
+        if frame:
+            self._screen_frame = frame
+            self._screen_pos = position
+        return position
+    
     def _generate_dna(self, length):
         """
         Generate a random DNA sequence
@@ -57,7 +130,25 @@ class Organism(ABC):
             list: DNA sequence as a list of bases (A, T, G, C)
         """
         bases = ['A', 'T', 'G', 'C']
-        return [bases[np.random.randint(0, 4)] for _ in range(length)]
+        return [bases[i] for i in np.random.randint(0, 4, length).tolist()]
+    
+    def _base_composition(self):
+        """
+        Get the fraction of each base in the DNA sequence
+        
+        The sequence is counted in a single pass rather than once per base.
+        
+        Returns:
+            dict: Fraction of the A, T, G and C bases that each base makes up
+        """
+        counts = Counter(self.dna)
+        base_counts = {base: counts[base] for base in ('A', 'T', 'G', 'C')}
+        
+        # Normalize counts
+        total = sum(base_counts.values())
+        for base in base_counts:
+            base_counts[base] /= total
+        return base_counts
     
     def _initialize_neural_network(self):
         """
@@ -98,6 +189,31 @@ class Organism(ABC):
         
         return a2
     
+    @staticmethod
+    def neural_network_decisions(organisms, inputs):
+        """
+        Make decisions for many organisms with a single forward pass
+        
+        Each organism keeps its own weights; these are stacked so each layer is
+        one batched product instead of a small product per organism.
+        
+        Args:
+            organisms (list): Organisms making a decision
+            inputs (list): Input values for each organism
+            
+        Returns:
+            ndarray: One row of output values per organism (see neural_network_decision)
+        """
+        weights = [organism.nn_weights for organism in organisms]
+        x = np.asarray(inputs, dtype=float)
+        w1 = np.stack([w['w1'] for w in weights])
+        b1 = np.stack([w['b1'] for w in weights])
+        w2 = np.stack([w['w2'] for w in weights])
+        b2 = np.stack([w['b2'] for w in weights])
+        
+        a1 = np.tanh(np.einsum('ni,nih->nh', x, w1) + b1)  # Hidden layer activation
+        return np.tanh(np.einsum('nh,nho->no', a1, w2) + b2)  # Output layer activation
+    
     def update(self, environment):
         """
         Update the organism's state based on its environment and internal state
@@ -169,27 +285,17 @@ class Organism(ABC):
         dy = decision[1] * self.base_speed
         
         # Add some randomness
-        dx += np.random.normal(0, 0.1)
-        dy += np.random.normal(0, 0.1)
+        dx += noise(0.1)
+        dy += noise(0.1)
         
         # Apply movement
         self.velocity = [dx, dy]
         self.x += self.velocity[0]
         self.y += self.velocity[1]
         
-        # Boundary wrapping (toroidal world)
-        world_width = environment.width
-        world_height = environment.height
-        
-        if self.x < 0:
-            self.x += world_width
-        elif self.x >= world_width:
-            self.x -= world_width
-            
-        if self.y < 0:
-            self.y += world_height
-        elif self.y >= world_height:
-            self.y -= world_height
+        # Boundary wrapping (toroidal world); the modulo also covers moves longer than the world
+        self.x %= environment.width
+        self.y %= environment.height
         
         # Scale movement cost by size - smaller organisms like viruses use less energy
         size_factor = min(1.0, self.size / 10.0)  # Size factor maxes out at 1.0 for organisms size 10+
@@ -269,10 +375,10 @@ class Organism(ABC):
             return
             
         # Calculate screen position - common for all organisms
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Skip if off screen (optimization)
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return 
\ No newline at end of file
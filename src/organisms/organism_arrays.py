@@ -0,0 +1,141 @@
+"""
+Organism Arrays Module for Bio-Sim
+Keeps a structure-of-arrays snapshot of organism state so immune cells can
+filter and score candidates with vectorized NumPy operations
+"""
+
+import numpy as np
+from src.organisms.organism_types import type_code_of
+
+# Columns produced per organism by _organism_row
+_ROW_WIDTH = 7
+_ROW_DTYPE = np.dtype((np.float64, _ROW_WIDTH))
+
+
+def _organism_row(organism):
+    """Flatten the state the target scans need into a single tuple"""
+    max_health = getattr(organism, 'max_health', None)
+    health_ratio = organism.health / max_health if max_health else 1.0
+    return (
+        organism.x,
+        organism.y,
+        type_code_of(organism),
+        organism.is_alive,
+        getattr(organism, 'antibody_marked', False),
+        health_ratio,
+        organism.health
+    )
+
+
+class OrganismArrays:
+    """
+    Structure-of-arrays view of the organism list.
+    The environment refreshes it once per tick; arrays are reused across ticks
+    and only grow when the population outgrows their capacity.
+    """
+
+    def __init__(self, capacity=256):
+        """
+        Initialize empty arrays
+
+        Args:
+            capacity (int): Number of organism slots to preallocate
+        """
+        self.count = 0
+        self._rows = np.empty((0, _ROW_WIDTH))
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Allocate arrays with room for the given number of organisms"""
+        self.capacity = capacity
+        self.xs = np.zeros(capacity, dtype=np.float32)
+        self.ys = np.zeros(capacity, dtype=np.float32)
+        self.codes = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=np.uint8)
+        self.marked = np.zeros(capacity, dtype=np.uint8)
+        self.health_ratio = np.ones(capacity, dtype=np.float32)
+        self.health = np.zeros(capacity, dtype=np.float32)
+
+    def update(self, organisms):
+        """
+        Refresh the arrays from the organism list and record each organism's slot
+
+        Args:
+            organisms (list): All organisms in the simulation
+        """
+        count = len(organisms)
+        if count > self.capacity:
+            self._allocate(max(count, self.capacity * 2))
+
+        rows = np.fromiter(map(_organism_row, organisms), dtype=_ROW_DTYPE, count=count)
+        for slot, organism in enumerate(organisms):
+            organism._soa_slot = slot
+
+        self._rows = rows
+        self.count = count
+        self.xs[:count] = rows[:, 0]
+        self.ys[:count] = rows[:, 1]
+        self.codes[:count] = rows[:, 2]
+        self.alive[:count] = rows[:, 3]
+        self.marked[:count] = rows[:, 4]
+        self.health_ratio[:count] = rows[:, 5]
+        self.health[:count] = rows[:, 6]
+
+    def positions(self):
+        """
+        Get full-precision positions and liveness from the last update
+
+        Returns:
+            tuple: (xs, ys, alive) float64 arrays aligned with the organism list
+        """
+        rows = self._rows
+        return rows[:, 0], rows[:, 1], rows[:, 3]
+
+    def take(self, organisms):
+        """
+        Get the array columns for a subset of organisms
+
+        Organisms that were not part of the last update (e.g. born since) cause
+        the columns to be built directly from the objects instead.
+
+        Args:
+            organisms (list): Organisms to look up
+
+        Returns:
+            tuple: (xs, ys, codes, alive, marked, health_ratio, health) arrays aligned with organisms
+        """
+        slots = np.fromiter((getattr(o, '_soa_slot', -1) for o in organisms),
+                            dtype=np.intp, count=len(organisms))
+        if slots.size == 0 or slots.min() < 0 or slots.max() >= self.count:
+            return self.gather(organisms)
+        return (
+            self.xs[slots],
+            self.ys[slots],
+            self.codes[slots],
+            self.alive[slots].view(bool),
+            self.marked[slots].view(bool),
+            self.health_ratio[slots],
+            self.health[slots]
+        )
+
+    @staticmethod
+    def gather(organisms):
+        """
+        Build the array columns directly from organism objects
+
+        Args:
+            organisms (list): Organisms to read
+
+        Returns:
+            tuple: (xs, ys, codes, alive, marked, health_ratio, health) arrays aligned with organisms
+        """
+        rows = np.fromiter(map(_organism_row, organisms), dtype=_ROW_DTYPE, count=len(organisms))
+        return (
+            rows[:, 0].astype(np.float32),
+            rows[:, 1].astype(np.float32),
+            rows[:, 2].astype(np.int8),
+            rows[:, 3] != 0,
+            rows[:, 4] != 0,
+            rows[:, 5].astype(np.float32),
+            rows[:, 6].astype(np.float32)
+        )
@@ -0,0 +1,369 @@
+"""
+Organism Types Module for Bio-Sim
+Maps organism classes to small integer type codes and bitmask type tags so
+hot paths can classify organisms with integer tests instead of string matching
+"""
+
+import numpy as np
+
+# Integer type codes (fit in an int8)
+UNKNOWN = 0
+BACTERIA = 1
+ECOLI = 2
+STREPTOCOCCUS = 3
+STAPHYLOCOCCUS = 4
+SALMONELLA = 5
+BENEFICIAL_BACTERIA = 6
+VIRUS = 7
+INFLUENZA = 8
+RHINOVIRUS = 9
+CORONAVIRUS = 10
+ADENOVIRUS = 11
+NEUTROPHIL = 12
+MACROPHAGE = 13
+TCELL = 14
+BODY_CELL = 15
+RED_BLOOD_CELL = 16
+EPITHELIAL_CELL = 17
+PLATELET = 18
+
+NUM_TYPE_CODES = 19
+
+# Type code for each organism class, keyed by class name
+TYPE_CODES = {
+    "Bacteria": BACTERIA,
+    "EColi": ECOLI,
+    "Streptococcus": STREPTOCOCCUS,
+    "Staphylococcus": STAPHYLOCOCCUS,
+    "Salmonella": SALMONELLA,
+    "BeneficialBacteria": BENEFICIAL_BACTERIA,
+    "Virus": VIRUS,
+    "Influenza": INFLUENZA,
+    "Rhinovirus": RHINOVIRUS,
+    "Coronavirus": CORONAVIRUS,
+    "Adenovirus": ADENOVIRUS,
+    "Neutrophil": NEUTROPHIL,
+    "Macrophage": MACROPHAGE,
+    "TCell": TCELL,
+    "BodyCell": BODY_CELL,
+    "RedBloodCell": RED_BLOOD_CELL,
+    "EpithelialCell": EPITHELIAL_CELL,
+    "Platelet": PLATELET
+}
+
+# Type tag bits (an organism's type_tags is the OR of the bits that apply)
+TAG_VIRUS = 1 << 0
+TAG_BACTERIA = 1 << 1
+TAG_HARMFUL_BACTERIA = 1 << 2
+TAG_BENEFICIAL = 1 << 3
+TAG_DAMAGED = 1 << 4
+TAG_DEAD = 1 << 5
+TAG_IMMUNE = 1 << 6
+TAG_BODY_CELL = 1 << 7
+
+# Common tag combinations
+PATHOGEN_MASK = TAG_VIRUS | TAG_HARMFUL_BACTERIA
+TARGET_MASK = TAG_VIRUS | TAG_HARMFUL_BACTERIA | TAG_DAMAGED | TAG_DEAD
+EXEMPT_MASK = TAG_IMMUNE | TAG_BODY_CELL | TAG_BENEFICIAL
+
+VIRUS_CODES = (VIRUS, INFLUENZA, RHINOVIRUS, CORONAVIRUS, ADENOVIRUS)
+HARMFUL_BACTERIA_CODES = (BACTERIA, ECOLI, STREPTOCOCCUS, STAPHYLOCOCCUS, SALMONELLA)
+
+# Type tags for each type code, indexed by code
+TAGS_BY_CODE = [0] * NUM_TYPE_CODES
+for _code in VIRUS_CODES:
+    TAGS_BY_CODE[_code] = TAG_VIRUS
+for _code in HARMFUL_BACTERIA_CODES:
+    TAGS_BY_CODE[_code] = TAG_BACTERIA | TAG_HARMFUL_BACTERIA
+TAGS_BY_CODE[BENEFICIAL_BACTERIA] = TAG_BACTERIA | TAG_BENEFICIAL
+for _code in (NEUTROPHIL, MACROPHAGE, TCELL):
+    TAGS_BY_CODE[_code] = TAG_IMMUNE
+for _code in (BODY_CELL, RED_BLOOD_CELL, EPITHELIAL_CELL, PLATELET):
+    TAGS_BY_CODE[_code] = TAG_BODY_CELL
+del _code
+
+# Type tags for each organism class, keyed by class name
+TYPE_TAGS = {name: TAGS_BY_CODE[code] for name, code in TYPE_CODES.items()}
+
+# Lowercased type/name labels -> type code, covering class names, display names
+# and the legacy spellings used by get_type() implementations
+_LABEL_CODES = {name.lower(): code for name, code in TYPE_CODES.items()}
+_LABEL_CODES.update({
+    "e. coli": ECOLI,
+    "beneficial bacteria": BENEFICIAL_BACTERIA,
+    "beneficial_bacteria": BENEFICIAL_BACTERIA,
+    "white_blood_cell": NEUTROPHIL,
+    "whitebloodcell": NEUTROPHIL,
+    "t_cell": TCELL,
+    "t-cell": TCELL,
+    "body_cell": BODY_CELL,
+    "blood_cell": RED_BLOOD_CELL,
+    "red_blood_cell": RED_BLOOD_CELL,
+    "red blood cell": RED_BLOOD_CELL,
+    "epithelial_cell": EPITHELIAL_CELL,
+    "epithelial cell": EPITHELIAL_CELL
+})
+
+# Boolean lookup table: IS_VIRUS[code] is True for every virus type code
+IS_VIRUS = np.zeros(NUM_TYPE_CODES, dtype=bool)
+IS_VIRUS[list(VIRUS_CODES)] = True
+
+# Capability bits: optional methods an organism class provides
+CAN_INTERACT = 1 << 0
+CAN_SCAN_TARGETS = 1 << 1
+CAN_SCAN_PLATELETS = 1 << 2
+CAN_ACTIVATE = 1 << 3
+
+_CAPABILITY_METHODS = (
+    (CAN_INTERACT, "interact"),
+    (CAN_SCAN_TARGETS, "scan_for_targets"),
+    (CAN_SCAN_PLATELETS, "scan_for_platelets"),
+    (CAN_ACTIVATE, "activate")
+)
+
+# Class -> type code cache, filled lazily by type_code_of
+_class_codes = {}
+
+# Class -> capability bits cache, filled lazily by capabilities_of
+_class_capabilities = {}
+
+# Class -> display label cache, filled lazily by type_label
+_class_labels = {}
+
+
+def _code_for_class(cls):
+    """Resolve a class to its type code by walking its MRO for a known class name"""
+    for klass in cls.__mro__:
+        code = TYPE_CODES.get(klass.__name__)
+        if code is not None:
+            return code
+    return UNKNOWN
+
+
+def _type_labels(organism):
+    """Get the lowercased get_name()/get_type() strings an organism reports"""
+    labels = []
+    for getter in ("get_name", "get_type"):
+        method = getattr(organism, getter, None)
+        if callable(method):
+            label = method()
+            if isinstance(label, str):
+                labels.append(label.lower())
+    return labels
+
+
+def _infer_code(labels):
+    """Infer a type code from lowercased type/name labels"""
+    for label in labels:
+        code = _LABEL_CODES.get(label)
+        if code is not None:
+            return code
+    return UNKNOWN
+
+
+def class_type_info(cls):
+    """
+    Get the type code and type tags for an organism class
+
+    Args:
+        cls (type): The organism class
+
+    Returns:
+        tuple: (type_code, type_tags); (UNKNOWN, 0) for classes that are not
+        known organism classes
+    """
+    code = _class_codes.get(cls)
+    if code is None:
+        code = _code_for_class(cls)
+        _class_codes[cls] = code
+    return code, TAGS_BY_CODE[code]
+
+
+def type_code_of(organism):
+    """
+    Get the integer type code for an organism
+
+    Codes are resolved once per class. Objects whose class is not a known
+    organism class (e.g. test doubles) fall back to their type/name strings.
+
+    Args:
+        organism: The organism to classify
+
+    Returns:
+        int: The organism's type code
+    """
+    code, _ = class_type_info(organism.__class__)
+    if code == UNKNOWN:
+        return _infer_code(_type_labels(organism))
+    return code
+
+
+def organism_tags(organism):
+    """
+    Get the type tags for an organism
+
+    Organisms carry their tags from birth; objects that do not (e.g. test
+    doubles) have them inferred from their type/name strings.
+
+    Args:
+        organism: The organism to classify
+
+    Returns:
+        int: Bitmask of TAG_* values
+    """
+    tags = getattr(organism, 'type_tags', 0)
+    if type(tags) is int and tags:
+        return tags
+    return _infer_tags(_type_labels(organism))
+
+
+def type_info_of(organism):
+    """
+    Get an organism's type code and type tags together
+    
+    Interaction code needs both; this resolves the class once and, for objects
+    that are not known organism classes, reads their type/name strings once.
+    
+    Args:
+        organism: The organism to classify
+        
+    Returns:
+        tuple: (type_code, type_tags)
+    """
+    code, _ = class_type_info(organism.__class__)
+    if code == UNKNOWN:
+        labels = _type_labels(organism)
+        return _infer_code(labels), _infer_tags(labels)
+    return code, organism_tags(organism)
+
+
+def _infer_tags(labels):
+    """Infer type tags from lowercased type/name labels"""
+    tags = TAGS_BY_CODE[_infer_code(labels)]
+    for label in labels:
+        if "virus" in label:
+            tags |= TAG_VIRUS
+        if "damaged" in label:
+            tags |= TAG_DAMAGED
+        if "dead" in label:
+            tags |= TAG_DEAD
+    return tags
+
+
+def capabilities_of(organism):
+    """
+    Get the capability bits for an organism
+    
+    Methods are looked up once per class, so hot loops test a bit instead of
+    calling hasattr (an MRO walk) for every organism every tick.
+    
+    Args:
+        organism: The organism to inspect
+        
+    Returns:
+        int: Bitmask of CAN_* values
+    """
+    cls = organism.__class__
+    caps = _class_capabilities.get(cls)
+    if caps is None:
+        caps = 0
+        for bit, method in _CAPABILITY_METHODS:
+            if callable(getattr(cls, method, None)):
+                caps |= bit
+        _class_capabilities[cls] = caps
+    return caps
+
+
+def type_label(organism):
+    """
+    Get the label immune cells show for the organism they are targeting
+    
+    This is get_type() capitalized, else get_name(), else the type attribute.
+    Known organism classes report a fixed type, so the label is resolved once
+    per class; other objects (e.g. test doubles) are asked every time.
+    
+    Args:
+        organism: The organism to label
+        
+    Returns:
+        str: The display label
+    """
+    cls = organism.__class__
+    label = _class_labels.get(cls)
+    if label is None:
+        label = _resolve_label(organism)
+        if class_type_info(cls)[0] != UNKNOWN:
+            _class_labels[cls] = label
+    return label
+
+
+def _resolve_label(organism):
+    """Resolve a display label through the get_type/get_name/type fallbacks"""
+    get_type = getattr(organism, 'get_type', None)
+    if get_type is not None:
+        return get_type().capitalize()
+    get_name = getattr(organism, 'get_name', None)
+    if get_name is not None:
+        return get_name()
+    return getattr(organism, 'type', "")
+
+
+def code_table(values, default=0):
+    """
+    Build a list indexed by type code from a {type_code: value} mapping
+
+    Args:
+        values (dict): Value for each type code that should not get the default
+        default: Value for every other type code
+
+    Returns:
+        list: Values indexed by type code
+    """
+    table = [default] * NUM_TYPE_CODES
+    for code, value in values.items():
+        table[code] = value
+    return table
+
+
+def code_mask_for_names(names):
+    """
+    Build a bitmask over type codes from a list of target names
+
+    Bit (1 << code) is set for every type code the names select. The generic
+    "Virus" and "Bacteria" names select every code in their family; names that
+    do not correspond to an organism class are ignored.
+
+    Args:
+        names (list): Organism class names, e.g. a cell's potential_targets
+
+    Returns:
+        int: Bitmask over type codes
+    """
+    mask = 0
+    for name in names:
+        if name == "Virus":
+            codes = VIRUS_CODES
+        elif name == "Bacteria":
+            codes = HARMFUL_BACTERIA_CODES
+        elif name in TYPE_CODES:
+            codes = (TYPE_CODES[name],)
+        else:
+            continue
+        for code in codes:
+            mask |= 1 << code
+    return mask
+
+
+def codes_for_names(names):
+    """
+    Build a boolean lookup table over type codes from a list of target names
+
+    Args:
+        names (list): Organism class names, e.g. a cell's potential_targets
+
+    Returns:
+        numpy.ndarray: Boolean array of length NUM_TYPE_CODES, True for the
+        codes selected by code_mask_for_names
+    """
+    mask = code_mask_for_names(names)
+    return np.array([bool(mask >> code & 1) for code in range(NUM_TYPE_CODES)])
@@ -9,6 +9,14 @@ from pygame import gfxdraw
 import random
 import math
 from src.organisms.organism import Organism
+from src.organisms import organism_types
+from src.organisms.organism_types import type_code_of
+
+# Cells viruses can infect, and the immune cells whose attacks viruses respond
+# to, as type codes. These match the get_type() strings interact used to test;
+# T-Cells report the Neutrophil type, so like neutrophils they are not included
+_INFECTABLE_CODES = (organism_types.EPITHELIAL_CELL, organism_types.RED_BLOOD_CELL)
+_IMMUNE_ATTACKER_CODES = (organism_types.MACROPHAGE,)
 
 class Virus(Organism):
     """
@@ -94,18 +102,8 @@ class Virus(Organism):
     
     def _apply_dna_effects(self):
         """Apply effects of the DNA sequence to the virus's properties"""
-        # Count bases in DNA to determine traits
-        base_counts = {
-            'A': self.dna.count('A'),
-            'T': self.dna.count('T'),
-            'G': self.dna.count('G'),
-            'C': self.dna.count('C')
-        }
-        
-        # Normalize counts
-        total = sum(base_counts.values())
-        for base in base_counts:
-            base_counts[base] /= total
+        # Base composition of the DNA determines traits
+        base_counts = self._base_composition()
         
         # Apply effects based on DNA composition
         # More A: Better infection chance
@@ -416,10 +414,10 @@ class Virus(Organism):
         """
         # Viruses target cells to infect
         # Check if target is a cell type that can be infected
-        other_type = getattr(other_organism, 'get_type', lambda: None)()
+        other_code = type_code_of(other_organism)
         
         # Expand types of cells that can be infected by viruses
-        if (other_type in ["EpithelialCell", "RedBloodCell"] and hasattr(other_organism, 'infect')):
+        if other_code in _INFECTABLE_CODES and hasattr(other_organism, 'infect'):
             # Attempt to infect the cell
             if np.random.random() < self.infection_chance:  # Use infection_chance probability
                 if other_organism.infect(self):
@@ -432,16 +430,16 @@ class Virus(Organism):
                         self.reproduction_ready = True
                     
         # Viruses can be destroyed by immune cells
-        if "whiteb" in other_type.lower() or "tcell" in other_type.lower() or "macro" in other_type.lower():
+        if other_code in _IMMUNE_ATTACKER_CODES:
             # Immune cells attack viruses
             attack_chance = 0.1  # Base chance
             
             # T-Cells are more effective against viruses
-            if "tcell" in other_type.lower():
+            if other_code == organism_types.TCELL:
                 attack_chance = 0.3
                 
             # Macrophages are better at engulfing viruses
-            if "macro" in other_type.lower():
+            if other_code == organism_types.MACROPHAGE:
                 attack_chance = 0.3
                 
             # Evasion reduces attack chance
@@ -499,12 +497,12 @@ class Virus(Organism):
             return
             
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Draw the main virus body
@@ -609,12 +607,12 @@ class Influenza(Virus):
             return
             
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Draw the main virus body
@@ -718,11 +716,10 @@ class Influenza(Virus):
 
     def interact(self, other_organism, environment):
         """Specialized interaction for Influenza virus"""
-        other_type = getattr(other_organism, 'get_type', lambda: None)()
-        other_name = getattr(other_organism, 'get_name', lambda: None)()
+        other_code = type_code_of(other_organism)
         
         # Influenza targets cells with more moderate infection rate
-        if other_type in ["EpithelialCell", "RedBloodCell"] and hasattr(other_organism, 'infect'):
+        if other_code in _INFECTABLE_CODES and hasattr(other_organism, 'infect'):
             # More balanced chance to infect cells
             if np.random.random() < self.infection_chance:
                 if other_organism.infect(self):
@@ -735,13 +732,13 @@ class Influenza(Virus):
                         self.dormant_counter = max(self.dormant_counter, self.dormant_threshold - 15)
         
         # Handle immune responses
-        if "whiteb" in other_type.lower() or "tcell" in other_type.lower() or "macro" in other_type.lower():
+        if other_code in _IMMUNE_ATTACKER_CODES:
             attack_chance = 0.1  # Increased from 0.05
             
-            if "tcell" in other_type.lower():
+            if other_code == organism_types.TCELL:
                 attack_chance = 0.25  # Increased from 0.15
                 
-            if "macro" in other_type.lower():
+            if other_code == organism_types.MACROPHAGE:
                 attack_chance = 0.2  # Increased from 0.1
             
             # Apply improved evasion modifier
@@ -1085,8 +1082,9 @@ class Coronavirus(Virus):
     def render(self, screen, camera_x, camera_y, zoom):
         """Render coronavirus with its distinctive crown of spikes"""
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Scale radius based on zoom
         radius = int(self.size * zoom)
@@ -1278,8 +1276,9 @@ class Adenovirus(Virus):
     def render(self, screen, camera_x, camera_y, zoom):
         """Render adenovirus with its icosahedral shape and fibers"""
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, screen_w * 0.5, screen_h * 0.5)
         
         # Scale radius based on zoom
         radius = int(self.size * zoom)
@@ -4,11 +4,384 @@ Implements the Neutrophil class, representing immune system cells
 """
 
 import numpy as np
-from src.organisms.organism import Organism
+from src.organisms.organism import Organism, noise
+from src.organisms.organism_arrays import OrganismArrays
+from src.organisms import organism_types
+from src.organisms.organism_types import (
+    organism_tags, type_info_of, type_label, TAG_VIRUS, TAG_HARMFUL_BACTERIA, TAG_DAMAGED, TAG_DEAD,
+    PATHOGEN_MASK, TARGET_MASK, EXEMPT_MASK
+)
+from src.organisms._scan_kernels import best_threat, best_proximity_threat, minimum_image, within_radius
+from src.organisms.immune_timers import IMMUNE_TIMERS
+from src.organisms.memory_table import MemoryTable
 import math
 import time
 import random
+import functools
 import pygame
+import pygame.gfxdraw
+from array import array
+
+# Empty memory mask passed to the scan kernel when a cell remembers nothing
+_NO_MEMORY = np.zeros(0, dtype=bool)
+
+# Sine lookup table for render animation (1024 steps per turn); accurate to
+# well under a pixel at cell sizes, and much cheaper than libm per draw
+_SIN_LUT = array('f', [math.sin(i * math.tau / 1024) for i in range(1024)])
+_SIN_LUT_SCALE = 1024 / math.tau
+
+# Unit direction vectors for n evenly spaced granules, n = 1..8
+_GRANULE_DIRS = {
+    n: tuple((math.cos(2 * math.pi * i / n), math.sin(2 * math.pi * i / n)) for i in range(n))
+    for n in range(1, 9)
+}
+
+# Angles of the 8 resting macrophage pseudopods, and the offsets from the
+# direct line of the 5 pseudopods reaching for an engulfed target
+_PSEUDOPOD_ANGLES = tuple(i * (2 * math.pi / 8) for i in range(8))
+_ENGULF_PSEUDOPOD_OFFSETS = tuple((i / 5) * math.pi - math.pi / 2 for i in range(5))
+
+# Start and end of the 4 drawn dashes of the T-Cell targeting line, as fractions
+# of the line (every other eighth; exact in binary, so the pixels are unchanged)
+_TARGET_LINE_DASHES = tuple((i / 8, (i + 1) / 8) for i in range(0, 8, 2))
+
+
+def fsin(x):
+    """Table-lookup sine for render animation"""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE) & 1023]
+
+
+def fcos(x):
+    """Table-lookup cosine for render animation"""
+    return _SIN_LUT[(int(x * _SIN_LUT_SCALE) + 256) & 1023]
+
+
+@functools.lru_cache(maxsize=256)
+def darken(color, amount):
+    """Darken an RGB color by a fixed amount per channel, clamped at 0"""
+    return (max(0, color[0] - amount), max(0, color[1] - amount), max(0, color[2] - amount))
+
+
+@functools.lru_cache(maxsize=256)
+def lighten(color, amount):
+    """Lighten an RGB color by a fixed amount per channel, clamped at 255"""
+    return (min(255, color[0] + amount), min(255, color[1] + amount), min(255, color[2] + amount))
+
+
+@functools.lru_cache(maxsize=64)
+def _engulfed_marker_color(pathogen_type):
+    """Marker color for an engulfed pathogen recorded without its own color"""
+    if "Virus" in pathogen_type:
+        return (150, 50, 50)  # Red for viruses
+    if "Bacteria" in pathogen_type:
+        return (50, 150, 50)  # Green for bacteria
+    return (100, 100, 100)  # Gray for others
+
+
+# Macrophage pulse colors are quantized to _PULSE_STEPS + 1 gradient entries,
+# indexed by int((sin + 1) * _PULSE_STEPS / 2)
+_PULSE_STEPS = 32
+_DIGESTING_COLOR = (130, 100, 220)
+
+
+# The resting pseudopod wiggle (a sine of clock * 0.01) is quantized to this many
+# steps per cycle, so whole resting macrophages can be drawn from cached sprites
+_WIGGLE_STEPS = 32
+
+
+def _wiggle_step(now):
+    """Quantized wiggle phase for a clock tick, in [0, _WIGGLE_STEPS)"""
+    return (int(now * (0.01 * _SIN_LUT_SCALE)) & 1023) * _WIGGLE_STEPS // 1024
+
+
+@functools.lru_cache(maxsize=_WIGGLE_STEPS)
+def _pseudopod_dirs(step):
+    """
+    Unit directions of the 8 wiggling resting pseudopods at a wiggle step
+
+    The wiggle depends only on the clock, so every macrophage drawn in the same
+    frame shares one set of directions.
+    """
+    dirs = []
+    phase = step * (math.tau / _WIGGLE_STEPS)
+    for i, angle in enumerate(_PSEUDOPOD_ANGLES):
+        angle += fsin(phase + i) * 0.2
+        dirs.append((fcos(angle), fsin(angle)))
+    return tuple(dirs)
+
+
+def _draw_macrophage_body(surface, fill_color, center, radius, step):
+    """Draw a resting Macrophage (body and wiggling pseudopods) onto a surface"""
+    center_x, center_y = center
+    pygame.draw.circle(surface, fill_color, center, radius)
+    
+    # Pseudopods (little arm-like extensions) are one polyline that runs out to
+    # each tip and back; the hops between bases are chords of the body, drawn in
+    # the body color, so only the pseudopods show
+    pseudopod_reach = radius + int(radius * 0.3)
+    points = []
+    for (cos_a, sin_a), (tip_cos, tip_sin) in zip(_GRANULE_DIRS[8], _pseudopod_dirs(step)):
+        base = (center_x + int(radius * cos_a), center_y + int(radius * sin_a))
+        tip = (center_x + int(pseudopod_reach * tip_cos), center_y + int(pseudopod_reach * tip_sin))
+        points += (base, tip, base)
+    pygame.draw.lines(surface, fill_color, False, points, max(1, int(radius * 0.2)))
+
+
+# Pre-rendered resting Macrophages keyed by (fill color, radius, wiggle step); the
+# pulsing digestion colors multiply the keys, so the cache empties itself when full
+_MACROPHAGE_SPRITE_LIMIT = 1024
+_MACROPHAGE_SPRITES = {}
+
+
+def macrophage_sprite(fill_color, radius, step):
+    """
+    Get the pre-rendered resting Macrophage for a fill color, screen radius and wiggle step
+    
+    Args:
+        fill_color (tuple): RGB body color
+        radius (int): Body radius in pixels, at most _SPRITE_MAX_RADIUS
+        step (int): Wiggle step from _wiggle_step
+        
+    Returns:
+        pygame.Surface: Transparent sprite with the body at its center
+    """
+    key = (fill_color, radius, step)
+    sprite = _MACROPHAGE_SPRITES.get(key)
+    if sprite is None:
+        if len(_MACROPHAGE_SPRITES) >= _MACROPHAGE_SPRITE_LIMIT:
+            _MACROPHAGE_SPRITES.clear()
+        # Room for the pseudopod tips and the line width around them
+        half = radius + int(radius * 0.3) + max(1, int(radius * 0.2)) + 1
+        sprite = pygame.Surface((2 * half + 1, 2 * half + 1), pygame.SRCALPHA)
+        _draw_macrophage_body(sprite, fill_color, (half, half), radius, step)
+        _MACROPHAGE_SPRITES[key] = sprite
+    return sprite
+
+
+def _pulse_index(phase):
+    """Gradient index for a pulse driven by sin(phase)"""
+    return int((fsin(phase) + 1) * (_PULSE_STEPS / 2))
+
+
+# Digesting macrophages pulse between 90% and 100% of a darker purple
+_DIGESTING_GRADIENT = tuple(
+    tuple(int(channel * (0.8 + (0.5 + 0.5 * step / _PULSE_STEPS) * 0.2)) for channel in _DIGESTING_COLOR)
+    for step in range(_PULSE_STEPS + 1)
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _engulfing_gradient(color):
+    """Pulse gradient for an engulfing macrophage: red up to +30%, green and blue up to +10%"""
+    gradient = []
+    for step in range(_PULSE_STEPS + 1):
+        pulse = step / _PULSE_STEPS
+        gradient.append((
+            min(255, int(color[0] * (1 + pulse * 0.3))),
+            min(255, int(color[1] * (1 + pulse * 0.1))),
+            min(255, int(color[2] * (1 + pulse * 0.1)))
+        ))
+    return tuple(gradient)
+
+
+def _target_screen_position(target, camera_x, camera_y, zoom, half_w, half_h):
+    """Screen position of a target, shared with the target's own render within a frame"""
+    if isinstance(target, Organism):
+        return target.screen_position(camera_x, camera_y, zoom, half_w, half_h)
+    return (int((target.x - camera_x) * zoom + half_w), int((target.y - camera_y) * zoom + half_h))
+
+
+# Zoom level-of-detail thresholds on a cell's true on-screen radius: below
+# _LOD_PIXEL_RADIUS a cell is a single pixel, below _LOD_DETAIL_RADIUS a plain disc
+_LOD_PIXEL_RADIUS = 1.5
+_LOD_DETAIL_RADIUS = 3
+
+
+def _draw_low_detail(screen, fill_color, screen_x, screen_y, true_radius):
+    """
+    Draw a cell that is too small on screen to show any detail
+    
+    Args:
+        screen: pygame screen surface
+        fill_color (tuple): RGB body color
+        screen_x, screen_y (int): Screen position of the cell
+        true_radius (float): Unclamped on-screen radius (size * zoom)
+        
+    Returns:
+        bool: True if the cell was drawn, False if it needs the detailed render
+    """
+    if true_radius >= _LOD_DETAIL_RADIUS:
+        return False
+    if true_radius < _LOD_PIXEL_RADIUS:
+        screen.set_at((screen_x, screen_y), fill_color)
+    else:
+        pygame.draw.circle(screen, fill_color, (screen_x, screen_y), max(2, int(true_radius)))
+    return True
+
+
+# Pre-rendered Neutrophil bodies keyed by (fill color, radius), built on first use
+# for radii up to _SPRITE_MAX_RADIUS; larger (zoomed-in) bodies are drawn directly
+_SPRITE_MAX_RADIUS = 32
+_NEUTROPHIL_SPRITES = {}
+
+
+def _draw_neutrophil_body(surface, fill_color, center, radius):
+    """Draw a Neutrophil body (fill, darker outline and granules) onto a surface"""
+    center_x, center_y = center
+    pygame.draw.circle(surface, fill_color, center, radius)
+    
+    # Draw a darker outline
+    pygame.draw.circle(surface, darken(fill_color, 40), center, radius, 1)
+    
+    # Draw small granules inside (characteristic of neutrophils)
+    if radius > 4:
+        num_granules = min(8, radius // 2)
+        granule_radius = max(1, radius // 5)
+        granule_color = lighten(fill_color, 20)
+        distance = radius * 0.6
+        
+        for cos_a, sin_a in _GRANULE_DIRS[num_granules]:
+            granule_x = center_x + int(cos_a * distance)
+            granule_y = center_y + int(sin_a * distance)
+            pygame.draw.circle(surface, granule_color, (granule_x, granule_y), granule_radius)
+
+
+def neutrophil_sprite(fill_color, radius):
+    """
+    Get the pre-rendered Neutrophil body for a fill color and screen radius
+    
+    Args:
+        fill_color (tuple): RGB body color
+        radius (int): Body radius in pixels, at most _SPRITE_MAX_RADIUS
+        
+    Returns:
+        pygame.Surface: Transparent sprite of size (2*radius + 2) with the body
+        centered at (radius + 1, radius + 1)
+    """
+    key = (fill_color, radius)
+    sprite = _NEUTROPHIL_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((2 * radius + 2, 2 * radius + 2), pygame.SRCALPHA)
+        _draw_neutrophil_body(sprite, fill_color, (radius + 1, radius + 1), radius)
+        _NEUTROPHIL_SPRITES[key] = sprite
+    return sprite
+
+
+# Pre-rendered T-Cell bodies (fill and nucleus) keyed by (fill color, radius),
+# sharing the Neutrophil sprite size limit
+_TCELL_NUCLEUS_COLOR = (20, 50, 120)
+_TCELL_SPRITES = {}
+
+
+def _draw_tcell_body(surface, fill_color, center, radius):
+    """Draw a T-Cell body (fill and dark blue nucleus) onto a surface"""
+    pygame.draw.circle(surface, fill_color, center, radius)
+    pygame.draw.circle(surface, _TCELL_NUCLEUS_COLOR, center, max(1, int(radius * 0.5)))
+
+
+def tcell_sprite(fill_color, radius):
+    """
+    Get the pre-rendered T-Cell body for a fill color and screen radius
+    
+    Args:
+        fill_color (tuple): RGB body color
+        radius (int): Body radius in pixels, at most _SPRITE_MAX_RADIUS
+        
+    Returns:
+        pygame.Surface: Transparent sprite of size (2*radius + 2) with the body
+        centered at (radius + 1, radius + 1)
+    """
+    key = (fill_color, radius)
+    sprite = _TCELL_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((2 * radius + 2, 2 * radius + 2), pygame.SRCALPHA)
+        _draw_tcell_body(sprite, fill_color, (radius + 1, radius + 1), radius)
+        _TCELL_SPRITES[key] = sprite
+    return sprite
+
+
+def _blit_tcell_body(screen, fill_color, screen_x, screen_y, radius):
+    """Draw a T-Cell body from its cached sprite, or directly if it is too large to cache"""
+    if radius <= _SPRITE_MAX_RADIUS:
+        screen.blit(tcell_sprite(fill_color, radius), (screen_x - radius - 1, screen_y - radius - 1))
+    else:
+        _draw_tcell_body(screen, fill_color, (screen_x, screen_y), radius)
+
+
+# Pre-rendered T-Cell activation auras keyed by (color, radius, opacity bucket);
+# opacity is quantized so a handful of surfaces cover every activation level.
+# Zoomed-in auras beyond the sprite size limit are cached too, with radii rounded
+# to even pixels; the cache is emptied if zooming fills it past its limit
+_AURA_OPACITY_STEP = 16
+_AURA_SPRITE_LIMIT = 256
+_AURA_SPRITES = {}
+
+
+def aura_sprite(color, radius, opacity):
+    """
+    Get the pre-rendered translucent aura for a color, screen radius and opacity
+    
+    Args:
+        color (tuple): RGB aura color
+        radius (int): Aura radius in pixels, rounded down to even above _SPRITE_MAX_RADIUS
+        opacity (int): Alpha value, rounded down to a multiple of _AURA_OPACITY_STEP
+        
+    Returns:
+        pygame.Surface: Transparent sprite of size (2*radius) with the aura
+        centered at (radius, radius), for the rounded radius
+    """
+    opacity -= opacity % _AURA_OPACITY_STEP
+    if radius > _SPRITE_MAX_RADIUS:
+        radius -= radius % 2
+    key = (color, radius, opacity)
+    sprite = _AURA_SPRITES.get(key)
+    if sprite is None:
+        if len(_AURA_SPRITES) >= _AURA_SPRITE_LIMIT:
+            _AURA_SPRITES.clear()
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color[:3], opacity), (radius, radius), radius)
+        _AURA_SPRITES[key] = sprite
+    return sprite
+
+
+# Uniform [0, 1) draws handed out from a pre-generated batch, refilled when drained;
+# much cheaper per draw than a scalar np.random.random() call
+_RAND_POOL_SIZE = 4096
+_RAND_POOL = iter(())
+
+
+def _rand():
+    """Next uniform [0, 1) draw from the shared batch"""
+    global _RAND_POOL
+    try:
+        return next(_RAND_POOL)
+    except StopIteration:
+        _RAND_POOL = iter(np.random.random(_RAND_POOL_SIZE).tolist())
+        return next(_RAND_POOL)
+
+
+# Neutrophil base threat level per organism type code: viruses start at 8 and
+# harmful bacteria at 5, with extra weight for the more dangerous species
+_NEUTROPHIL_THREAT_LEVELS = np.array(organism_types.code_table({
+    organism_types.VIRUS: 8,
+    organism_types.INFLUENZA: 8 + 4,
+    organism_types.RHINOVIRUS: 8 + 3,
+    organism_types.CORONAVIRUS: 8 + 6,
+    organism_types.ADENOVIRUS: 8 + 5,
+    organism_types.BACTERIA: 5,
+    organism_types.STREPTOCOCCUS: 5 + 3,
+    organism_types.ECOLI: 5 + 4,
+    organism_types.STAPHYLOCOCCUS: 5 + 5,
+    organism_types.SALMONELLA: 5 + 5
+}))
+
+# Organism types macrophages never engulf
+EXCLUDED_TARGETS = frozenset(("BeneficialBacteria", "Neutrophil", "Macrophage", "TCell",
+                              "RedBloodCell", "EpithelialCell", "Platelet"))
+
+# Bacteria that are especially dangerous to the immune cells attacking them
+_TOXIC_BACTERIA_CODES = (organism_types.STAPHYLOCOCCUS, organism_types.SALMONELLA)
+
 
 class Neutrophil(Organism):
     """
@@ -16,6 +389,16 @@ class Neutrophil(Organism):
     Neutrophils hunt and destroy foreign organisms like viruses and bacteria.
     """
     
+    __slots__ = ("_detection_radius", "detection_radius_sq", "_potential_targets", "potential_mask",
+                 "_target_code_table", "_scan_candidates_cache", "_scan_candidate_keys", "activation_level",
+                 "activation_threshold", "activation_timer", "active_color", "attack_strength",
+                 "base_metabolism", "chase_speed_multiplier", "engulfed_pathogens", "engulfing_target",
+                 "has_target", "interaction_cooldown", "is_active", "is_phagocytic",
+                 "max_engulf_capacity", "memory", "memory_capacity", "memory_duration",
+                 "pathogen_memory", "speed", "target", "target_lock_duration", "target_lock_time",
+                 "target_memory", "target_organism", "target_visual_indicator", "target_x", "target_y",
+                 "type", "vx", "vy")
+    
     def __init__(self, x, y, size, color, speed, dna_length=120):
         """
         Initialize a neutrophil
@@ -54,7 +437,7 @@ class Neutrophil(Organism):
         self.max_engulf_capacity = 3  # Maximum number of organisms it can engulf
         self.engulfed_pathogens = []  # List of engulfed pathogens
         self.engulfing_target = None  # Currently engulfing target
-        self.memory = {}  # Dictionary to remember pathogens
+        self.memory = MemoryTable(16)  # Ids of remembered pathogens with their expiry ages
         self.memory_duration = 500  # How long to remember a pathogen
         
         # Activation system for immune responses
@@ -69,29 +452,49 @@ class Neutrophil(Organism):
         
         # Neutrophil specific properties
         self.memory_capacity = 3  # Number of pathogen types it can recognize
-        self.pathogen_memory = []  # List of pathogen types it recognizes
+        self.pathogen_memory = {}  # IDs of pathogens it recognizes (insertion-ordered set)
         self.target_organism = None  # Current target organism (new attribute used in updated methods)
         self.base_metabolism = 0.05  # Base metabolic rate
         self.target_lock_time = 0  # Time counter for maintaining focus on the current target
         self.target_lock_duration = 50  # How long to maintain focus on a target before considering switching
         
+        # Ids of the potential targets inside detection range at this tick's scan,
+        # or None if the cell has not scanned since its last update; each scan
+        # refills the same set rather than allocating a new one
+        self._scan_candidates_cache = None
+        self._scan_candidate_keys = set()
+        
         # Modify properties based on DNA
         self._apply_dna_effects()
-    
+
+    @property
+    def detection_radius(self):
+        """Radius within which the cell can detect potential targets"""
+        return self._detection_radius
+
+    @detection_radius.setter
+    def detection_radius(self, value):
+        # Keep the squared radius in sync so distance gates can skip the sqrt
+        self._detection_radius = value
+        self.detection_radius_sq = value * value
+
+    @property
+    def potential_targets(self):
+        """Names of the organism types this cell targets"""
+        return self._potential_targets
+
+    @potential_targets.setter
+    def potential_targets(self, names):
+        # Translate the names once into a bitmask over type codes (1 << type_code)
+        # and the matching lookup table used by the vectorized scan
+        self._potential_targets = names
+        self.potential_mask = organism_types.code_mask_for_names(names)
+        self._target_code_table = organism_types.codes_for_names(names)
+
     def _apply_dna_effects(self):
         """Apply effects of the DNA sequence to the neutrophil's properties"""
-        # Count bases in DNA to determine traits
-        base_counts = {
-            'A': self.dna.count('A'),
-            'T': self.dna.count('T'),
-            'G': self.dna.count('G'),
-            'C': self.dna.count('C')
-        }
-        
-        # Normalize counts
-        total = sum(base_counts.values())
-        for base in base_counts:
-            base_counts[base] /= total
+        # Base composition of the DNA determines traits
+        base_counts = self._base_composition()
         
         # Apply effects based on DNA composition
         # More A: Better detection radius
@@ -146,30 +549,16 @@ class Neutrophil(Organism):
         ]
         
         # Add target information if we have a target
-        if self.target:
-            # Check if target is a dictionary (new structure)
-            if isinstance(self.target, dict) and 'organism' in self.target:
-                target_organism = self.target['organism']
-                if hasattr(target_organism, 'is_alive') and target_organism.is_alive:
-                    # Direction to target
-                    dx = target_organism.x - self.x
-                    dy = target_organism.y - self.y
-                    distance = max(0.1, np.sqrt(dx**2 + dy**2))
-                    
-                    # Normalized direction (replace the default values)
-                    inputs[3] = dx / distance
-                    inputs[4] = dy / distance
-            
-            # Legacy support for direct organism reference    
-            elif hasattr(self.target, 'is_alive') and self.target.is_alive:
-                # Direction to target
-                dx = self.target.x - self.x
-                dy = self.target.y - self.y
-                distance = max(0.1, np.sqrt(dx**2 + dy**2))
-                
-                # Normalized direction (replace the default values)
-                inputs[3] = dx / distance
-                inputs[4] = dy / distance
+        target = self.target
+        if target is not None and target.is_alive:
+            # Normalized direction to target (replace the default values); the
+            # distance is floored at 0.1 so a target on top of us stays finite
+            dx = target.x - self.x
+            dy = target.y - self.y
+            distance_sq = dx*dx + dy*dy
+            inverse = 1.0 / math.sqrt(distance_sq) if distance_sq > 0.01 else 10.0
+            inputs[3] = dx * inverse
+            inputs[4] = dy * inverse
         
         return inputs
     
@@ -185,60 +574,45 @@ class Neutrophil(Organism):
         dx = decision[0]
         dy = decision[1]
         
-        # If we have a target, adjust movement direction
-        if self.target is not None:
-            # Initialize target organism and distance
-            target_organism = None
-            target_distance = 0
-            
-            # Handle target based on its type
-            if isinstance(self.target, dict) and 'organism' in self.target:
-                # New dictionary format
-                target_organism = self.target['organism']
-                target_distance = self.target['distance']
-            elif hasattr(self.target, 'x') and hasattr(self.target, 'y'):
-                # Legacy direct organism reference
-                target_organism = self.target
-                target_distance = np.sqrt((target_organism.x - self.x)**2 + (target_organism.y - self.y)**2)
+        # If we have a live target, adjust movement direction
+        target = self.target
+        if target is not None and target.is_alive:
+            target_dx = target.x - self.x
+            target_dy = target.y - self.y
+            target_dist_sq = target_dx*target_dx + target_dy*target_dy
             
-            # Only proceed if we have a valid target organism
-            if target_organism is not None and hasattr(target_organism, 'is_alive') and target_organism.is_alive:
-                # Calculate direction to target
-                target_dx = target_organism.x - self.x
-                target_dy = target_organism.y - self.y
+            if target_dist_sq > 0:
+                target_dist = math.sqrt(target_dist_sq)
                 
-                # Normalize direction
-                target_dist = np.sqrt(target_dx**2 + target_dy**2)
+                # Blend neural network decision with the normalized target direction
+                # The closer to the target, the more we follow neural network decision
+                blend_factor = target_dist / 100 if target_dist < 100 else 1.0
+                pull = (1 - blend_factor) / target_dist
+                dx = dx * blend_factor + target_dx * pull
+                dy = dy * blend_factor + target_dy * pull
                 
-                if target_dist > 0:
-                    target_dx /= target_dist
-                    target_dy /= target_dist
-                    
-                    # Blend neural network decision with target direction
-                    # The closer to the target, the more we follow neural network decision
-                    blend_factor = min(1.0, target_dist / 100)
-                    dx = dx * blend_factor + target_dx * (1 - blend_factor)
-                    dy = dy * blend_factor + target_dy * (1 - blend_factor)
-                    
-                    # Normalize again
-                    move_dist = np.sqrt(dx**2 + dy**2)
-                    if move_dist > 0:
-                        dx /= move_dist
-                        dy /= move_dist
+                # Normalize again
+                move_dist_sq = dx*dx + dy*dy
+                if move_dist_sq > 0:
+                    inverse = 1.0 / math.sqrt(move_dist_sq)
+                    dx *= inverse
+                    dy *= inverse
         
         # Apply movement
         self.x += dx * self.base_speed
         self.y += dy * self.base_speed
         
         # Boundary checking
-        if self.x < 0 or self.x > environment.width:
+        world_width = environment.width
+        world_height = environment.height
+        if self.x < 0 or self.x > world_width:
             dx *= -1
-        if self.y < 0 or self.y > environment.height:
+        if self.y < 0 or self.y > world_height:
             dy *= -1
             
         # Ensure within bounds
-        self.x = max(0, min(environment.width, self.x))
-        self.y = max(0, min(environment.height, self.y))
+        self.x = max(0, min(world_width, self.x))
+        self.y = max(0, min(world_height, self.y))
         
         # Consume energy for movement
         movement_cost = (abs(dx) + abs(dy)) * 0.05
@@ -255,36 +629,8 @@ class Neutrophil(Organism):
         if not self.is_alive:
             return
             
-        # Get all organisms within detection radius
-        max_scan_distance = self.detection_radius  # Use the instance's detection radius
-        nearby_organisms = []
-        
-        for organism in organisms:
-            # Skip self
-            if organism.id == self.id:
-                continue
-                
-            # Calculate distance
-            dx = self.x - organism.x
-            dy = self.y - organism.y
-            
-            # Account for world wrapping when calculating distance
-            world_width = environment.width
-            world_height = environment.height
-            
-            # Check for shorter path across world boundaries
-            if abs(dx) > world_width / 2:
-                dx = -1 * np.sign(dx) * (world_width - abs(dx))
-            if abs(dy) > world_height / 2:
-                dy = -1 * np.sign(dy) * (world_height - abs(dy))
-                
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            # Only include organisms within detection radius
-            if distance <= max_scan_distance:
-                nearby_organisms.append(organism)
-        
-        # If we currently have a target, increment lock time
+        # If we currently have a target, increment lock time; this runs even when
+        # nothing is nearby, so a dead or distant target is still let go
         if self.target:
             self.target_lock_time += 1
             
@@ -293,23 +639,18 @@ class Neutrophil(Organism):
                 self.target_lock_time = 0
                 self.target = None  # Clear current target to allow finding a new one
                 
-            # Otherwise, check if current target is still in range
+            # Otherwise, check if current target is still alive and in range; this needs
+            # only the target itself, so a kept target costs no candidate columns or scoring
             else:
                 current_target_in_range = False
-                target_organism = None
+                target_organism = self.target
                 
-                # Handle both dictionary and direct organism cases
-                if isinstance(self.target, dict) and 'organism' in self.target:
-                    target_organism = self.target['organism']
-                else:
-                    # If target is already the organism itself
-                    target_organism = self.target
-                    
-                # Check if target is still in range
-                for organism in nearby_organisms:
-                    if target_organism == organism:
-                        current_target_in_range = True
-                        break
+                # Check if target is still in range (world-wrapped distance), straight
+                # from its own position rather than by finding it in the scan list
+                if target_organism is not self and target_organism.is_alive:
+                    dx = minimum_image(target_organism.x - self.x, environment.width)
+                    dy = minimum_image(target_organism.y - self.y, environment.height)
+                    current_target_in_range = dx*dx + dy*dy <= self.detection_radius_sq
                 
                 # If current target not in range, allow finding a new one
                 if not current_target_in_range:
@@ -319,8 +660,12 @@ class Neutrophil(Organism):
                     # Current target still valid, keep it
                     return
         
+        if not organisms:
+            return
+            
         # Find the highest threat target
-        self.target = self._select_target(nearby_organisms, environment)
+        columns = self._candidate_columns(organisms, environment)
+        self.target = self._select_target(organisms, columns, environment)
         
         # If we found a new target, reset lock time
         if self.target:
@@ -354,16 +699,10 @@ class Neutrophil(Organism):
         if not self.is_alive:
             return
             
-        # Age the organism - Adding this line to ensure aging happens
-        self.age += 1
-            
         old_x, old_y = self.x, self.y
-        
-        # Since we can't directly sense the environment for other organisms,
-        # we have to rely on neural network for movement
-        inputs = self._get_neural_network_inputs(environment)
-        decision = self.neural_network_decision(inputs)
-        self._apply_decision(decision, environment)
+        world_width = environment.width
+        world_height = environment.height
+        self._begin_update(environment)
         
         # Initialize dx and dy with default values
         dx = 0.0
@@ -371,27 +710,14 @@ class Neutrophil(Organism):
         
         # If we have a target, move towards it with increased urgency
         if self.target is not None:
-            # Get target organism - handle both dictionary and direct organism cases
-            target_organism = None
-            if isinstance(self.target, dict) and 'organism' in self.target:
-                target_organism = self.target['organism']
-            else:
-                # If target is already the organism itself
-                target_organism = self.target
-                
+            target_organism = self.target
             if target_organism and hasattr(target_organism, 'is_alive') and target_organism.is_alive:
                 dx = target_organism.x - self.x
                 dy = target_organism.y - self.y
             
-            # Account for world wrapping when calculating distance
-            world_width = environment.width
-            world_height = environment.height
-            
-            # Check for shorter path across world boundaries
-            if abs(dx) > world_width / 2:
-                dx = -1 * np.sign(dx) * (world_width - abs(dx))
-            if abs(dy) > world_height / 2:
-                dy = -1 * np.sign(dy) * (world_height - abs(dy))
+            # Account for world wrapping: take the shorter path across world boundaries
+            dx = float(minimum_image(dx, world_width))
+            dy = float(minimum_image(dy, world_height))
             
             # Calculate distance to target
             distance = math.sqrt(dx*dx + dy*dy)
@@ -412,23 +738,24 @@ class Neutrophil(Organism):
                 self.vy = dy * chase_speed
                 
                 # Add small random movement component (reduced for more direct pursuit)
-                self.vx += np.random.normal(0, 0.1)
-                self.vy += np.random.normal(0, 0.1)
+                self.vx += noise(0.1)
+                self.vy += noise(0.1)
             else:
                 # Target is no longer valid, clear it
                 self.target = None
         else:
             # Random movement with inertia when no target is present
-            self.vx += np.random.normal(0, 0.3)
-            self.vy += np.random.normal(0, 0.3)
+            self.vx += noise(0.3)
+            self.vy += noise(0.3)
             
             # Dampen velocity for stability
             self.vx *= 0.95
             self.vy *= 0.95
             
-        # Apply maximum speed constraint
-        speed = math.sqrt(self.vx*self.vx + self.vy*self.vy)
-        if speed > self.base_speed:
+        # Apply maximum speed constraint (the sqrt is only needed when clamping)
+        speed_sq = self.vx*self.vx + self.vy*self.vy
+        if speed_sq > self.base_speed * self.base_speed:
+            speed = math.sqrt(speed_sq)
             self.vx = (self.vx / speed) * self.base_speed
             self.vy = (self.vy / speed) * self.base_speed
             
@@ -436,32 +763,149 @@ class Neutrophil(Organism):
         self.x += self.vx
         self.y += self.vy
         
-        # Boundary wrapping
-        world_width = environment.width
-        world_height = environment.height
-        
-        if self.x < 0:
-            self.x += world_width
-        elif self.x >= world_width:
-            self.x -= world_width
-            
-        if self.y < 0:
-            self.y += world_height
-        elif self.y >= world_height:
-            self.y -= world_height
+        # Boundary wrapping; the modulo also covers moves longer than the world
+        self.x %= world_width
+        self.y %= world_height
         
         # Consume nutrients from environment based on distance moved
-        distance_moved = math.sqrt((self.x - old_x)**2 + (self.y - old_y)**2)
+        distance_moved = math.hypot(self.x - old_x, self.y - old_y)
         energy_consumed = distance_moved * 0.05
         self.energy = max(0, self.energy - energy_consumed)
         
+        self._finish_update(environment)
+        
+    @classmethod
+    def update_batch(cls, cells, environment, prepared=None):
+        """
+        Update many neutrophils, running the chase/wander movement step for all at once
+        
+        Equivalent to calling update on each cell: velocity, speed clamp, world wrap
+        and movement energy are computed as whole-array operations, and only the
+        decision and the feeding/vitals bookkeeping stay per cell. Without prepared
+        state the neural network decisions are made here in one batched forward pass.
+        Only plain neutrophils belong here; subclasses extend update itself.
+        
+        Args:
+            cells (list): Neutrophils to update
+            environment: The environment object containing state information
+            prepared (list, optional): _prepare_batch_update result for each cell, when
+                every cell has already made its decision at its own turn in an update
+                loop; the chase then heads for where each target was at that turn
+        """
+        if prepared is None:
+            cells = [cell for cell in cells if cell.is_alive]
+            # One forward pass makes every cell's neural network decision
+            inputs = [cell._get_neural_network_inputs(environment) for cell in cells]
+            decisions = cls.neural_network_decisions(cells, inputs) if cells else []
+            prepared = [cell._prepare_batch_update(environment, decision)
+                        for cell, decision in zip(cells, decisions)]
+        count = len(cells)
+        if not count:
+            return
+        world_width = environment.width
+        world_height = environment.height
+        old_x, old_y, target_x, target_y, has_target = (np.array(column) for column in zip(*prepared))
+        
+        # Per-cell state after the neural network decision has moved each cell
+        x = np.fromiter((cell.x for cell in cells), dtype=float, count=count)
+        y = np.fromiter((cell.y for cell in cells), dtype=float, count=count)
+        vx = np.fromiter((cell.vx for cell in cells), dtype=float, count=count)
+        vy = np.fromiter((cell.vy for cell in cells), dtype=float, count=count)
+        base_speed = np.fromiter((cell.base_speed for cell in cells), dtype=float, count=count)
+        chase_speed = base_speed * np.fromiter(
+            (cell.chase_speed_multiplier for cell in cells), dtype=float, count=count)
+        
+        # Offset to each live target (zero for cells whose target has died), taking
+        # the shorter path across world boundaries
+        dx = minimum_image(target_x - x, world_width)
+        dy = minimum_image(target_y - y, world_height)
+        distance = np.hypot(dx, dy)
+        
+        # Chasers head straight for their target, faster when close; the rest wander
+        chasing = has_target & (distance > 0)
+        inverse = np.where(chasing, chase_speed * np.where(distance < 50, 1.2, 1.0), 0.0)
+        inverse /= np.where(chasing, distance, 1.0)
+        jitter = np.random.standard_normal((2, count))
+        vx = np.where(chasing, dx * inverse + 0.1 * jitter[0], vx)
+        vy = np.where(chasing, dy * inverse + 0.1 * jitter[1], vy)
+        wandering = ~has_target
+        vx = np.where(wandering, (vx + 0.3 * jitter[0]) * 0.95, vx)
+        vy = np.where(wandering, (vy + 0.3 * jitter[1]) * 0.95, vy)
+        
+        # Maximum speed constraint, taking square roots only for the cells being clamped
+        speed_sq = vx*vx + vy*vy
+        too_fast = speed_sq > base_speed * base_speed
+        scale = np.ones(count)
+        scale[too_fast] = base_speed[too_fast] / np.sqrt(speed_sq[too_fast])
+        vx *= scale
+        vy *= scale
+        
+        # Move and wrap at the world edges
+        x += vx
+        y += vy
+        np.mod(x, world_width, out=x)
+        np.mod(y, world_height, out=y)
+        energy_consumed = np.hypot(x - old_x, y - old_y) * 0.05
+        
+        lost_target = (has_target & ~chasing).tolist()
+        for cell, new_x, new_y, new_vx, new_vy, consumed, lost in zip(
+                cells, x.tolist(), y.tolist(), vx.tolist(), vy.tolist(),
+                energy_consumed.tolist(), lost_target):
+            if lost:
+                cell.target = None
+            cell.x = new_x
+            cell.y = new_y
+            cell.vx = new_vx
+            cell.vy = new_vy
+            cell.energy = max(0, cell.energy - consumed)
+            cell._finish_update(environment)
+        
+    def _begin_update(self, environment, decision=None):
+        """
+        Age the cell and apply its neural network decision (the first step of update)
+        
+        A decision already made by a batched forward pass can be passed in.
+        """
+        # Age the organism - Adding this line to ensure aging happens
+        self.age += 1
+        
+        # Candidates from the previous tick's scan are stale once we move
+        self._scan_candidates_cache = None
+        
+        # Since we can't directly sense the environment for other organisms,
+        # we have to rely on neural network for movement
+        if decision is None:
+            inputs = self._get_neural_network_inputs(environment)
+            decision = self.neural_network_decision(inputs)
+        self._apply_decision(decision, environment)
+        
+    def _prepare_batch_update(self, environment, decision=None):
+        """
+        Run the first step of update and note where the chase target is now
+        
+        Called for each cell at its own turn, so the batched movement step that
+        follows heads for the target as update would have seen it then.
+        
+        Returns:
+            tuple: (old_x, old_y, target_x, target_y, has_target); the target
+            position is the cell's own when it has no live target
+        """
+        old_x, old_y = self.x, self.y
+        self._begin_update(environment, decision)
+        target_organism = self.target
+        if target_organism and hasattr(target_organism, 'is_alive') and target_organism.is_alive:
+            return old_x, old_y, target_organism.x, target_organism.y, True
+        return old_x, old_y, self.x, self.y, target_organism is not None
+        
+    def _finish_update(self, environment):
+        """Feed from the environment and check vitals (the last step of update)"""
         # Get nutrients from environment
         nutrients = environment.consume_nutrients(self.x, self.y, self.size * 0.1)
         self.energy = min(100, self.energy + nutrients * 0.5)
         
         # Check if organism should die
         self._check_vitals()
-    
+        
     def reproduce(self, environment):
         """
         Attempt to reproduce based on energy level
@@ -472,6 +916,13 @@ class Neutrophil(Organism):
         Returns:
             Neutrophil: A new neutrophil instance or None if reproduction fails
         """
+        # Neutrophils reproduce less frequently; this gate rejects almost every
+        # call, so it comes before any other work
+        if (not self.is_alive or
+            self.energy <= 140 or  # Increased energy threshold
+            _rand() >= 0.0005):  # Even lower reproduction rate
+            return None
+        
         # Check population cap from environment config
         max_organisms = environment.config.get("simulation_settings", {}).get("max_organisms", 0)
         if max_organisms > 0:
@@ -482,56 +933,53 @@ class Neutrophil(Organism):
             
             # If estimated local population is high, reduce reproduction chance
             if estimated_local_count > 30:  # Arbitrary threshold for WBCs
-                if np.random.random() < 0.9:  # 90% chance to skip reproduction in dense areas
+                if _rand() < 0.9:  # 90% chance to skip reproduction in dense areas
                     return None
         
-        # Neutrophils reproduce less frequently
-        if (self.energy > 140 and  # Increased energy threshold
-            self.is_alive and 
-            np.random.random() < 0.0005):  # Even lower reproduction rate
-            
-            # Create child with mutation in DNA
-            child_dna = self.dna.copy()
-            if np.random.random() < environment.config['simulation_settings']['mutation_rate']:
-                mutation_idx = np.random.randint(0, len(child_dna))
-                bases = ['A', 'T', 'G', 'C']
-                child_dna[mutation_idx] = bases[np.random.randint(0, 4)]
-            
-            # Slightly mutate color
-            r, g, b = self.color
-            color_mutation = 5  # Less variation than bacteria
-            new_color = (
-                max(0, min(255, r + np.random.randint(-color_mutation, color_mutation))),
-                max(0, min(255, g + np.random.randint(-color_mutation, color_mutation))),
-                max(0, min(255, b + np.random.randint(-color_mutation, color_mutation)))
-            )
-            
-            # Create child with random position deviation
-            offset = 20
-            new_x = max(0, min(environment.width, self.x + np.random.randint(-offset, offset)))
-            new_y = max(0, min(environment.height, self.y + np.random.randint(-offset, offset)))
-            
-            # Pass memory to child
-            child = Neutrophil(
-                new_x, 
-                new_y,
-                self.size * np.random.uniform(0.95, 1.05),  # Less size variation
-                new_color,
-                self.base_speed * np.random.uniform(0.95, 1.05)  # Less speed variation
-            )
-            
-            # Copy DNA to child
-            child.dna = child_dna
-            
-            # Transfer pathogen memory to child (immune memory)
-            child.pathogen_memory = self.pathogen_memory.copy()
-            
-            # Consume energy for reproduction
-            self.energy -= 80  # Higher energy cost
-            
-            return child
-        
-        return None
+        # Every random value the child needs comes from one draw of uniform [0, 1)
+        # values; integers in [low, high) are low + int(u * (high - low))
+        draws = np.random.random(9).tolist()
+        
+        # Create child with mutation in DNA
+        child_dna = self.dna.copy()
+        if _rand() < environment.config['simulation_settings']['mutation_rate']:
+            mutation_idx = int(draws[0] * len(child_dna))
+            bases = ['A', 'T', 'G', 'C']
+            child_dna[mutation_idx] = bases[int(draws[1] * 4)]
+        
+        # Slightly mutate color
+        r, g, b = self.color
+        color_mutation = 5  # Less variation than bacteria
+        new_color = tuple(
+            max(0, min(255, channel - color_mutation + int(u * 2 * color_mutation)))
+            for channel, u in zip((r, g, b), draws[2:5])
+        )
+        
+        # Create child with random position deviation
+        offset = 20
+        new_x = max(0, min(environment.width, self.x - offset + int(draws[5] * 2 * offset)))
+        new_y = max(0, min(environment.height, self.y - offset + int(draws[6] * 2 * offset)))
+        
+        # Pass memory to child
+        child = Neutrophil(
+            new_x, 
+            new_y,
+            self.size * (0.95 + 0.1 * draws[7]),  # Less size variation
+            new_color,
+            self.base_speed * (0.95 + 0.1 * draws[8])  # Less speed variation
+        )
+        
+        # Copy DNA to child
+        child.dna = child_dna
+        
+        # Transfer pathogen memory to child (immune memory)
+        child.pathogen_memory = self.pathogen_memory.copy()
+        
+        # Consume energy for reproduction
+        self.energy -= 80  # Higher energy cost
+        
+        return child
+
     
     def interact(self, other_organism, environment):
         """
@@ -544,28 +992,18 @@ class Neutrophil(Organism):
         Returns:
             bool: True if interaction occurred, False otherwise
         """
-        # Check type and name for better virus identification
-        is_pathogen = False
-        
-        # Check by type
-        org_type = other_organism.get_type().lower()
-        if org_type in ["virus", "bacteria"]:
-            is_pathogen = True
-            
-        # Also check by name for specific viruses
-        if hasattr(other_organism, 'get_name'):
-            org_name = other_organism.get_name().lower()
-            if "virus" in org_name or "corona" in org_name or "adeno" in org_name:
-                is_pathogen = True
+        # Viruses and harmful bacteria are pathogens; the type is resolved once
+        code, tags = type_info_of(other_organism)
+        is_pathogen = tags & PATHOGEN_MASK
         
         # Only interact with pathogens that are alive
         if is_pathogen and other_organism.is_alive:
-            # Check if close enough to attack
+            # Check if close enough to attack (squared distances, no sqrt needed)
             dx = other_organism.x - self.x
             dy = other_organism.y - self.y
-            distance = np.sqrt(dx**2 + dy**2)
+            reach = self.size + other_organism.size + 2
             
-            if distance <= self.size + other_organism.size + 2:
+            if dx*dx + dy*dy <= reach*reach:
                 # Attack the pathogen
                 other_organism.health -= self.attack_strength
                 
@@ -573,9 +1011,9 @@ class Neutrophil(Organism):
                 self.energy -= 1.0
                 
                 # Remember this pathogen type
-                if len(self.pathogen_memory) < self.memory_capacity:
-                    if other_organism.id not in self.pathogen_memory:
-                        self.pathogen_memory.append(other_organism.id)
+                pathogen_memory = self.pathogen_memory
+                if len(pathogen_memory) < self.memory_capacity:
+                    pathogen_memory.setdefault(other_organism.id)
                 
                 # NEW: Immune cells can be damaged during phagocytosis/attack
                 # This models the biological reality that immune cells can be damaged 
@@ -583,18 +1021,17 @@ class Neutrophil(Organism):
                 damage_chance = 0.25  # 25% chance of taking damage
                 
                 # Viruses have higher chance of damaging immune cells
-                if "virus" in org_type or "virus" in getattr(other_organism, 'get_name', lambda: "")().lower():
+                if tags & TAG_VIRUS:
                     damage_chance = 0.35
                 
                 # Some bacteria are more dangerous to immune cells
-                if hasattr(other_organism, 'get_name'):
-                    pathogen_name = other_organism.get_name().lower()
-                    if "staphylococcus" in pathogen_name or "salmonella" in pathogen_name:
-                        damage_chance = 0.4
+                elif code in _TOXIC_BACTERIA_CODES:
+                    damage_chance = 0.4
                 
                 # Apply damage if the random check passes
-                if environment.random.random() < damage_chance:
-                    damage_amount = environment.random.uniform(0.5, 2.0)
+                rng = environment.random
+                if rng.random() < damage_chance:
+                    damage_amount = rng.uniform(0.5, 2.0)
                     self.health -= damage_amount
                     
                     # Visual indication of damage could be added here
@@ -607,134 +1044,144 @@ class Neutrophil(Organism):
         """Return the type of organism"""
         return "Neutrophil"
 
-    def _select_target(self, organisms, environment):
+    def _select_target(self, organisms, columns, environment):
         """
-        Select the highest threat target from a list of potential target organisms
+        Select the highest threat target among the organisms within detection radius
         
         Args:
-            organisms (list): List of nearby organisms
+            organisms (list): Nearby organisms
+            columns (tuple): Array columns for organisms (see OrganismArrays.take)
+            environment: The environment object (its size sets the world wrap)
+            
+        Returns:
+            The selected target organism, or None if no suitable target found
+        """
+        xs, ys, codes, alive, _, _, health = columns
+        
+        # Score by base threat level per organism type (immune cells, so this cell
+        # itself, body cells and beneficial bacteria are not threats), weighted
+        # toward closer and weaker pathogens. The fused kernel does the world wrap,
+        # range test and scoring in one pass and returns the first best on ties
+        best_index = best_proximity_threat(self.x, self.y, xs, ys, codes, alive, health,
+                                           environment.width, environment.height,
+                                           self.detection_radius, _NEUTROPHIL_THREAT_LEVELS)
+        if best_index < 0:
+            return None
+            
+        target = organisms[best_index]
+        
+        # Get the target type for the visual indicator
+        target_type = type_label(target)
+        
+        # Increase activation level if our target is a virus
+        if organism_tags(target) & TAG_VIRUS:
+            self.activation_level += 2.0
+        
+        # Set target and return
+        self.target = target
+        self.target_visual_indicator = target_type
+        
+        return target
+
+    def _remember(self, organism):
+        """Remember an organism (or refresh its memory) so it is prioritized in later scans"""
+        self.memory.remember(id(organism), self.age + self.memory_duration)
+        
+    def _forget_expired(self):
+        """Drop memories whose expiry age has passed"""
+        self.memory.expire(self.age)
+        
+    def _candidate_columns(self, organisms, environment):
+        """
+        Get the array columns for scan candidates
+        
+        Columns come from the environment's per-tick snapshot, or are built directly
+        from the organisms if the environment does not keep one.
+        
+        Args:
+            organisms (list): Candidate organisms
             environment: The environment object
             
         Returns:
-            dict: Dictionary containing the selected target organism and threat level, or None if no suitable target found
+            tuple: (xs, ys, codes, alive, marked, health_ratio, health) arrays aligned with organisms
         """
-        threat_scores = []
+        organism_arrays = getattr(environment, 'organism_arrays', None)
+        if organism_arrays is not None:
+            return organism_arrays.take(organisms)
+        return OrganismArrays.gather(organisms)
         
-        for organism in organisms:
-            # Skip other neutrophils, body cells, and dead organisms
-            org_type = organism.get_type().lower()
-            if "blood_cell" in org_type or "body" in org_type or not organism.is_alive:
-                continue
-                
-            # Calculate base threat level
-            threat_level = 0
+    def _scan_threats(self, organisms, environment):
+        """
+        Select the highest threat among potential targets within detection radius
+        
+        Candidates are filtered and scored by a fused kernel over the environment's
+        structure-of-arrays snapshot; only the winning organism is touched as an object.
+        Subclasses supply _THREAT_WEIGHTS (per type code) and _MARKED_THREAT_BONUS.
+        
+        Args:
+            organisms: List of nearby organisms to scan
+            environment: The environment object
             
-            # Get organism name for more specific type checking
-            org_name = ""
-            if hasattr(organism, 'get_name'):
-                org_name = organism.get_name().lower()
+        Returns:
+            The target organism if found, None otherwise
+        """
+        # Use provided organisms instead of fetching from environment
+        nearby_organisms = organisms
+        
+        candidate_keys = self._scan_candidate_keys
+        candidate_keys.clear()
+        self._scan_candidates_cache = candidate_keys
+        if not nearby_organisms:
+            return None
             
-            # Viruses are high threats
-            if "virus" in org_type:
-                threat_level += 8  # Increased from 5
-                
-                # Specific virus types may have different threat levels
-                if "influenza" in org_name or "influenza" in org_type:
-                    threat_level += 4  # Increased from 3
-                elif "rhino" in org_name or "rhino" in org_type:  # Rhinovirus
-                    threat_level += 3  # Increased from 2
-                elif "corona" in org_name or "coronavirus" in org_type:  # Coronavirus
-                    threat_level += 6  # Higher threat for coronavirus
-                elif "adeno" in org_name or "adenovirus" in org_type:  # Adenovirus
-                    threat_level += 5  # Higher threat for adenovirus
-            
-            # Bacteria vary in threat level
-            elif "bacteria" in org_type:
-                # Beneficial bacteria are not threats
-                if "beneficial" in org_type:
-                    continue
-                    
-                # Basic bacteria threat
-                threat_level += 5  # Increased from 3
-                
-                # Specific bacteria types may have different threat levels
-                if "streptococcus" in org_type or "streptococcus" in org_name:
-                    threat_level += 3  # Increased from 2
-                if "ecoli" in org_type or "ecoli" in org_name:
-                    threat_level += 4  # Added specific threat for EColi
-                if "staphylococcus" in org_type or "staphylococcus" in org_name:
-                    threat_level += 5  # Added specific threat for Staphylococcus
-                if "salmonella" in org_type or "salmonella" in org_name:
-                    threat_level += 5  # Added specific threat for Salmonella
-            
-            # Skip if not a threat
-            if threat_level == 0:
-                continue
-                
-            # Calculate distance
-            dx = self.x - organism.x
-            dy = self.y - organism.y
-            
-            # Account for world wrapping
-            world_width = environment.width
-            world_height = environment.height
-            
-            # Check for shorter path across world boundaries
-            if abs(dx) > world_width / 2:
-                dx = -1 * np.sign(dx) * (world_width - abs(dx))
-            if abs(dy) > world_height / 2:
-                dy = -1 * np.sign(dy) * (world_height - abs(dy))
-                
-            distance = math.sqrt(dx*dx + dy*dy)
+        xs, ys, codes, alive, marked, health_ratio, _ = self._candidate_columns(nearby_organisms, environment)
+        
+        # Filter to living potential targets inside the detection radius with
+        # whole-array masks; the memory lookup and scoring see only these
+        in_range = np.flatnonzero(
+            within_radius(xs - self.x, ys - self.y, self.detection_radius_sq) &
+            (alive != 0) & self._target_code_table[codes])
+        candidates = [nearby_organisms[i] for i in in_range.tolist()]
+        
+        # Remember which organisms passed the filter so interact can reject
+        # everything else without repeating the type and range checks
+        if not candidates:
+            return None
+        keys = [id(organism) for organism in candidates]
+        candidate_keys.update(keys)
+        
+        # Flag remembered candidates for the memory bonus
+        if self.memory:
+            remembered = self.memory.contains_many(keys)
+        else:
+            remembered = _NO_MEMORY
+        
+        # Pick the highest threat in a single fused pass (first candidate on ties); only
+        # the in-range candidates take a square root, for detection_radius / distance
+        best_index, _ = best_threat(
+            self.x, self.y, xs[in_range], ys[in_range], codes[in_range], alive[in_range],
+            marked[in_range], health_ratio[in_range], remembered,
+            self.detection_radius_sq, self._target_code_table, self._THREAT_WEIGHTS,
+            organism_types.IS_VIRUS, self._MARKED_THREAT_BONUS
+        )
+        if best_index < 0:
+            return None
             
-            # Calculate final threat score - prefer closer threats
-            # Modified to give more weight to proximity for faster response
-            proximity_factor = max(0, 1 - distance / self.detection_radius)
-            threat_score = threat_level * (proximity_factor ** 1.5)  # Increased proximity weight
+        target = candidates[best_index]
+        
+        # Get the target type for the visual indicator
+        target_type = type_label(target)
+        
+        # Increase activation level if our target is a virus
+        if organism_tags(target) & TAG_VIRUS:
+            self.activation_level += 2.0
             
-            # Add health factor - prioritize weaker pathogens that can be eliminated quickly
-            if hasattr(organism, 'health'):
-                health_factor = 1.0
-                if organism.health < 50:
-                    health_factor = 1.3  # Prefer targeting already weakened organisms
-                threat_score *= health_factor
-            
-            # Add to threat scores
-            threat_scores.append({
-                'organism': organism,
-                'threat': threat_score,
-                'distance': distance,
-                'type': organism.get_type()
-            })
-            
-        # Sort threats by score (highest first)
-        if threat_scores:
-            threat_scores.sort(key=lambda x: x['threat'], reverse=True)
-            
-            # Return the highest threat organism
-            target = threat_scores[0]['organism']
-            
-            # Get the target type using the same logic as above
-            target_type = ""
-            if hasattr(target, 'get_type'):
-                target_type = target.get_type().capitalize()
-            elif hasattr(target, 'get_name'):
-                target_type = target.get_name()
-            elif hasattr(target, 'type'):
-                target_type = target.type
-            
-            # Increase activation level if our target is a virus
-            if "Virus" in target_type:
-                self.activation_level += 2.0
-            
-            # Set target and return
-            self.target = target
-            self.target_visual_indicator = target_type
-            
-            return target
-        
-        return None
-
+        # Set target and return
+        self.target = target
+        self.target_visual_indicator = target_type
+        
+        return target
+        
     def render(self, screen, camera_x, camera_y, zoom):
         """
         Render the Neutrophil on the screen
@@ -748,13 +1195,17 @@ class Neutrophil(Organism):
         if not self.is_alive:
             return
         
+        # Screen dimensions are read once per call
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        half_w = screen_w * 0.5
+        half_h = screen_h * 0.5
+        
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, half_w, half_h)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Draw the main Neutrophil body
@@ -772,44 +1223,28 @@ class Neutrophil(Organism):
             self.is_active = False
             fill_color = self.color
         
-        # Draw the cell body
-        pygame.draw.circle(screen, fill_color, (screen_x, screen_y), radius)
-        
-        # Draw a darker outline
-        outline_color = (max(0, fill_color[0] - 40), max(0, fill_color[1] - 40), max(0, fill_color[2] - 40))
-        pygame.draw.circle(screen, outline_color, (screen_x, screen_y), radius, 1)
+        # Tiny cells are a pixel or a plain disc with no targeting line
+        if _draw_low_detail(screen, fill_color, screen_x, screen_y, self.size * zoom):
+            return
         
-        # Draw small granules inside (characteristic of neutrophils)
-        if radius > 4:
-            num_granules = min(8, radius // 2)
-            granule_radius = max(1, radius // 5)
-            
-            for i in range(num_granules):
-                angle = 2 * math.pi * i / num_granules
-                distance = radius * 0.6
-                granule_x = screen_x + int(math.cos(angle) * distance)
-                granule_y = screen_y + int(math.sin(angle) * distance)
-                
-                pygame.draw.circle(
-                    screen,
-                    (min(255, fill_color[0] + 20), min(255, fill_color[1] + 20), min(255, fill_color[2] + 20)),
-                    (granule_x, granule_y),
-                    granule_radius
-                )
+        # Draw the cell body with a single blit of the cached sprite
+        if radius <= _SPRITE_MAX_RADIUS:
+            screen.blit(neutrophil_sprite(tuple(fill_color), radius), (screen_x - radius - 1, screen_y - radius - 1))
+        else:
+            _draw_neutrophil_body(screen, tuple(fill_color), (screen_x, screen_y), radius)
         
         # Draw targeting line if pursuing a target
         if self.has_target and self.target_x is not None and self.target_y is not None:
-            target_screen_x = int((self.target_x - camera_x) * zoom + screen.get_width() / 2)
-            target_screen_y = int((self.target_y - camera_y) * zoom + screen.get_height() / 2)
+            target_screen_x = int((self.target_x - camera_x) * zoom + half_w)
+            target_screen_y = int((self.target_y - camera_y) * zoom + half_h)
             
             # Only draw if target is on screen
-            if (0 <= target_screen_x < screen.get_width() and 0 <= target_screen_y < screen.get_height()):
-                pygame.draw.line(
+            if (0 <= target_screen_x < screen_w and 0 <= target_screen_y < screen_h):
+                pygame.gfxdraw.line(
                     screen,
-                    (180, 180, 255, 128),  # Semi-transparent blue
-                    (screen_x, screen_y),
-                    (target_screen_x, target_screen_y),
-                    1
+                    screen_x, screen_y,
+                    target_screen_x, target_screen_y,
+                    (180, 180, 255, 128)  # Semi-transparent blue
                 )
 
 class Macrophage(Neutrophil):
@@ -818,6 +1253,32 @@ class Macrophage(Neutrophil):
     Specialized in detecting and destroying antibody-marked viruses
     """
     
+    __slots__ = ("_phagocytosis_radius", "phagocytosis_radius_sq",
+                 "antibody_detection_bonus", "attack_range", "digesting", "digestion_time",
+                 "engulfing_duration", "engulfing_progress", "engulfing_starting_distance",
+                 "excluded_targets", "marked_damage_multiplier", "marked_target_speed_multiplier",
+                 "max_digestion_time", "structure")
+    
+    # Threat multiplier per organism type code: viruses 2.5 (influenza and
+    # rhinovirus a further 1.5), harmful bacteria 2.0
+    _THREAT_WEIGHTS = np.ones(organism_types.NUM_TYPE_CODES)
+    _THREAT_WEIGHTS[list(organism_types.VIRUS_CODES)] = 2.5
+    _THREAT_WEIGHTS[[organism_types.INFLUENZA, organism_types.RHINOVIRUS]] = 2.5 * 1.5
+    _THREAT_WEIGHTS[list(organism_types.HARMFUL_BACTERIA_CODES)] = 2.0
+    
+    # Antibody-marked viruses are prioritized
+    _MARKED_THREAT_BONUS = 3.0
+    
+    # Base engulf chance for targets that are not antibody-marked, indexed by their
+    # target tag bits; viruses take precedence, then harmful bacteria, then cleanup
+    _ENGULF_CHANCES = tuple(
+        0.25 if bits & TAG_VIRUS else        # Harder to engulf unmarked viruses
+        0.5 if bits & TAG_HARMFUL_BACTERIA else  # Easier to engulf harmful bacteria
+        0.7 if bits & (TAG_DAMAGED | TAG_DEAD) else  # Easy to clean up damaged/dead cells
+        0.4  # Base chance for live pathogens
+        for bits in range(TARGET_MASK + 1)
+    )
+    
     def __init__(self, x, y, size=10, color=(150, 150, 220), speed=0.5):
         """Initialize macrophage with specialized properties"""
         super().__init__(x, y, size, color, speed)
@@ -838,10 +1299,7 @@ class Macrophage(Neutrophil):
         self.potential_targets = ["Virus", "DamagedCell", "DeadCell", "Influenza", "Rhinovirus", "Coronavirus", "Adenovirus", "EColi", "Streptococcus", "Salmonella", "Staphylococcus"]
         
         # Define explicitly excluded targets (will never be engulfed)
-        self.excluded_targets = ["BeneficialBacteria", "Neutrophil", "Macrophage", "TCell", "RedBloodCell", "EpithelialCell", "Platelet"]
-        
-        # Initialize memory for remembering encountered pathogens
-        self.memory = []
+        self.excluded_targets = EXCLUDED_TARGETS
         
         # Enhanced properties for antibody marked viruses
         self.antibody_detection_bonus = 1.5  # Bonus to detection radius for marked viruses
@@ -854,6 +1312,17 @@ class Macrophage(Neutrophil):
         self.engulfing_duration = 30  # How many frames engulfing takes
         self.engulfing_starting_distance = 0  # Initial distance when engulfing started
 
+    @property
+    def phagocytosis_radius(self):
+        """Radius within which the macrophage can engulf pathogens"""
+        return self._phagocytosis_radius
+
+    @phagocytosis_radius.setter
+    def phagocytosis_radius(self, value):
+        # Keep the squared radius in sync so the engulf range check can skip the sqrt
+        self._phagocytosis_radius = value
+        self.phagocytosis_radius_sq = value * value
+
     def update(self, environment):
         """
         Update the Macrophage's state
@@ -861,6 +1330,9 @@ class Macrophage(Neutrophil):
         Args:
             environment: The environment object
         """
+        # Forget pathogens encountered long ago
+        self._forget_expired()
+            
         # Handle digestion process
         if self.digesting:
             self.digestion_time += 1
@@ -887,12 +1359,16 @@ class Macrophage(Neutrophil):
             
             # If engulfing is complete
             if self.engulfing_progress >= 1.0:
-                # Record the engulfed pathogen
+                # Record the engulfed pathogen, preferring its type attribute over get_type()
+                engulfed = self.engulfing_target
+                pathogen_type = getattr(engulfed, 'type', None)
+                if pathogen_type is None:
+                    get_type = getattr(engulfed, 'get_type', None)
+                    pathogen_type = get_type() if get_type is not None else "Unknown"
                 self.engulfed_pathogens.append({
-                    "type": self.engulfing_target.type if hasattr(self.engulfing_target, 'type') else 
-                           self.engulfing_target.get_type() if hasattr(self.engulfing_target, 'get_type') else "Unknown",
-                    "size": self.engulfing_target.size,
-                    "color": self.engulfing_target.color if hasattr(self.engulfing_target, 'color') else (150, 50, 50)
+                    "type": pathogen_type,
+                    "size": engulfed.size,
+                    "color": getattr(engulfed, 'color', (150, 50, 50))
                 })
                 
                 # Set target to not alive
@@ -930,7 +1406,7 @@ class Macrophage(Neutrophil):
             # Move target toward us based on progress
             dx = self.x - self.engulfing_target.x
             dy = self.y - self.engulfing_target.y
-            current_distance = (dx**2 + dy**2)**0.5
+            current_distance = math.hypot(dx, dy)
             
             if current_distance > 0:
                 # Gradually move target closer
@@ -954,111 +1430,7 @@ class Macrophage(Neutrophil):
         Returns:
             The target organism if found, None otherwise
         """
-        # Use provided organisms instead of fetching from environment
-        nearby_organisms = organisms
-        
-        if not nearby_organisms:
-            return None
-            
-        # List of organism types that should be skipped (not targeted)
-        exempt_types = [
-            "neutrophil", "macrophage", "tcell", "t_cell", "t-cell", 
-            "blood_cell", "red_blood_cell", "redbloodcell", "whitebloodcell",
-            "white_blood_cell", "platelet", "epithelialcell", "epithelial_cell",
-            "beneficialbacteria", "beneficial_bacteria"
-        ]
-            
-        # Calculate threat scores
-        threats = []
-        for organism in nearby_organisms:
-            # Skip self, dead organisms, and non-threats
-            if organism == self or not organism.is_alive:
-                continue
-                
-            # Get the organism type, using methods or attributes as available
-            organism_type = ""
-            if hasattr(organism, 'get_type'):
-                organism_type = organism.get_type()
-            elif hasattr(organism, 'get_name'):
-                organism_type = organism.get_name()
-            elif hasattr(organism, 'type'):
-                organism_type = organism.type
-                
-            for target_type in self.potential_targets:
-                if target_type in organism_type:
-                    is_potential_target = True
-                    break
-            
-            if not is_potential_target:
-                continue
-            
-            # Calculate distance
-            dx = organism.x - self.x
-            dy = organism.y - self.y
-            distance = (dx**2 + dy**2)**0.5
-            
-            # Skip if beyond detection radius
-            if distance > self.detection_radius:
-                continue
-            
-            # Base threat score on proximity and type
-            threat_score = self.detection_radius / max(1, distance)
-            
-            # Increase threat for harmful pathogens
-            if "virus" in organism_type.lower():
-                threat_score *= 2.5
-                
-                # Additional weighting for specific virus types
-                if "influenza" in organism_type.lower():
-                    threat_score *= 1.5
-                if "rhinovirus" in organism_type.lower():
-                    threat_score *= 1.5
-                    
-                # Antibody marked viruses are prioritized
-                if hasattr(organism, 'antibody_marked') and organism.antibody_marked:
-                    threat_score *= 3.0
-                    
-            elif "bacteria" in organism_type.lower() and "beneficial" not in organism_type.lower():
-                threat_score *= 2.0
-                    
-            # Increase threat for remembered targets
-            if id(organism) in self.memory:
-                threat_score *= 2.0
-                
-            # Increase threat if organism is damaged
-            if hasattr(organism, 'health') and hasattr(organism, 'max_health') and organism.health < organism.max_health * 0.7:
-                threat_score *= 1.3
-                
-            threats.append((organism, threat_score))
-            
-        # No threats found
-        if not threats:
-            return None
-            
-        # Sort by threat score (highest first)
-        threats.sort(key=lambda x: x[1], reverse=True)
-        
-        # Select the highest threat
-        target = threats[0][0]
-        
-        # Get the target type using the same logic as above
-        target_type = ""
-        if hasattr(target, 'get_type'):
-            target_type = target.get_type().capitalize()
-        elif hasattr(target, 'get_name'):
-            target_type = target.get_name()
-        elif hasattr(target, 'type'):
-            target_type = target.type
-        
-        # Increase activation level if our target is a virus
-        if "Virus" in target_type:
-            self.activation_level += 2.0
-            
-        # Set target and return
-        self.target = target
-        self.target_visual_indicator = target_type
-        
-        return target
+        return self._scan_threats(organisms, environment)
         
     def interact(self, organism, environment):
         """Interact with another organism, potentially engulfing it"""
@@ -1070,109 +1442,58 @@ class Macrophage(Neutrophil):
         if len(self.engulfed_pathogens) >= self.max_engulf_capacity:
             return False
         
-        # Get organism type information
-        org_type = None
-        org_name = None
-        
-        if hasattr(organism, 'type'):
-            org_type = organism.type
-        elif hasattr(organism, 'get_type') and callable(getattr(organism, 'get_type')):
-            org_type = organism.get_type()
-        else:
+        # Skip friendly or immune cells, and anything that is not a pathogen
+        # or a damaged/dead cell we should clean up
+        tags = organism_tags(organism)
+        if tags & EXEMPT_MASK or not tags & TARGET_MASK:
             return False
-            
-        if hasattr(organism, 'get_name') and callable(getattr(organism, 'get_name')):
-            org_name = organism.get_name()
-            
-        # Skip non-target organisms
-        is_target = False
         
-        # List of organism types that should be skipped
-        exempt_types = [
-            "neutrophil", "macrophage", "tcell", "t_cell", "t-cell", 
-            "blood_cell", "red_blood_cell", "redbloodcell", "whitebloodcell",
-            "white_blood_cell", "platelet", "epithelialcell", "epithelial_cell",
-            "beneficialbacteria", "beneficial_bacteria"
-        ]
-        
-        # Skip friendly or immune cells
-        if org_type.lower() in exempt_types:
+        # Pathogens this tick's scan did not see in range are out of reach too
+        if (not tags & (TAG_DAMAGED | TAG_DEAD) and self._scan_candidates_cache is not None
+                and id(organism) not in self._scan_candidates_cache):
             return False
             
-        if org_name and org_name.lower() in exempt_types:
-            return False
-        
-        # Check if this is a pathogen or damaged cell we should target
-        if ("virus" in org_type.lower()):
-            is_target = True
-        elif ("bacteria" in org_type.lower() and "beneficial" not in org_type.lower()):
-            is_target = True
-        elif ("damaged" in org_type.lower()):
-            is_target = True
-        elif ("dead" in org_type.lower()):
-            is_target = True
-        
-        # Also check the name
-        if org_name and ("virus" in org_name.lower()):
-            is_target = True
-        elif org_name and ("bacteria" in org_name.lower() and "beneficial" not in org_name.lower()):
-            is_target = True
-        elif org_name and ("damaged" in org_name.lower()):
-            is_target = True
-        elif org_name and ("dead" in org_name.lower()):
-            is_target = True
-        
-        # Also check if the organism's name is explicitly in our potential_targets list
-        if org_name and hasattr(self, 'potential_targets') and org_name in self.potential_targets:
-            is_target = True
-            
-        # If not a valid target, skip
-        if not is_target:
-            return False
-            
-        # Calculate distance
+        # Calculate squared distance
         dx = organism.x - self.x
         dy = organism.y - self.y
-        distance = (dx**2 + dy**2)**0.5
-        
+        distance_sq = dx*dx + dy*dy
+
         # Check if within engulfing range
-        if distance <= self.phagocytosis_radius:
-            # Higher success rate for antibody-marked viruses
-            engulf_chance = 0.4  # Base chance for live pathogens
+        if distance_sq <= self.phagocytosis_radius_sq:
+            # Higher success rate for antibody-marked viruses; otherwise the
+            # chance for the target's type is a single table lookup
             damage_amount = self.attack_strength
-            
-            # Modify for different target types
-            if hasattr(organism, 'antibody_marked') and organism.antibody_marked:
+            if getattr(organism, 'antibody_marked', False):
                 engulf_chance = 0.8  # Better chance for marked viruses
                 damage_amount *= self.marked_damage_multiplier
-            elif "virus" in org_type.lower():
-                engulf_chance = 0.25  # Harder to engulf unmarked viruses
-            elif "bacteria" in org_type.lower() and "beneficial" not in org_type.lower():
-                engulf_chance = 0.5  # Easier to engulf harmful bacteria
-            elif "damaged" in org_type.lower() or "dead" in org_type.lower():
-                engulf_chance = 0.7  # Easy to clean up damaged/dead cells
+            else:
+                engulf_chance = self._ENGULF_CHANCES[tags & TARGET_MASK]
             
             # Already weak organisms are easier to engulf
-            if hasattr(organism, 'health') and hasattr(organism, 'max_health'):
-                health_ratio = organism.health / organism.max_health
-                if health_ratio < 0.5:
-                    engulf_chance += (1 - health_ratio) * 0.5  # Up to 50% bonus for weak organisms
+            has_health = hasattr(organism, 'health')
+            if has_health:
+                health = organism.health
+                if hasattr(organism, 'max_health'):
+                    health_ratio = health / organism.max_health
+                    if health_ratio < 0.5:
+                        engulf_chance += (1 - health_ratio) * 0.5  # Up to 50% bonus for weak organisms
+                
+                # Apply damage first (whether engulfing succeeds or not)
+                organism.health = health - damage_amount
             
-            # Apply damage first (whether engulfing succeeds or not)
-            if hasattr(organism, 'health'):
-                organism.health -= damage_amount
+            # Remember this pathogen for future scans
+            self._remember(organism)
             
             # Try to engulf
             if random.random() < engulf_chance:
                 # Start engulfing process
                 self.engulfing_target = organism
                 self.engulfing_progress = 0
-                self.engulfing_starting_distance = distance
+                self.engulfing_starting_distance = math.sqrt(distance_sq)
                 return True
-            else:
+            elif has_health:
                 # Damage even if engulfing fails (but less)
-                if hasattr(organism, 'health'):
-                    organism.health -= damage_amount * 0.5
+                organism.health -= damage_amount * 0.5
         
         return False
         
@@ -1189,129 +1510,110 @@ class Macrophage(Neutrophil):
         if not self.is_alive:
             return
         
+        # Screen dimensions are read once per call
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        half_w = screen_w * 0.5
+        half_h = screen_h * 0.5
+        
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, half_w, half_h)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Draw the main Macrophage body
         radius = max(2, int(self.size * zoom))
         
-        # Base color varies by digestion state
+        # Sample the clock once per frame for all animation
+        now = pygame.time.get_ticks()
+        
+        # Base color varies by digestion state, pulsing through precomputed gradients
         if self.digesting:
             # Darker and more purple when digesting
-            fill_color = (130, 100, 220)
-            digestion_progress = self.digestion_time / self.max_digestion_time
-            # Pulse effect during digestion
-            pulse = (math.sin(pygame.time.get_ticks() * 0.01) + 1) * 0.25 + 0.5
-            fill_color = (
-                int(fill_color[0] * (0.8 + pulse * 0.2)),
-                int(fill_color[1] * (0.8 + pulse * 0.2)),
-                int(fill_color[2] * (0.8 + pulse * 0.2))
-            )
+            fill_color = _DIGESTING_GRADIENT[_pulse_index(now * 0.01)]
         elif self.engulfing_target:
             # More active color during engulfing
-            pulse = (math.sin(pygame.time.get_ticks() * 0.02) + 1) * 0.5
-            fill_color = (
-                min(255, int(self.color[0] * (1 + pulse * 0.3))),
-                min(255, int(self.color[1] * (1 + pulse * 0.1))),
-                min(255, int(self.color[2] * (1 + pulse * 0.1)))
-            )
+            fill_color = _engulfing_gradient(tuple(self.color))[_pulse_index(now * 0.02)]
         else:
             fill_color = self.color
             
-        # Draw main cell body
-        pygame.draw.circle(screen, fill_color, (screen_x, screen_y), radius)
-        
+        # Tiny cells skip pseudopods and engulfed pathogen markers
+        if _draw_low_detail(screen, fill_color, screen_x, screen_y, self.size * zoom):
+            return
+            
         # Draw extending pseudopods during engulfing
         if self.engulfing_target:
-            target_screen_x = int((self.engulfing_target.x - camera_x) * zoom + screen.get_width() / 2)
-            target_screen_y = int((self.engulfing_target.y - camera_y) * zoom + screen.get_height() / 2)
-            
-            # Draw multiple pseudopods extending toward the target
-            num_pseudopods = 5
-            for i in range(num_pseudopods):
-                # Calculate offset from direct line
-                offset_angle = (i / num_pseudopods) * math.pi - math.pi/2
-                
-                # Get angle to target
-                angle_to_target = math.atan2(target_screen_y - screen_y, target_screen_x - screen_x)
-                
-                # Calculate pseudopod length based on engulfing progress
-                progress = self.engulfing_progress
-                max_length = radius * 3 * (1 - progress)
-                
+            # Draw main cell body
+            pygame.draw.circle(screen, fill_color, (screen_x, screen_y), radius)
+            
+            target_screen_x, target_screen_y = _target_screen_position(
+                self.engulfing_target, camera_x, camera_y, zoom, half_w, half_h)
+            
+            # Angle, distance and pseudopod shape are the same for every pseudopod
+            target_dx = target_screen_x - screen_x
+            target_dy = target_screen_y - screen_y
+            angle_to_target = math.atan2(target_dy, target_dx)
+            distance_to_target = math.hypot(target_dx, target_dy)
+            
+            # Calculate pseudopod length based on engulfing progress
+            progress = self.engulfing_progress
+            max_length = radius * 3 * (1 - progress)
+            end_length = min(max_length, distance_to_target * 0.8)
+            width = max(1, int(radius * 0.25 * (1 - 0.5 * progress)))
+            
+            # Draw multiple pseudopods extending toward the target, each offset from the direct line
+            for offset_angle in _ENGULF_PSEUDOPOD_OFFSETS:
                 # Start points on macrophage surface
                 start_angle = angle_to_target + offset_angle * (1 - progress)
-                start_x = screen_x + int(radius * math.cos(start_angle))
-                start_y = screen_y + int(radius * math.sin(start_angle))
+                start_x = screen_x + int(radius * fcos(start_angle))
+                start_y = screen_y + int(radius * fsin(start_angle))
                 
                 # End points toward target
-                distance_to_target = ((target_screen_x - screen_x)**2 + (target_screen_y - screen_y)**2)**0.5
-                end_length = min(max_length, distance_to_target * 0.8)
-                end_x = start_x + int(end_length * math.cos(angle_to_target + offset_angle * 0.3))
-                end_y = start_y + int(end_length * math.sin(angle_to_target + offset_angle * 0.3))
+                end_x = start_x + int(end_length * fcos(angle_to_target + offset_angle * 0.3))
+                end_y = start_y + int(end_length * fsin(angle_to_target + offset_angle * 0.3))
                 
                 # Draw pseudopod
-                width = max(1, int(radius * 0.25 * (1 - 0.5 * progress)))
-                pygame.draw.line(screen, fill_color, (start_x, start_y), (end_x, end_y), width)
+                if width == 1:
+                    pygame.gfxdraw.line(screen, start_x, start_y, end_x, end_y, fill_color)
+                else:
+                    pygame.draw.line(screen, fill_color, (start_x, start_y), (end_x, end_y), width)
                 
                 # Draw bulge at end of pseudopod
-                pygame.draw.circle(screen, fill_color, (end_x, end_y), width)
+                pygame.gfxdraw.filled_circle(screen, end_x, end_y, width, fill_color)
         else:
-            # Draw normal pseudopods (little arm-like extensions)
-            num_pseudopods = 8
-            pseudopod_length = int(radius * 0.3)
-            for i in range(num_pseudopods):
-                angle = i * (2 * math.pi / num_pseudopods)
-                
-                # Add some wiggle to the pseudopods
-                wiggle = math.sin(pygame.time.get_ticks() * 0.01 + i) * 20
-                
-                # Pseudopod position
-                pseudopod_x = screen_x + int((radius + pseudopod_length) * math.cos(angle + wiggle * 0.01))
-                pseudopod_y = screen_y + int((radius + pseudopod_length) * math.sin(angle + wiggle * 0.01))
-                
-                # Draw pseudopod
-                pygame.draw.line(
-                    screen,
-                    fill_color,
-                    (screen_x + int(radius * math.cos(angle)), screen_y + int(radius * math.sin(angle))),
-                    (pseudopod_x, pseudopod_y),
-                    max(1, int(radius * 0.2))
-                )
+            # Resting body and pseudopods come from a cached sprite when small enough
+            step = _wiggle_step(now)
+            if radius <= _SPRITE_MAX_RADIUS:
+                sprite = macrophage_sprite(tuple(fill_color), radius, step)
+                half = sprite.get_width() // 2
+                screen.blit(sprite, (screen_x - half, screen_y - half))
+            else:
+                _draw_macrophage_body(screen, fill_color, (screen_x, screen_y), radius, step)
             
         # Show engulfed pathogens as smaller circles inside
         if self.engulfed_pathogens:
             # Draw small circles inside to represent engulfed pathogens
-            for i, pathogen in enumerate(self.engulfed_pathogens):
+            count = len(self.engulfed_pathogens)
+            dirs = _GRANULE_DIRS.get(count) or tuple(
+                (math.cos(2 * math.pi * i / count), math.sin(2 * math.pi * i / count)) for i in range(count))
+            offset = radius * 0.5
+            marker_scale = zoom * 0.3
+            for pathogen, (cos_a, sin_a) in zip(self.engulfed_pathogens, dirs):
                 # Position inside the cell
-                angle = i * (2 * math.pi / len(self.engulfed_pathogens))
-                offset = radius * 0.5
+                pathogen_x = screen_x + int(offset * cos_a)
+                pathogen_y = screen_y + int(offset * sin_a)
                 
-                pathogen_x = screen_x + int(offset * math.cos(angle))
-                pathogen_y = screen_y + int(offset * math.sin(angle))
-                
-                # Determine color based on pathogen type
-                if "color" in pathogen:
-                    pathogen_color = pathogen["color"]
-                elif "Virus" in pathogen["type"]:
-                    pathogen_color = (150, 50, 50)  # Red for viruses
-                elif "Bacteria" in pathogen["type"]:
-                    pathogen_color = (50, 150, 50)  # Green for bacteria
-                else:
-                    pathogen_color = (100, 100, 100)  # Gray for others
+                # Recorded pathogens carry their own color; others are colored by type once per type
+                pathogen_color = pathogen.get("color") or _engulfed_marker_color(pathogen["type"])
                     
                 # Draw engulfed pathogen
                 pygame.draw.circle(
                     screen,
                     pathogen_color,
                     (pathogen_x, pathogen_y),
-                    max(1, int(pathogen["size"] * zoom * 0.3))
+                    max(1, int(pathogen["size"] * marker_scale))
                 )
 
     def get_type(self):
@@ -1324,12 +1626,27 @@ class TCell(Neutrophil):
     Fires antibodies to mark viruses for destruction by other immune cells
     """
     
+    __slots__ = ("_timer_slot", "antibody_energy_cost", "antibody_range", "antibody_strength",
+                 "attack_range", "max_antibody_cooldown", "max_attack_cooldown", "structure")
+    
+    # Threat multiplier per organism type code: viruses 2.5 (influenza and
+    # rhinovirus a further 1.5)
+    _THREAT_WEIGHTS = np.ones(organism_types.NUM_TYPE_CODES)
+    _THREAT_WEIGHTS[list(organism_types.VIRUS_CODES)] = 2.5
+    _THREAT_WEIGHTS[[organism_types.INFLUENZA, organism_types.RHINOVIRUS]] = 2.5 * 1.5
+    
+    # Antibody-marked viruses are less of a priority (already handled)
+    _MARKED_THREAT_BONUS = 0.3
+    
     def __init__(self, x, y, size=8, color=(100, 180, 255), speed=0.8):
         """Initialize T-Cell with specialized properties"""
         super().__init__(x, y, size, color, speed)
+        
+        # Cooldowns live in the shared timer table, which counts them down once per tick
+        self._timer_slot = IMMUNE_TIMERS.allocate(self)
+        
         self.activation_level = 0
         self.activation_threshold = 50
-        self.memory = {}  # remembers pathogens
         self.type = "TCell"
         self.structure = "cell"
         self.attack_range = self.size * 1.5
@@ -1351,6 +1668,24 @@ class TCell(Neutrophil):
         self.antibody_range = self.detection_radius * 0.8  # Slightly less than detection range
         self.antibody_strength = 0.3  # Initial antibody level when marking
 
+    @property
+    def attack_cooldown(self):
+        """Ticks until the T-Cell can attack again"""
+        return int(IMMUNE_TIMERS.cooldowns["attack_cooldown"][self._timer_slot])
+
+    @attack_cooldown.setter
+    def attack_cooldown(self, value):
+        IMMUNE_TIMERS.cooldowns["attack_cooldown"][self._timer_slot] = value
+
+    @property
+    def antibody_production_cooldown(self):
+        """Ticks until the T-Cell can fire antibodies again"""
+        return int(IMMUNE_TIMERS.cooldowns["antibody_cooldown"][self._timer_slot])
+
+    @antibody_production_cooldown.setter
+    def antibody_production_cooldown(self, value):
+        IMMUNE_TIMERS.cooldowns["antibody_cooldown"][self._timer_slot] = value
+
     def update(self, environment):
         """
         Update the T-Cell's state
@@ -1370,48 +1705,28 @@ class TCell(Neutrophil):
             self.color = (100, 180, 255)
             self.speed = self.base_speed
             
-        # Decrease attack cooldown
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
-        
-        # Decrease antibody production cooldown
-        if self.antibody_production_cooldown > 0:
-            self.antibody_production_cooldown -= 1
+        # Attack and antibody cooldowns are counted down for all T-Cells at
+        # once by IMMUNE_TIMERS.tick() in the simulation loop
             
         # Update memory - remove expired entries
-        expired_targets = []
-        for target_id, memory_data in self.memory.items():
-            memory_data["time"] -= 1
-            if memory_data["time"] <= 0:
-                expired_targets.append(target_id)
-                
-        for target_id in expired_targets:
-            del self.memory[target_id]
+        self._forget_expired()
             
         # If we have a target and it's a virus, try to create antibodies
         if (self.target and 
             self.target.is_alive):
             
-            # Get target type safely
-            target_type = ""
-            if hasattr(self.target, 'get_type'):
-                target_type = self.target.get_type()
-            elif hasattr(self.target, 'type'):
-                target_type = self.target.type
-                
             # Continue only if it's a virus and we have enough energy
-            if ("Virus" in target_type and
+            if (organism_tags(self.target) & TAG_VIRUS and
                 self.antibody_production_cooldown <= 0 and
                 self.energy >= self.antibody_energy_cost and
                 self.activation_level >= self.activation_threshold):
             
-                # Calculate distance to target
+                # Calculate squared distance to target
                 dx = self.target.x - self.x
                 dy = self.target.y - self.y
-                distance = math.sqrt(dx**2 + dy**2)
                 
                 # If within range, fire antibodies
-                if distance <= self.antibody_range:
+                if dx*dx + dy*dy <= self.antibody_range * self.antibody_range:
                     self._fire_antibodies(self.target)
                 
         # Call parent update
@@ -1440,12 +1755,7 @@ class TCell(Neutrophil):
             self.energy -= self.antibody_energy_cost
             
             # Add the target to memory
-            self.memory[id(target_organism)] = {
-                "type": target_organism.get_type() if hasattr(target_organism, 'get_type') else getattr(target_organism, 'type', 'Unknown'),
-                "time": self.memory_duration,
-                "last_x": target_organism.x,
-                "last_y": target_organism.y
-            }
+            self._remember(target_organism)
             
             # Increase activation level - we've detected a threat
             self.activation_level += 10
@@ -1464,103 +1774,7 @@ class TCell(Neutrophil):
         Returns:
             The target organism if found, None otherwise
         """
-        # Use provided organisms instead of fetching from environment
-        nearby_organisms = organisms
-        
-        if not nearby_organisms:
-            return None
-            
-        # Calculate threat scores
-        threats = []
-        for organism in nearby_organisms:
-            # Skip self, dead organisms, and non-threats
-            if organism == self or not organism.is_alive:
-                continue
-                
-            # Check if organism is a potential target
-            is_potential_target = False
-            
-            # Get the organism type, using methods or attributes as available
-            organism_type = ""
-            if hasattr(organism, 'get_type'):
-                organism_type = organism.get_type().capitalize()
-            elif hasattr(organism, 'get_name'):
-                organism_type = organism.get_name()
-            elif hasattr(organism, 'type'):
-                organism_type = organism.type
-                
-            for target_type in self.potential_targets:
-                if target_type in organism_type:
-                    is_potential_target = True
-                    break
-            
-            if not is_potential_target:
-                continue
-                
-            # Calculate distance
-            dx = organism.x - self.x
-            dy = organism.y - self.y
-            distance = (dx**2 + dy**2)**0.5
-            
-            # Skip if beyond detection radius
-            if distance > self.detection_radius:
-                continue
-            
-            # Base threat score on proximity and type
-            threat_score = self.detection_radius / max(1, distance)
-            
-            # Increase threat for recognized targets
-            if "Virus" in organism_type:
-                threat_score *= 2.5
-                
-                # Additional weighting for specific virus types
-                if "Influenza" in organism_type:
-                    threat_score *= 1.5
-                if "Rhinovirus" in organism_type:
-                    threat_score *= 1.5
-                    
-                # Antibody marked viruses are less of a priority (already handled)
-                if hasattr(organism, 'antibody_marked') and organism.antibody_marked:
-                    threat_score *= 0.3
-                    
-            # Increase threat for remembered targets
-            if id(organism) in self.memory:
-                threat_score *= 2.0
-                
-            # Increase threat if organism is damaged
-            if hasattr(organism, 'health') and hasattr(organism, 'max_health') and organism.health < organism.max_health * 0.7:
-                threat_score *= 1.3
-                
-            threats.append((organism, threat_score))
-            
-        # No threats found
-        if not threats:
-            return None
-            
-        # Sort by threat score (highest first)
-        threats.sort(key=lambda x: x[1], reverse=True)
-        
-        # Select the highest threat
-        target = threats[0][0]
-        
-        # Get the target type using the same logic as above
-        target_type = ""
-        if hasattr(target, 'get_type'):
-            target_type = target.get_type().capitalize()
-        elif hasattr(target, 'get_name'):
-            target_type = target.get_name()
-        elif hasattr(target, 'type'):
-            target_type = target.type
-        
-        # Increase activation level if our target is a virus
-        if "Virus" in target_type:
-            self.activation_level += 2.0
-            
-        # Set target and return
-        self.target = target
-        self.target_visual_indicator = target_type
-        
-        return target
+        return self._scan_threats(organisms, environment)
         
     def interact(self, organism, environment):
         """
@@ -1577,64 +1791,46 @@ class TCell(Neutrophil):
         if self.attack_cooldown > 0:
             return False
             
-        # Check if organism is a target type
-        is_target = False
-        
-        # Get organism type safely
-        organism_type = None
-        if hasattr(organism, 'get_type'):
-            organism_type = organism.get_type()
-        elif hasattr(organism, 'type'):
-            organism_type = organism.type
-        else:
-            organism_type = "Unknown"
+        # Anything this tick's scan did not see in range is not a target
+        if self._scan_candidates_cache is not None and id(organism) not in self._scan_candidates_cache:
+            return False
             
-        for target_type in self.potential_targets:
-            if target_type in organism_type:
-                is_target = True
-                break
-        
-        if not is_target:
+        # Check if organism is a target type (resolved once for the whole interaction)
+        code, tags = type_info_of(organism)
+        if not (1 << code) & self.potential_mask:
             return False
+        is_virus = tags & TAG_VIRUS
             
-        # Calculate distance
+        # Calculate squared distance
         dx = organism.x - self.x
         dy = organism.y - self.y
-        distance = (dx**2 + dy**2)**0.5
         
         # If within attack range, attack
-        if distance <= self.attack_range:
+        attack_range = self.attack_range
+        if dx*dx + dy*dy <= attack_range * attack_range:
             # Increase activation on successful attack
-            self.activation_level += 5.0
+            activation_level = self.activation_level + 5.0
+            self.activation_level = activation_level
             
             # Double damage for active T-Cells against targets
-            damage_multiplier = 2.0 if self.activation_level >= self.activation_threshold else 1.0
+            damage_multiplier = 2.0 if activation_level >= self.activation_threshold else 1.0
             
             # Apply damage to target
             if hasattr(organism, 'health'):
-                # Get organism type safely
-                organism_type = organism.get_type() if hasattr(organism, 'get_type') else getattr(organism, 'type', 'Unknown')
-                
                 # Double damage to virus targets
-                if "Virus" in organism_type:
+                if is_virus:
                     organism.health -= self.attack_strength * damage_multiplier * 2.0
                 else:
                     organism.health -= self.attack_strength * damage_multiplier
                     
             # Add to memory
-            self.memory[id(organism)] = {
-                "type": organism.get_type() if hasattr(organism, 'get_type') else getattr(organism, 'type', 'Unknown'),
-                "time": self.memory_duration,
-                "last_x": organism.x,
-                "last_y": organism.y
-            }
+            self._remember(organism)
             
             # Set cooldown
-            self.attack_cooldown = max(5, self.max_attack_cooldown - int(self.activation_level / 10))
+            self.attack_cooldown = max(5, self.max_attack_cooldown - int(activation_level / 10))
             
             # Try to fire antibodies if it's a virus
-            organism_type = organism.get_type() if hasattr(organism, 'get_type') else getattr(organism, 'type', 'Unknown')
-            if "Virus" in organism_type and self.antibody_production_cooldown <= 0:
+            if is_virus and self.antibody_production_cooldown <= 0:
                 self._fire_antibodies(organism)
                 
             return True
@@ -1654,73 +1850,119 @@ class TCell(Neutrophil):
         if not self.is_alive:
             return
         
+        # Screen dimensions are read once per call
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        half_w = screen_w * 0.5
+        half_h = screen_h * 0.5
+        
         # Calculate screen position
-        screen_x = int((self.x - camera_x) * zoom + screen.get_width() / 2)
-        screen_y = int((self.y - camera_y) * zoom + screen.get_height() / 2)
+        screen_x, screen_y = self.screen_position(camera_x, camera_y, zoom, half_w, half_h)
         
         # Skip if off screen
-        if (screen_x < -50 or screen_x > screen.get_width() + 50 or
-            screen_y < -50 or screen_y > screen.get_height() + 50):
+        if not (-50 <= screen_x <= screen_w + 50 and -50 <= screen_y <= screen_h + 50):
             return
         
         # Set color based on activation
-        if self.activation_level >= self.activation_threshold:
-            cell_color = self.active_color
-            
-            # Draw activation aura when highly activated
+        activated = self.activation_level >= self.activation_threshold
+        cell_color = self.active_color if activated else self.color
+        
+        # Tiny cells skip the aura, nucleus and targeting line
+        if _draw_low_detail(screen, cell_color, screen_x, screen_y, self.size * zoom):
+            return
+        
+        # Draw activation aura when highly activated
+        if activated:
             aura_radius = int(self.size * zoom * (1.2 + 0.4 * min(1.0, self.activation_level / 100)))
             aura_opacity = min(200, int(100 + self.activation_level))
-            aura_surface = pygame.Surface((aura_radius * 2, aura_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                aura_surface, 
-                (*self.active_color[:3], aura_opacity), 
-                (aura_radius, aura_radius), 
-                aura_radius
-            )
+            aura_surface = aura_sprite(self.active_color, aura_radius, aura_opacity)
+            aura_radius = aura_surface.get_width() // 2
             screen.blit(aura_surface, (screen_x - aura_radius, screen_y - aura_radius))
-        else:
-            cell_color = self.color
             
-        # Draw the main T-Cell body
+        # Draw the main T-Cell body with its dark blue nucleus
         radius = max(2, int(self.size * zoom))
-        pygame.draw.circle(screen, cell_color, (screen_x, screen_y), radius)
-        
-        # Draw a dark blue nucleus
-        nucleus_radius = max(1, int(radius * 0.5))
-        pygame.draw.circle(screen, (20, 50, 120), (screen_x, screen_y), nucleus_radius)
+        _blit_tcell_body(screen, cell_color, screen_x, screen_y, radius)
         
         # Draw a line to target if we have one
         if self.target and self.target.is_alive:
-            target_screen_x = int((self.target.x - camera_x) * zoom + screen.get_width() / 2)
-            target_screen_y = int((self.target.y - camera_y) * zoom + screen.get_height() / 2)
+            target_screen_x, target_screen_y = _target_screen_position(
+                self.target, camera_x, camera_y, zoom, half_w, half_h)
             
             # Draw a line to show targeting
-            if self.activation_level >= self.activation_threshold:
+            if activated:
                 # Animated targeting line for activated cells
-                line_segments = 8
-                for i in range(line_segments):
-                    if i % 2 == 0:  # Draw every other segment
-                        start_pct = i / line_segments
-                        end_pct = (i + 1) / line_segments
-                        
-                        start_x = screen_x + int((target_screen_x - screen_x) * start_pct)
-                        start_y = screen_y + int((target_screen_y - screen_y) * start_pct)
-                        end_x = screen_x + int((target_screen_x - screen_x) * end_pct)
-                        end_y = screen_y + int((target_screen_y - screen_y) * end_pct)
-                        
-                        pygame.draw.line(
-                            screen,
-                            (150, 210, 255), 
-                            (start_x, start_y), 
-                            (end_x, end_y), 
-                            max(1, int(zoom))
-                        )
-                else:
-                    # Simple line for non-activated cells
+                line_dx = target_screen_x - screen_x
+                line_dy = target_screen_y - screen_y
+                line_width = max(1, int(zoom))
+                for start_pct, end_pct in _TARGET_LINE_DASHES:
                     pygame.draw.line(
+                        screen,
+                        (150, 210, 255), 
+                        (screen_x + int(line_dx * start_pct), screen_y + int(line_dy * start_pct)), 
+                        (screen_x + int(line_dx * end_pct), screen_y + int(line_dy * end_pct)), 
+                        line_width
+                    )
+            else:
+                # Simple line for non-activated cells
+                pygame.draw.line(
                     screen,
                     (150, 210, 255, 128), 
                     (screen_x, screen_y),
                     (target_screen_x, target_screen_y),
                     max(1, int(zoom * 0.5))
-                ) 
\ No newline at end of file
+                ) 
+    @classmethod
+    def render_batch(cls, cells, screen, camera_x, camera_y, zoom):
+        """
+        Render many T-Cells through one draw path
+        
+        Screen positions and radii are projected for every cell at once; idle
+        cells (not activated, no target) are stamped from the shared body sprite
+        in a single blits call, then activated, targeting, tiny or oversized
+        cells take the full render on top of them.
+        
+        Args:
+            cells (list): T-Cells to render
+            screen: pygame screen surface
+            camera_x (float): Camera x position
+            camera_y (float): Camera y position
+            zoom (float): Zoom level
+        """
+        count = len(cells)
+        if not count:
+            return
+        screen_w = screen.get_width()
+        screen_h = screen.get_height()
+        
+        xs = np.fromiter((cell.x for cell in cells), dtype=float, count=count)
+        ys = np.fromiter((cell.y for cell in cells), dtype=float, count=count)
+        true_radii = np.fromiter((cell.size for cell in cells), dtype=float, count=count) * zoom
+        
+        # Same projection and truncation as screen_position
+        screen_xs = ((xs - camera_x) * zoom + screen_w * 0.5).astype(np.int64)
+        screen_ys = ((ys - camera_y) * zoom + screen_h * 0.5).astype(np.int64)
+        radii = np.maximum(2, true_radii.astype(np.int64))
+        on_screen = ((screen_xs >= -50) & (screen_xs <= screen_w + 50) &
+                     (screen_ys >= -50) & (screen_ys <= screen_h + 50))
+        plain = (true_radii >= _LOD_DETAIL_RADIUS) & (radii <= _SPRITE_MAX_RADIUS)
+        
+        screen_xs = screen_xs.tolist()
+        screen_ys = screen_ys.tolist()
+        radii = radii.tolist()
+        plain = plain.tolist()
+        stamps = []
+        detailed = []
+        for i in np.flatnonzero(on_screen).tolist():
+            cell = cells[i]
+            if not cell.is_alive:
+                continue
+            if (not plain[i] or cell.activation_level >= cell.activation_threshold or
+                    (cell.target and cell.target.is_alive)):
+                detailed.append(cell)
+                continue
+            radius = radii[i]
+            stamps.append((tcell_sprite(cell.color, radius),
+                           (screen_xs[i] - radius - 1, screen_ys[i] - radius - 1)))
+        screen.blits(stamps, doreturn=False)
+        for cell in detailed:
+            cell.render(screen, camera_x, camera_y, zoom)
@@ -6,7 +6,6 @@ Implements the Neutrophil class, representing immune system cells
 import numpy as np
 from src.organisms.organism import Organism
 import math
-import time
 import random
 import pygame
 
@@ -259,10 +258,8 @@ class Neutrophil(Organism):
             if abs(dy) > world_height / 2:
                 dy = -1 * np.sign(dy) * (world_height - abs(dy))
                 
-            distance = math.sqrt(dx*dx + dy*dy)
-            
             # Only include organisms within detection radius
-            if distance <= max_scan_distance:
+            if dx*dx + dy*dy <= max_scan_distance * max_scan_distance:
                 nearby_organisms.append(organism)
         
         # If we currently have a target, increment lock time
@@ -515,9 +512,9 @@ class Neutrophil(Organism):
             # Check if close enough to attack
             dx = other_organism.x - self.x
             dy = other_organism.y - self.y
-            distance = np.sqrt(dx**2 + dy**2)
+            reach = self.size + other_organism.size + 2
             
-            if distance <= self.size + other_organism.size + 2:
+            if dx*dx + dy*dy <= reach * reach:
                 # Attack the pathogen
                 other_organism.health -= self.attack_strength
                 
@@ -777,7 +774,7 @@ class Macrophage(Neutrophil):
             # Calculate distance
             dx = organism.x - self.x
             dy = organism.y - self.y
-            distance = (dx**2 + dy**2)**0.5
+            distance = math.hypot(dx, dy)
             
             # Skip if beyond detection radius
             if distance > self.detection_radius:
@@ -854,7 +851,7 @@ class Macrophage(Neutrophil):
         # Calculate distance
         dx = organism.x - self.x
         dy = organism.y - self.y
-        distance = (dx**2 + dy**2)**0.5
+        distance = math.hypot(dx, dy)
         
         # Check if within engulfing range
         if distance <= self.phagocytosis_radius:
@@ -1087,7 +1084,7 @@ class TCell(Neutrophil):
             # Calculate distance to target
             dx = self.target.x - self.x
             dy = self.target.y - self.y
-            distance = (dx**2 + dy**2)**0.5
+            distance = math.hypot(dx, dy)
             
             # If within antibody range, fire antibodies
             if distance <= self.antibody_range:
@@ -1179,7 +1176,7 @@ class TCell(Neutrophil):
             # Calculate distance
             dx = organism.x - self.x
             dy = organism.y - self.y
-            distance = (dx**2 + dy**2)**0.5
+            distance = math.hypot(dx, dy)
             
             # Skip if beyond detection radius
             if distance > self.detection_radius:
@@ -1266,7 +1263,7 @@ class TCell(Neutrophil):
         # Calculate distance
         dx = organism.x - self.x
         dy = organism.y - self.y
-        distance = (dx**2 + dy**2)**0.5
+        distance = math.hypot(dx, dy)
         
         # If within attack range, attack
         if distance <= self.attack_range:
@@ -1370,8 +1367,8 @@ class TCell(Neutrophil):
                         end_x = screen_x + int((target_screen_x - screen_x) * end_pct)
                         end_y = screen_y + int((target_screen_y - screen_y) * end_pct)
                         
-            pygame.draw.line(
-                screen,
+                        pygame.draw.line(
+                            screen,
                             (150, 210, 255), 
                             (start_x, start_y), 
                             (end_x, end_y), 
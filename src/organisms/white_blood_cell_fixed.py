@@ -7,6 +7,7 @@ import numpy as np
 from src.organisms.organism import Organism
 import math
 import time
+from operator import itemgetter
 import random
 import pygame
 
@@ -259,10 +260,8 @@ class Neutrophil(Organism):
             if abs(dy) > world_height / 2:
                 dy = -1 * np.sign(dy) * (world_height - abs(dy))
                 
-            distance = math.sqrt(dx*dx + dy*dy)
-            
             # Only include organisms within detection radius
-            if distance <= max_scan_distance:
+            if dx*dx + dy*dy <= max_scan_distance * max_scan_distance:
                 nearby_organisms.append(organism)
         
         # If we currently have a target, increment lock time
@@ -515,9 +514,9 @@ class Neutrophil(Organism):
             # Check if close enough to attack
             dx = other_organism.x - self.x
             dy = other_organism.y - self.y
-            distance = np.sqrt(dx**2 + dy**2)
+            reach = self.size + other_organism.size + 2
             
-            if distance <= self.size + other_organism.size + 2:
+            if dx*dx + dy*dy <= reach * reach:
                 # Attack the pathogen
                 other_organism.health -= self.attack_strength
                 
@@ -650,12 +649,9 @@ class Neutrophil(Organism):
                 'type': organism.get_type()
             })
             
-        # Sort threats by score (highest first)
+        # Return the highest threat organism (the first one on ties)
         if threat_scores:
-            threat_scores.sort(key=lambda x: x['threat'], reverse=True)
-            
-            # Return the highest threat organism
-            return threat_scores[0]
+            return max(threat_scores, key=itemgetter('threat'))
         
         return None
 
@@ -748,7 +744,9 @@ class Macrophage(Neutrophil):
             return None
             
         # Calculate threat scores
-        threats = []
+        # Track the highest threat while scanning rather than collecting and sorting
+        target = None
+        best_score = 0.0
         for organism in nearby_organisms:
             # Skip self, dead organisms, and non-threats
             if organism == self or not organism.is_alive:
@@ -777,7 +775,7 @@ class Macrophage(Neutrophil):
             # Calculate distance
             dx = organism.x - self.x
             dy = organism.y - self.y
-            distance = (dx**2 + dy**2)**0.5
+            distance = math.hypot(dx, dy)
             
             # Skip if beyond detection radius
             if distance > self.detection_radius:
@@ -808,17 +806,13 @@ class Macrophage(Neutrophil):
             if hasattr(organism, 'health') and hasattr(organism, 'max_health') and organism.health < organism.max_health * 0.7:
                 threat_score *= 1.3
                 
-            threats.append((organism, threat_score))
+            if target is None or threat_score > best_score:
+                target = organism
+                best_score = threat_score
             
         # No threats found
-        if not threats:
+        if target is None:
             return None
-            
-        # Sort by threat score (highest first)
-        threats.sort(key=lambda x: x[1], reverse=True)
-        
-        # Select the highest threat
-        target = threats[0][0]
         
         # Increase activation level if our target is a virus
         full_target_type = ""
@@ -854,7 +848,7 @@ class Macrophage(Neutrophil):
         # Calculate distance
         dx = organism.x - self.x
         dy = organism.y - self.y
-        distance = (dx**2 + dy**2)**0.5
+        distance = math.hypot(dx, dy)
         
         # Check if within engulfing range
         if distance <= self.phagocytosis_radius:
@@ -1087,7 +1081,7 @@ class TCell(Neutrophil):
             # Calculate distance to target
             dx = self.target.x - self.x
             dy = self.target.y - self.y
-            distance = (dx**2 + dy**2)**0.5
+            distance = math.hypot(dx, dy)
             
             # If within antibody range, fire antibodies
             if distance <= self.antibody_range:
@@ -1150,7 +1144,9 @@ class TCell(Neutrophil):
             return None
             
         # Calculate threat scores
-        threats = []
+        # Track the highest threat while scanning rather than collecting and sorting
+        target = None
+        best_score = 0.0
         for organism in nearby_organisms:
             # Skip self, dead organisms, and non-threats
             if organism == self or not organism.is_alive:
@@ -1179,7 +1175,7 @@ class TCell(Neutrophil):
             # Calculate distance
             dx = organism.x - self.x
             dy = organism.y - self.y
-            distance = (dx**2 + dy**2)**0.5
+            distance = math.hypot(dx, dy)
             
             # Skip if beyond detection radius
             if distance > self.detection_radius:
@@ -1210,17 +1206,13 @@ class TCell(Neutrophil):
             if hasattr(organism, 'health') and hasattr(organism, 'max_health') and organism.health < organism.max_health * 0.7:
                 threat_score *= 1.3
                 
-            threats.append((organism, threat_score))
+            if target is None or threat_score > best_score:
+                target = organism
+                best_score = threat_score
             
         # No threats found
-        if not threats:
+        if target is None:
             return None
-            
-        # Sort by threat score (highest first)
-        threats.sort(key=lambda x: x[1], reverse=True)
-        
-        # Select the highest threat
-        target = threats[0][0]
         
         # Increase activation level if our target is a virus
         if "Virus" in target.type:
@@ -1266,7 +1258,7 @@ class TCell(Neutrophil):
         # Calculate distance
         dx = organism.x - self.x
         dy = organism.y - self.y
-        distance = (dx**2 + dy**2)**0.5
+        distance = math.hypot(dx, dy)
         
         # If within attack range, attack
         if distance <= self.attack_range:
@@ -7,13 +7,146 @@ import os
 import pygame
 import numpy as np
 from pygame.locals import *
+from scipy.spatial import cKDTree
 
 # Import custom modules
-from src.organisms import create_organism
+from src.organisms import create_organism, Neutrophil
+from src.organisms.immune_timers import IMMUNE_TIMERS
+from src.organisms._scan_kernels import close_pairs
+from src.organisms.organism_types import (
+    class_type_info, code_table, organism_tags, capabilities_of, TAG_VIRUS, UNKNOWN,
+    NEUTROPHIL, TCELL, PLATELET, BODY_CELL, RED_BLOOD_CELL, EPITHELIAL_CELL, VIRUS_CODES, HARMFUL_BACTERIA_CODES, BENEFICIAL_BACTERIA,
+    CAN_INTERACT, CAN_SCAN_TARGETS, CAN_SCAN_PLATELETS, CAN_ACTIVATE
+)
 from src.environment import Environment
 from src.visualization import Renderer, TreatmentPanel
 from src.utils import save_simulation, load_simulation, list_saved_simulations
 
+# Organisms that run a target scan each tick (T-Cells report their type as "Neutrophil")
+_SCANNING_TYPE_CODES = (NEUTROPHIL, TCELL)
+
+# Organisms that may carry a damaged flag: body cells, and objects of unknown classes
+_DAMAGEABLE_TYPE_CODES = (UNKNOWN, BODY_CELL, RED_BLOOD_CELL, EPITHELIAL_CELL, PLATELET)
+
+# Reproduction passes, in the order process_reproduction runs them
+_NO_REPRODUCTION, _REPRODUCE_BACTERIA, _REPRODUCE_WBC, _REPRODUCE_BODY_CELL, _REPRODUCE_VIRUS = range(5)
+
+# Reproduction pass for each type code. Only bacteria and viruses report a
+# get_type() that the passes match; immune and body cells never take part
+_REPRODUCTION_PASS = code_table({code: _REPRODUCE_BACTERIA
+                                 for code in HARMFUL_BACTERIA_CODES + (BENEFICIAL_BACTERIA,)})
+for _code in VIRUS_CODES:
+    _REPRODUCTION_PASS[_code] = _REPRODUCE_VIRUS
+del _code
+
+# Class -> reproduction pass cache for known organism classes, filled lazily
+_class_reproduction_passes = {}
+
+
+def _reproduction_pass_for_label(organism):
+    """Pick the reproduction pass for an organism of an unknown class from its get_type() string"""
+    org_type = organism.get_type()
+    if not org_type:
+        return _NO_REPRODUCTION
+    label = org_type.lower()
+    if "bacteria" in label or org_type in ("Salmonella", "Staphylococcus", "EColi", "Streptococcus"):
+        return _REPRODUCE_BACTERIA
+    if "virus" in label:
+        return _REPRODUCE_VIRUS
+    if "white_blood_cell" in label:
+        return _REPRODUCE_WBC
+    if "body_cell" in label and getattr(organism, "can_reproduce", False):
+        return _REPRODUCE_BODY_CELL
+    return _NO_REPRODUCTION
+
+
+def _drop_highest_priority(organisms, priorities, count):
+    """
+    Remove the organisms with the highest cull priority
+    
+    The culled organisms are found with a linear-time partial selection rather than
+    a full sort; survivors keep their original order.
+    
+    Args:
+        organisms (list): Organisms to cull from
+        priorities (ndarray): Cull priority of each organism (higher is culled first)
+        count (int): Number of organisms to remove
+        
+    Returns:
+        list: The surviving organisms
+    """
+    if count >= len(organisms):
+        return []
+    keep = np.ones(len(organisms), dtype=bool)
+    keep[np.argpartition(-priorities, count - 1)[:count]] = False
+    return [org for org, kept in zip(organisms, keep.tolist()) if kept]
+
+
+def _interaction_pairs(organisms, positions, interaction_radius):
+    """
+    Find the pairs of living organisms close enough to interact
+    
+    One k-d tree query finds every pair within the largest possible reach; the
+    candidates are then filtered by each pair's own reach (both sizes plus the
+    interaction radius) in a single kernel pass.
+    
+    Args:
+        organisms (list): All organisms in the simulation
+        positions (tuple): (xs, ys, alive) arrays aligned with organisms
+        interaction_radius (float): Extra distance allowed between organism edges
+        
+    Returns:
+        list: (i, j) index pairs into organisms with i < j, ordered by i then j
+    """
+    xs, ys, alive = positions
+    live = np.flatnonzero(alive)
+    if live.size < 2:
+        return []
+    sizes = np.fromiter((organisms[i].size for i in live.tolist()), dtype=float, count=live.size)
+    live_xs = np.ascontiguousarray(xs[live])
+    live_ys = np.ascontiguousarray(ys[live])
+    tree = cKDTree(np.column_stack((live_xs, live_ys)))
+    pairs = tree.query_pairs(2 * sizes.max() + interaction_radius, output_type='ndarray')
+    if pairs.size == 0:
+        return []
+    first = np.ascontiguousarray(pairs[:, 0])
+    second = np.ascontiguousarray(pairs[:, 1])
+    close = close_pairs(live_xs, live_ys, sizes, first, second, float(interaction_radius))
+    first = first[close]
+    second = second[close]
+    order = np.lexsort((second, first))
+    return list(zip(live[first[order]].tolist(), live[second[order]].tolist()))
+
+def _scan_neighbors(organisms, positions, scanners, radii, world_size):
+    """
+    Find the living organisms within each scanner's radius
+    
+    One periodic k-d tree query covers every scanner, so distances wrap around
+    the world edges as the spatial index's neighbor blocks do.
+    
+    Args:
+        organisms (list): All organisms in the simulation
+        positions (tuple): (xs, ys, alive) arrays aligned with organisms
+        scanners (ndarray): Indices into organisms of the scanning organisms
+        radii (ndarray): Scan radius of each scanner
+        world_size (tuple): (width, height) of the world
+        
+    Returns:
+        list: For each scanner, the other organisms in range, in list order
+    """
+    xs, ys, alive = positions
+    live = np.flatnonzero(alive)
+    if scanners.size == 0 or live.size == 0:
+        return [[] for _ in range(scanners.size)]
+    points = np.mod(np.column_stack((xs, ys)), world_size)
+    # Tiny negative coordinates wrap to exactly the world size, which the
+    # periodic tree rejects; they belong just inside the far edge instead
+    np.minimum(points, np.nextafter(world_size, 0), out=points)
+    tree = cKDTree(points[live], boxsize=world_size)
+    balls = tree.query_ball_point(points[scanners], radii, return_sorted=True)
+    return [[organisms[j] for j in live[ball].tolist() if j != i]
+            for i, ball in zip(scanners.tolist(), balls)]
+
 class BioSimulation:
     """Main simulation class for the Bio-Sim project"""
     
@@ -25,6 +158,9 @@ class BioSimulation:
         self.organisms = []
         self.save_path = None
         self.update_count = 0
+        # Tick before which the population limit warning stays quiet
+        self._next_warning_tick = 0
+        self.read_settings()
         
         # Initialize pygame
         pygame.init()
@@ -50,6 +186,31 @@ class BioSimulation:
         # Initialize simulation state
         self.initialize_simulation()
         
+    def read_settings(self):
+        """
+        Read the per-tick settings out of the configuration
+        
+        The update loop reads these every tick, so they are looked up once here
+        rather than through the nested config dicts each time. Call this again
+        after changing the configuration.
+        """
+        sim_config = self.config.get("simulation", {})
+        sim_settings = self.config.get("simulation_settings", {})
+        self.fps = sim_config.get("fps", 60)
+        # Headless runs (no real display) skip drawing and the frame rate cap
+        self.headless = sim_config.get("headless", os.environ.get("SDL_VIDEODRIVER") == "dummy")
+        self.population_limit = sim_config.get("max_organisms", 1000)
+        self.max_organisms = sim_settings.get("max_organisms", 0)
+        self.interaction_radius = sim_settings.get("interaction_radius", 10)
+        self.cell_spawn_interval = sim_settings.get("cell_spawn_interval", 0)
+        self.cell_spawn_count = sim_settings.get("cell_spawn_count", 0)
+        self.cell_types_to_spawn = tuple(sim_settings.get("cell_types_to_spawn", []))
+        # Next tick on which spawn_cells runs: the first multiple of the interval from now
+        if self.cell_spawn_interval and self.cell_types_to_spawn and self.cell_spawn_count:
+            self._next_spawn_tick = -(-self.update_count // self.cell_spawn_interval) * self.cell_spawn_interval
+        else:
+            self._next_spawn_tick = float('inf')
+    
     def initialize_simulation(self):
         """Set up the initial simulation state"""
         print("Initializing simulation...")
@@ -145,8 +306,9 @@ class BioSimulation:
                     self.handle_organism_click(world_x, world_y)
                     continue
             
-            # Pass any remaining events to treatment panel
-            self.treatment_panel.handle_event(event)
+            # Pass any remaining events to treatment panel (a hidden panel ignores them)
+            if self.treatment_panel.visible:
+                self.treatment_panel.handle_event(event)
     
     def handle_organism_click(self, world_x, world_y):
         """
@@ -157,17 +319,19 @@ class BioSimulation:
             world_y (float): World y-coordinate of click
         """
         clicked_organism = None
-        closest_distance = float('inf')
+        closest_distance_sq = float('inf')
         
-        # Find the closest organism to the click
+        # Find the closest organism to the click, comparing squared distances
         for organism in self.organisms:
-            distance = ((organism.x - world_x) ** 2 + (organism.y - world_y) ** 2) ** 0.5
+            dx = organism.x - world_x
+            dy = organism.y - world_y
+            distance_sq = dx*dx + dy*dy
             
             # Check if click is within the organism's size (with a little buffer for easier selection)
             selection_radius = max(organism.size * 1.5, 10)  # Use at least 10 pixels for small organisms
             
-            if distance <= selection_radius and distance < closest_distance:
-                closest_distance = distance
+            if distance_sq <= selection_radius * selection_radius and distance_sq < closest_distance_sq:
+                closest_distance_sq = distance_sq
                 clicked_organism = organism
         
         # Update selected organism
@@ -185,11 +349,15 @@ class BioSimulation:
             return
             
         # Apply treatment effects if any are active
-        self.treatment_panel.update(self.environment, self.organisms)
+        if self.treatment_panel.active_treatments:
+            self.treatment_panel.update(self.environment, self.organisms)
             
         # Update environment
         self.environment.update()
         
+        # Count down immune cell cooldowns in one batch
+        IMMUNE_TIMERS.tick()
+        
         # Update all organisms
         self.update_organisms()
         
@@ -210,52 +378,39 @@ class BioSimulation:
     
     def spawn_cells(self):
         """Spawn new cells periodically based on configuration settings"""
-        # Get cell spawn settings from config
-        sim_settings = self.config.get("simulation_settings", {})
-        cell_spawn_interval = sim_settings.get("cell_spawn_interval", 0)
-        cell_spawn_count = sim_settings.get("cell_spawn_count", 0)
-        cell_types = sim_settings.get("cell_types_to_spawn", [])
-        
-        # Skip if spawn interval is 0 (disabled) or if no cell types are specified
-        if cell_spawn_interval == 0 or not cell_types or not cell_spawn_count:
-            return
-            
-        # Check if it's time to spawn new cells based on the interval
-        if self.update_count % cell_spawn_interval != 0:
+        # Check if it's time to spawn new cells; never, if spawning is disabled
+        if self.update_count < self._next_spawn_tick:
             return
+        
+        # Get cell spawn settings read from config
+        cell_spawn_interval = self.cell_spawn_interval
+        cell_spawn_count = self.cell_spawn_count
+        cell_types = self.cell_types_to_spawn
+        self._next_spawn_tick += cell_spawn_interval
             
         # Get flow rate to determine entry point (higher flow rate = more from edges)
         flow_rate = self.environment.env_settings.get("flow_rate", 0.5)
         
+        # Draw every spawned cell's type and position up front
+        width = self.environment.width
+        height = self.environment.height
+        spawn_types = np.random.choice(cell_types, size=cell_spawn_count).tolist()
+        xs = np.random.uniform(0, width, cell_spawn_count)
+        ys = np.random.uniform(0, height, cell_spawn_count)
+        
+        # Determine spawn position based on flow rate
+        # Higher flow: more likely to spawn from edges (simulating flow bringing in new cells)
+        # Lower flow: more random positioning throughout
+        from_edge = np.random.random(cell_spawn_count) < flow_rate
+        # Edge 0-3 is top, right, bottom, left; -1 keeps the random position
+        edges = np.where(from_edge, np.random.randint(0, 4, cell_spawn_count), -1)
+        ys[edges == 0] = 0
+        xs[edges == 1] = width
+        ys[edges == 2] = height
+        xs[edges == 3] = 0
+        
         # Spawn cells
-        for _ in range(cell_spawn_count):
-            # Choose a random cell type from the configured list
-            cell_type = np.random.choice(cell_types)
-            
-            # Determine spawn position based on flow rate
-            # Higher flow: more likely to spawn from edges
-            # Lower flow: more random positioning throughout
-            if np.random.random() < flow_rate:
-                # Spawn from edge (simulating flow bringing in new cells)
-                # Choose a random edge (top, right, bottom, left)
-                edge = np.random.randint(0, 4)
-                if edge == 0:  # Top
-                    x = np.random.uniform(0, self.environment.width)
-                    y = 0
-                elif edge == 1:  # Right
-                    x = self.environment.width
-                    y = np.random.uniform(0, self.environment.height)
-                elif edge == 2:  # Bottom
-                    x = np.random.uniform(0, self.environment.width)
-                    y = self.environment.height
-                else:  # Left
-                    x = 0
-                    y = np.random.uniform(0, self.environment.height)
-            else:
-                # Spawn at random position
-                x = np.random.uniform(0, self.environment.width)
-                y = np.random.uniform(0, self.environment.height)
-            
+        for cell_type, x, y in zip(spawn_types, xs.tolist(), ys.tolist()):
             try:
                 # Create new cell using factory function
                 new_cell = create_organism(cell_type, x, y, self.environment)
@@ -266,172 +421,145 @@ class BioSimulation:
     
     def update_organisms(self):
         """Update all organisms and handle their interactions"""
-        # First update all organisms
+        # First update all organisms in list order. Plain neutrophils make their
+        # decision at their own turn and note where their target is then; their
+        # movement step then runs for all of them together in one batch
+        environment = self.environment
+        neutrophils = []
+        prepared = []
         for organism in self.organisms:
             if organism.is_alive:
-                organism.update(self.environment)
+                if organism.type_code == NEUTROPHIL:
+                    neutrophils.append(organism)
+                    prepared.append(organism._prepare_batch_update(environment))
+                else:
+                    organism.update(environment)
+        Neutrophil.update_batch(neutrophils, environment, prepared)
         
-        # Spatial optimization - divide environment into grid cells
-        cell_size = 50  # Size of each cell
-        grid_width = (self.width // cell_size) + 1
-        grid_height = (self.height // cell_size) + 1
+        # Snapshot positions and state into arrays for the vectorized target scans
+        self.environment.update_soa(self.organisms)
+        positions = self.environment.organism_arrays.positions()
         
-        # Create empty grid
-        spatial_grid = {}
-        
-        # Assign organisms to grid cells
-        for organism in self.organisms:
-            if not organism.is_alive:
-                continue
-                
-            # Get cell coordinates
-            cell_x = int(organism.x // cell_size)
-            cell_y = int(organism.y // cell_size)
-            cell_key = (cell_x, cell_y)
-            
-            # Add to grid
-            if cell_key not in spatial_grid:
-                spatial_grid[cell_key] = []
-            spatial_grid[cell_key].append(organism)
+        # Spatial optimization - bucket organisms into the shared grid once per tick,
+        # reusing the positions just snapshotted
+        self.environment.update_spatial_index(self.organisms, positions)
+        spatial_index = self.environment.spatial_index
+        spatial_grid = spatial_index.cells
         
         # Special handling for platelets - allow them to scan for other platelets
         platelet_activation_threshold = 3  # Number of damaged cells needed to activate platelets
         
-        # Track damaged cells to activate nearby platelets
-        damaged_cell_counts = {}  # Map of grid cell to count of damaged cells
-        
-        # Find damaged cells
-        for cell_key, cell_organisms in spatial_grid.items():
-            damaged_count = 0
-            for organism in cell_organisms:
-                if hasattr(organism, 'damaged') and organism.damaged:
-                    damaged_count += 1
-            if damaged_count > 0:
-                damaged_cell_counts[cell_key] = damaged_count
-                
-        # Activate platelets near damaged cells
-        for cell_key, damaged_count in damaged_cell_counts.items():
-            if damaged_count >= platelet_activation_threshold:
-                # Check this cell and adjacent cells for platelets
-                cell_x, cell_y = cell_key
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        adj_key = (cell_x + dx, cell_y + dy)
-                        if adj_key in spatial_grid:
-                            for organism in spatial_grid[adj_key]:
-                                if organism.get_type() == "Platelet" and hasattr(organism, 'activate'):
-                                    # Activate the platelet
-                                    organism.activate()
-        
-        # Allow platelets to scan for other platelets
-        for organism in self.organisms:
-            if organism.get_type() == "Platelet" and organism.is_alive and hasattr(organism, 'scan_for_platelets'):
-                # Get nearby organisms from grid
-                cell_x = int(organism.x // cell_size)
-                cell_y = int(organism.y // cell_size)
-                nearby_organisms = []
-                
-                # Check 3x3 grid of cells around the platelet
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        cell_key = (cell_x + dx, cell_y + dy)
-                        if cell_key in spatial_grid:
-                            nearby_organisms.extend(spatial_grid[cell_key])
+        # Type codes snapshotted this tick pick out the organisms each pass needs
+        organisms = self.organisms
+        organism_arrays = self.environment.organism_arrays
+        codes = organism_arrays.codes[:organism_arrays.count]
+        xs, ys, alive = positions
+        
+        # Find damaged cells; only body cells (or unknown classes) can be damaged
+        candidates = np.flatnonzero(np.isin(codes, _DAMAGEABLE_TYPE_CODES) & (alive != 0))
+        damaged = candidates[np.fromiter((getattr(organisms[i], 'damaged', False) for i in candidates.tolist()),
+                                         dtype=bool, count=candidates.size)]
+        
+        # Activate platelets near grid cells holding enough damaged cells
+        for cell_x, cell_y in spatial_index.crowded_cells(xs[damaged], ys[damaged],
+                                                          platelet_activation_threshold):
+            # Check this cell and adjacent cells for platelets
+            for dx in range(-1, 2):
+                for dy in range(-1, 2):
+                    adj_key = (cell_x + dx, cell_y + dy)
+                    if adj_key in spatial_grid:
+                        for organism in spatial_grid[adj_key]:
+                            if organism.type_code == PLATELET and capabilities_of(organism) & CAN_ACTIVATE:
+                                # Activate the platelet
+                                organism.activate()
+        
+        # Allow activated platelets to scan for other platelets; the scan does nothing
+        # for a platelet that is not activated, so its neighbours are never gathered
+        for index in np.flatnonzero(codes == PLATELET).tolist():
+            organism = organisms[index]
+            if organism.is_alive and organism.activated and capabilities_of(organism) & CAN_SCAN_PLATELETS:
+                # Get nearby organisms from the 3x3 block of grid cells around the platelet
+                nearby_organisms = spatial_index.neighbors(organism.x, organism.y)
                 
                 # Scan for nearby platelets
                 organism.scan_for_platelets(nearby_organisms)
         
-        # White blood cells scan for targets
-        for organism in self.organisms:
-            # Use organism.get_type() if defined, or fall back to class name
-            org_type = getattr(organism, 'get_type', lambda: organism.__class__.__name__.lower())()
-            if "neutrophil" in org_type.lower() and organism.is_alive:
-                # Get nearby organisms from grid
-                cell_x = int(organism.x // cell_size)
-                cell_y = int(organism.y // cell_size)
-                nearby_organisms = []
-                
-                # Check 3x3 grid of cells around the white blood cell
-                for dx in range(-1, 2):
-                    for dy in range(-1, 2):
-                        cell_key = (cell_x + dx, cell_y + dy)
-                        if cell_key in spatial_grid:
-                            nearby_organisms.extend(spatial_grid[cell_key])
-                
-                # Call scan_for_targets if method exists
-                if hasattr(organism, 'scan_for_targets'):
-                    organism.scan_for_targets(nearby_organisms, self.environment)
-        
-        # Handle interactions between organisms in same or adjacent cells
-        for cell_key, cell_organisms in spatial_grid.items():
-            # Process interactions within this cell
-            for i, organism1 in enumerate(cell_organisms):
-                if not organism1.is_alive:
-                    continue
-                    
-                # Interact with other organisms in same cell
-                for organism2 in cell_organisms[i+1:]:
-                    if not organism2.is_alive:
-                        continue
-                        
-                    # Calculate distance between organisms
-                    dx = organism1.x - organism2.x
-                    dy = organism1.y - organism2.y
-                    distance = np.sqrt(dx**2 + dy**2)
-                    
-                    # If close enough, they can interact
-                    interaction_radius = self.config.get("simulation_settings", {}).get("interaction_radius", 10)
-                    if distance <= organism1.size + organism2.size + interaction_radius:
-                        # Try interaction in both directions
-                        if hasattr(organism1, 'interact'):
-                            organism1.interact(organism2, self.environment)
-                        if hasattr(organism2, 'interact'):
-                            organism2.interact(organism1, self.environment)
+        # White blood cells scan for targets; the organisms within every scanner's
+        # detection radius are found together in one query
+        scanners = np.flatnonzero(np.isin(codes, _SCANNING_TYPE_CODES) & (alive != 0))
+        scanners = scanners[np.fromiter((bool(capabilities_of(organisms[i]) & CAN_SCAN_TARGETS)
+                                         for i in scanners.tolist()), dtype=bool, count=scanners.size)]
+        radii = np.fromiter((organisms[i].detection_radius for i in scanners.tolist()),
+                            dtype=float, count=scanners.size)
+        nearby = _scan_neighbors(organisms, positions, scanners, radii,
+                                 (environment.width, environment.height))
+        for index, nearby_organisms in zip(scanners.tolist(), nearby):
+            organism = organisms[index]
+            if organism.is_alive:
+                organism.scan_for_targets(nearby_organisms, environment)
+        
+        # Handle interactions between organisms within reach of each other, found
+        # from the positions snapshotted this tick
+        interaction_radius = self.interaction_radius
+        for i, j in _interaction_pairs(organisms, positions, interaction_radius):
+            organism1 = organisms[i]
+            organism2 = organisms[j]
+            if not (organism1.is_alive and organism2.is_alive):
+                continue
+            
+            # Earlier interactions can move or resize either organism, so the reach
+            # is confirmed against current state
+            dx = organism1.x - organism2.x
+            dy = organism1.y - organism2.y
+            reach = organism1.size + organism2.size + interaction_radius
+            if dx*dx + dy*dy <= reach*reach:
+                # Try interaction in both directions
+                if capabilities_of(organism1) & CAN_INTERACT:
+                    organism1.interact(organism2, environment)
+                if capabilities_of(organism2) & CAN_INTERACT:
+                    organism2.interact(organism1, environment)
+        
+        # Interactions can move organisms, and reproduction and spawning add more,
+        # so nearby queries from here on rebuild the index first
+        environment.invalidate_spatial_index()
     
     def process_reproduction(self):
         """Process reproduction for all organisms"""
         # Early return if no new organism slots available
-        population_limit = self.config.get("simulation", {}).get("max_organisms", 1000)
+        population_limit = self.population_limit
         
         if len(self.organisms) >= population_limit:
-            if not hasattr(self, '_last_reproduction_warning') or self._last_reproduction_warning + 500 < pygame.time.get_ticks():
+            if self.update_count >= self._next_warning_tick:
                 print(f"Population limit reached: {len(self.organisms)}/{population_limit}")
-                self._last_reproduction_warning = pygame.time.get_ticks()
+                # Roughly half a second at the target frame rate
+                self._next_warning_tick = self.update_count + max(1, self.fps // 2)
             return
         
         # Only allow reproduction if under the population cap
         available_slots = population_limit - len(self.organisms)
         
-        # Track organisms that may reproduce
-        bacteria_candidates = []
-        virus_candidates = []
-        white_blood_cell_candidates = []
-        body_cell_candidates = []
+        # Track organisms that may reproduce, one list per reproduction pass
+        candidates = ([], [], [], [], [])
         
-        # Sort organisms by type
+        # Sort organisms by their class's reproduction pass; only unknown classes
+        # fall back to get_type() strings
+        class_passes = _class_reproduction_passes
         for organism in self.organisms:
             if not organism.is_alive:
                 continue
-                
-            # Safety check - get_type() should never be None
-            org_type = organism.get_type()
-            if not org_type:
-                continue
-                
-            # Log what types are being processed for reproduction
-            if "EpithelialCell" in str(type(organism)):
-                # print(f"Found EpithelialCell in reproduction candidates: {organism}, can_reproduce={getattr(organism, 'can_reproduce', 'unknown')}")
-                pass
-            # Add to appropriate list
-            if "bacteria" in org_type.lower() or org_type in ["Salmonella", "Staphylococcus", "EColi", "Streptococcus"]:
-                bacteria_candidates.append(organism)
-            elif "virus" in org_type.lower():
-                virus_candidates.append(organism)
-            elif "white_blood_cell" in org_type.lower():
-                white_blood_cell_candidates.append(organism)
-            elif "body_cell" in org_type.lower() and hasattr(organism, "can_reproduce") and organism.can_reproduce:
-                # Only add body cells that specifically have can_reproduce=True
-                body_cell_candidates.append(organism)
+            cls = organism.__class__
+            reproduction_pass = class_passes.get(cls)
+            if reproduction_pass is None:
+                code, _ = class_type_info(cls)
+                if code == UNKNOWN:
+                    reproduction_pass = _reproduction_pass_for_label(organism)
+                else:
+                    reproduction_pass = class_passes[cls] = _REPRODUCTION_PASS[code]
+            candidates[reproduction_pass].append(organism)
+        bacteria_candidates = candidates[_REPRODUCE_BACTERIA]
+        white_blood_cell_candidates = candidates[_REPRODUCE_WBC]
+        body_cell_candidates = candidates[_REPRODUCE_BODY_CELL]
+        virus_candidates = candidates[_REPRODUCE_VIRUS]
         
         new_organisms = []
         
@@ -533,7 +661,7 @@ class BioSimulation:
     
     def enforce_population_cap(self):
         """Enforce the maximum population limit if needed"""
-        max_organisms = self.config.get("simulation_settings", {}).get("max_organisms", 0)
+        max_organisms = self.max_organisms
         
         # Skip if no limit or already under limit
         if max_organisms <= 0 or len(self.organisms) <= max_organisms:
@@ -543,69 +671,58 @@ class BioSimulation:
         excess = len(self.organisms) - max_organisms
         
         if excess > 0:
-            # Count viruses and non-viruses separately
-            viruses = []
-            non_viruses = []
+            organisms = self.organisms
+            count = len(organisms)
             
-            # Separate viruses from other organisms
-            for org in self.organisms:
-                is_virus = hasattr(org, 'get_type') and "virus" in org.get_type().lower()
-                if is_virus:
-                    viruses.append(org)
-                else:
-                    non_viruses.append(org)
+            # Read the state the priorities need once per organism
+            energies = np.fromiter((getattr(org, 'energy', 100) for org in organisms), dtype=float, count=count)
+            ages = np.fromiter((getattr(org, 'age', 1) for org in organisms), dtype=float, count=count)
+            is_virus = np.fromiter((organism_tags(org) & TAG_VIRUS for org in organisms), dtype=bool, count=count)
             
-            #print(f"Population control: {len(viruses)} viruses, {len(non_viruses)} non-viruses")
+            # Priority formula: age/energy ratio (higher is more likely to be culled)
+            priorities = ages / np.maximum(1, energies)
             
-            # Prioritization function
-            def organism_priority(org):
-                # Priority formula: age/energy ratio (higher is more likely to be culled)
-                energy = getattr(org, 'energy', 100)
-                age = getattr(org, 'age', 1)
-                
-                # Base priority is age/energy
-                priority = age / max(1, energy)
-                
-                # Reduce priority (make less likely to cull) if virus
-                if hasattr(org, 'get_type') and "virus" in org.get_type().lower():
-                    priority *= 0.5  # Give viruses half the priority for culling
-                    
-                # Extra protection for young viruses (age < 10)
-                if hasattr(org, 'get_type') and "virus" in org.get_type().lower() and age < 10:
-                    priority *= 0.2  # Even less priority for newly created viruses
-                
-                return priority
+            # Viruses get half the priority for culling, and newly created ones (age < 10) even less
+            priorities[is_virus] *= 0.5
+            priorities[is_virus & (ages < 10)] *= 0.2
             
             # If we have more non-viruses than excess, preferentially remove non-viruses first
-            if len(non_viruses) >= excess:
-                # Sort non-viruses by priority
-                sorted_non_viruses = sorted(non_viruses, key=organism_priority, reverse=True)
-                
-                # Remove excess from non-viruses and keep all viruses
-                self.organisms = sorted_non_viruses[excess:] + viruses
+            virus_count = int(np.count_nonzero(is_virus))
+            if count - virus_count >= excess:
+                # Remove the highest-priority non-viruses and keep all viruses
+                flags = is_virus.tolist()
+                non_viruses = [org for org, virus in zip(organisms, flags) if not virus]
+                viruses = [org for org, virus in zip(organisms, flags) if virus]
+                self.organisms = _drop_highest_priority(non_viruses, priorities[~is_virus], excess) + viruses
                 print(f"Population cap enforced: removed {excess} non-virus organisms")
             else:
                 # We need to remove some viruses too
-                # Sort all organisms by priority
-                sorted_organisms = sorted(self.organisms, key=organism_priority, reverse=True)
-                
-                # Remove excess organisms
-                self.organisms = sorted_organisms[excess:]
+                # Remove the highest-priority organisms of any type
+                self.organisms = _drop_highest_priority(organisms, priorities, excess)
                 print(f"Population cap enforced: removed {excess} organisms (including some viruses)")
                 
                 # Count how many viruses were removed
-                remaining_viruses = sum(1 for org in self.organisms if hasattr(org, 'get_type') and "virus" in org.get_type().lower())
-                viruses_removed = len(viruses) - remaining_viruses
+                remaining_viruses = sum(1 for org in self.organisms if organism_tags(org) & TAG_VIRUS)
+                viruses_removed = virus_count - remaining_viruses
                 if viruses_removed > 0:
                     print(f"WARNING: {viruses_removed} viruses were removed due to population cap")
     
     def remove_dead_organisms(self):
         """Remove dead organisms from the simulation"""
-        # Filter out dead organisms
-        self.organisms = [org for org in self.organisms if getattr(org, 'is_alive', True)]
+        # Compact survivors towards the front in place, keeping the same list object
+        # and allocating no temporary list, then drop the leftover tail
+        organisms = self.organisms
+        write = 0
+        for org in organisms:
+            if org.is_alive:
+                organisms[write] = org
+                write += 1
+        del organisms[write:]
     
     def render(self):
         """Render the current simulation state"""
+        if self.headless:
+            return
         self.renderer.clear()
         fps = self.clock.get_fps()
         self.renderer.render_all(self.environment, self.organisms, fps)
@@ -633,11 +750,18 @@ class BioSimulation:
         print("Use arrow keys to manually move camera when auto-tracking is off.")
         print("Click on an organism to view its detailed information.")
         
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(self.config.get("simulation", {}).get("fps", 60))
+        if self.headless:
+            # Nothing is drawn or read from the keyboard, so ticks run back to back
+            while self.running:
+                if pygame.event.get(pygame.QUIT):
+                    self.running = False
+                self.update()
+        else:
+            while self.running:
+                self.handle_events()
+                self.update()
+                self.render()
+                self.clock.tick(self.fps)
         
         pygame.quit()
         return 0
@@ -109,7 +109,7 @@ def save_simulation(environment, organisms, filepath=None):
                     "detection_radius": organism.detection_radius,
                     "attack_strength": organism.attack_strength,
                     "memory_capacity": organism.memory_capacity,
-                    "pathogen_memory": organism.pathogen_memory,
+                    "pathogen_memory": list(organism.pathogen_memory),
                     "target_id": organism.target.id if organism.target else None
                 })
             
@@ -6,6 +6,8 @@ Handles rendering the simulation with advanced visualization features
 import pygame
 import numpy as np
 import colorsys
+from src.organisms.organism import Organism
+from src.organisms.white_blood_cell import TCell
 
 class Renderer:
     """
@@ -134,6 +136,21 @@ class Renderer:
         screen_y = int((y - self.camera_y) * self.zoom + self.height / 2)
         return screen_x, screen_y
     
+    def get_view_bounds(self, margin=50):
+        """
+        Get the world-space rectangle currently visible on screen
+        
+        Args:
+            margin (int): Extra screen pixels to include on every side
+            
+        Returns:
+            tuple: (min_x, min_y, max_x, max_y) in world coordinates
+        """
+        half_w = (self.width / 2 + margin) / self.zoom
+        half_h = (self.height / 2 + margin) / self.zoom
+        return (self.camera_x - half_w, self.camera_y - half_h,
+                self.camera_x + half_w, self.camera_y + half_h)
+    
     def screen_to_world(self, screen_x, screen_y):
         """
         Convert screen coordinates to world coordinates
@@ -385,6 +402,20 @@ class Renderer:
             if cell_type not in self.stats:
                 self.stats[cell_type] = 0
         
+        # Visible world rectangle, computed once per frame for culling
+        view_min_x, view_min_y, view_max_x, view_max_y = self.get_view_bounds()
+        
+        # Screen positions memoized during the previous frame are now stale
+        Organism.begin_render_frame()
+        
+        # T-Cells in view are drawn together through their batch path, ahead of the
+        # per-organism loop so their health bars and target lines stay on top
+        TCell.render_batch(
+            [organism for organism in organisms
+             if isinstance(organism, TCell) and organism.is_alive and
+             view_min_x <= organism.x <= view_max_x and view_min_y <= organism.y <= view_max_y],
+            self.screen, self.camera_x, self.camera_y, self.zoom)
+        
         # Render each organism
         for organism in organisms:
             if not organism.is_alive:
@@ -421,8 +452,14 @@ class Renderer:
             elif org_type.lower() in ["neutrophil", "macrophage", "tcell"] or "white_blood_cell" in org_type.lower():
                 total_wbc_count += 1
             
+            # Skip all drawing work for organisms outside the view
+            if not (view_min_x <= organism.x <= view_max_x and view_min_y <= organism.y <= view_max_y):
+                continue
+            
             # Use the organism's custom render method if it exists
-            if hasattr(organism, 'render'):
+            if isinstance(organism, TCell):
+                pass  # Already drawn by TCell.render_batch
+            elif hasattr(organism, 'render'):
                 organism.render(self.screen, self.camera_x, self.camera_y, self.zoom)
             else:
                 # Fallback to default rendering if the organism doesn't have a custom render method
@@ -476,21 +513,7 @@ class Renderer:
             
             # Draw target indicator for white blood cells
             if organism.get_type() == "white_blood_cell" and hasattr(organism, 'target') and organism.target:
-                # Check if target is the new dictionary structure
-                if isinstance(organism.target, dict) and 'organism' in organism.target:
-                    target_organism = organism.target['organism']
-                    if hasattr(target_organism, 'is_alive') and target_organism.is_alive:
-                        screen_x, screen_y = self.world_to_screen(organism.x, organism.y)
-                        target_x, target_y = self.world_to_screen(target_organism.x, target_organism.y)
-                        pygame.draw.line(
-                            self.screen,
-                            (255, 50, 50),
-                            (screen_x, screen_y),
-                            (target_x, target_y),
-                            1
-                        )
-                # Legacy support for direct organism reference
-                elif hasattr(organism.target, 'is_alive') and organism.target.is_alive:
+                if hasattr(organism.target, 'is_alive') and organism.target.is_alive:
                     screen_x, screen_y = self.world_to_screen(organism.x, organism.y)
                     target_x, target_y = self.world_to_screen(organism.target.x, organism.target.y)
                     pygame.draw.line(
@@ -708,8 +731,9 @@ class Renderer:
         y_pos += line_height
         
         # Try to get the general category if available
-        if hasattr(organism, 'get_type') and callable(getattr(organism, 'get_type')):
-            category = organism.get_type()
+        get_type = getattr(organism, 'get_type', None)
+        if callable(get_type):
+            category = get_type()
             if category != org_type:  # Only show if different from specific type
                 category_text = detail_font.render(f"Category: {category}", True, (180, 180, 255))
                 panel.blit(category_text, (10, y_pos))
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import sys
 import os
 import numpy as np
@@ -72,6 +72,18 @@ class TestEnvironment(unittest.TestCase):
         self.assertIn("nutrients", conditions)
         self.assertIn("flow_rate", conditions)
     
+    def test_sample_conditions_matches_scalar_lookup(self):
+        """Test that batched sampling reads the same grid cells as get_conditions_at"""
+        xs = np.array([0.0, 399.9, 799.9, -5.0, 900.0])
+        ys = np.array([0.0, 300.0, 599.9, 10.0, -1.0])
+        sampled = self.environment.sample_conditions(xs, ys)
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            for field, value in self.environment.get_conditions_at(x, y).items():
+                self.assertEqual(sampled[field][i], value)
+
+        temperature_only = self.environment.sample_conditions(xs, ys, fields=("temperature",))
+        self.assertEqual(list(temperature_only), ["temperature"])
+
     def test_get_nearby_organisms(self):
         """Test that get_nearby_organisms returns organisms within radius"""
         # Test with small radius (should only get org1)
@@ -96,6 +108,92 @@ class TestEnvironment(unittest.TestCase):
         # Verify dead organisms are not included
         self.assertNotIn(self.dead_org, nearby)
         
+    def test_get_nearby_organisms_uses_spatial_index(self):
+        """Test that queries use the spatial index once it has been built"""
+        organisms = self.environment.simulation.organisms
+        self.environment.update_spatial_index(organisms)
+        self.assertEqual(self.environment.spatial_index.count, 3)
+        self.assertEqual(self.environment.spatial_index.neighbors(100, 100), [self.org1, self.org2])
+        
+        # Same results as the linear walk, for small and large radii
+        self.environment.simulation.organisms = []
+        self.assertEqual(self.environment.get_nearby_organisms(100, 100, 10), [self.org1])
+        self.assertCountEqual(self.environment.get_nearby_organisms(100, 100, 60), [self.org1, self.org2])
+        self.assertCountEqual(self.environment.get_nearby_organisms(100, 100, 1000),
+                              [self.org1, self.org2, self.org3])
+
+    def test_get_nearby_organisms_rebuilds_out_of_date_index(self):
+        """Test that organisms moved or born after the index was built are still found"""
+        organisms = self.environment.simulation.organisms
+        self.environment.update_spatial_index(organisms)
+        self.assertEqual(self.environment.get_nearby_organisms(100, 100, 10), [self.org1])
+
+        # Organisms move into a new cell and a newborn arrives after the build
+        self.org3.x, self.org3.y = 105, 100
+        newborn = MagicMock()
+        newborn.x, newborn.y = 100, 105
+        newborn.is_alive = True
+        organisms.append(newborn)
+        self.environment.invalidate_spatial_index()
+        self.assertCountEqual(self.environment.get_nearby_organisms(100, 100, 10),
+                              [self.org1, self.org3, newborn])
+        self.assertTrue(self.environment.spatial_index_current)
+
+    def test_spatial_index_from_arrays_matches_rebuild(self):
+        """Test that array bucketing gives the same cells, in the same order, as rebuild"""
+        organisms = self.environment.simulation.organisms + [self.org2, self.org1]
+        index = self.environment.spatial_index
+        index.rebuild(organisms)
+        expected = list(index.cells.items())
+
+        xs = np.array([o.x for o in organisms], dtype=float)
+        ys = np.array([o.y for o in organisms], dtype=float)
+        alive = np.array([o.is_alive for o in organisms])
+        self.environment.update_spatial_index(organisms, (xs, ys, alive))
+        self.assertEqual(list(index.cells.items()), expected)
+        self.assertEqual(index.count, 5)
+
+    def test_spatial_index_moves_only_changed_organisms(self):
+        """Test that a repeat array build moves organisms between cells like a full rebuild"""
+        organisms = [self.org1, self.org2, self.org3]
+        index = self.environment.spatial_index
+
+        def build(alive=(True, True, True)):
+            xs = np.array([o.x for o in organisms], dtype=float)
+            ys = np.array([o.y for o in organisms], dtype=float)
+            index.rebuild_from_arrays(organisms, xs, ys, np.array(alive))
+
+        def bucketed():
+            return {key: set(map(id, bucket)) for key, bucket in index.cells.items()}
+
+        build()
+        cells = index.cells
+        # One of three organisms moving is well past the usual limit for small updates
+        with patch('src.environment.spatial_index._INCREMENTAL_MOVE_FRACTION', 0.5):
+            # Through a cell with a negative coordinate and on into org2's cell
+            self.org3.x, self.org3.y = 160, -10
+            build()
+            self.assertEqual(bucketed()[(3, -1)], {id(self.org3)})
+            self.org3.x, self.org3.y = 160, 110
+            build()
+        self.assertIs(index.cells, cells)
+        self.assertEqual(bucketed(), {(2, 2): {id(self.org1)}, (3, 2): {id(self.org2), id(self.org3)}})
+
+        # A change in the living organisms falls back to a full rebuild
+        build(alive=(True, False, True))
+        self.assertIsNot(index.cells, cells)
+        self.assertEqual(bucketed(), {(2, 2): {id(self.org1)}, (3, 2): {id(self.org3)}})
+        self.assertEqual(index.count, 2)
+
+    def test_crowded_cells(self):
+        """Test that cells are reported once they hold enough points, including negative cells"""
+        index = self.environment.spatial_index
+        xs = np.array([10.0, 20.0, 30.0, 60.0, -10.0, -20.0, -5.0])
+        ys = np.array([10.0, 20.0, 30.0, 10.0, -60.0, -70.0, -90.0])
+        self.assertCountEqual(index.crowded_cells(xs, ys, 3), [(0, 0), (-1, -2)])
+        self.assertCountEqual(index.crowded_cells(xs, ys, 1), [(0, 0), (1, 0), (-1, -2)])
+        self.assertEqual(index.crowded_cells(xs[:2], ys[:2], 3), [])
+
     def test_get_nearby_organisms_no_simulation(self):
         """Test behavior when simulation is not set"""
         # Remove simulation reference
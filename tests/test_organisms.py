@@ -114,7 +114,21 @@ class TestBacteria(unittest.TestCase):
         
         # Restore original method
         self.bacteria.update = original_update
-    
+
+    def test_movement_wraps_world_edges(self):
+        """Test that movement wraps into the world, even for a move longer than the world"""
+        self.bacteria.x, self.bacteria.y = 799.5, 0.5
+        self.bacteria.base_speed = 2.0
+        with patch('src.organisms.organism.noise', return_value=0.0):
+            self.bacteria._apply_decision([1.0, -1.0, 0.0, 0.0], self.environment)
+        self.assertAlmostEqual(self.bacteria.x, 1.5)
+        self.assertAlmostEqual(self.bacteria.y, 598.5)
+
+        self.bacteria.base_speed = 1700.0
+        with patch('src.organisms.organism.noise', return_value=0.0):
+            self.bacteria._apply_decision([1.0, 0.0, 0.0, 0.0], self.environment)
+        self.assertAlmostEqual(self.bacteria.x, 101.5)
+
     @patch('numpy.random.random')
     def test_reproduce(self, mock_random):
         """Test reproduction of bacteria"""
@@ -250,6 +264,33 @@ class TestSpecificBacteria(unittest.TestCase):
         self.assertGreater(self.staphylococcus.antibiotic_resistance["penicillin"], 
                            self.salmonella.antibiotic_resistance["penicillin"])
     
+    def test_interaction_masks_match_type_strings(self):
+        """Test that interaction type codes select the same organisms as their get_type() strings"""
+        from src.organisms import bacteria, virus, organism_types
+        from src.organisms.body_cells import RedBloodCell, EpithelialCell, Platelet
+
+        classes = [Bacteria, EColi, Streptococcus, Staphylococcus, Salmonella, BeneficialBacteria,
+                   Influenza, Neutrophil, Macrophage, TCell, BodyCell, RedBloodCell,
+                   EpithelialCell, Platelet]
+        for cls in classes:
+            other = cls(100, 100, 5, (200, 200, 200), 1.0)
+            other_type = other.get_type().lower()
+            code = organism_types.type_code_of(other)
+            bit = 1 << code
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(bool(bit & bacteria._ATTACKABLE_CELL_MASK),
+                                 "cell" in other_type and "white" not in other_type)
+                self.assertEqual(bool(bit & bacteria._COMPETING_BACTERIA_MASK), "bacteria" in other_type)
+                self.assertEqual(bool(bit & bacteria._IMMUNE_ATTACKER_MASK),
+                                 "tcell" in other_type or "macro" in other_type)
+                self.assertEqual(code in virus._IMMUNE_ATTACKER_CODES,
+                                 "tcell" in other_type or "macro" in other_type)
+                self.assertEqual(code in virus._INFECTABLE_CODES,
+                                 other.get_type() in ["EpithelialCell", "RedBloodCell"])
+                self.assertEqual(code in bacteria._SEVERE_BACTERIA_CODES,
+                                 other.get_type() in ["Salmonella", "Staphylococcus"])
+                self.assertEqual(code == organism_types.PLATELET, other.get_type() == "Platelet")
+    
     @patch('numpy.random.random')
     def test_reproduce(self, mock_random):
         """Test reproduction of bacteria"""
@@ -901,5 +942,862 @@ class TestWhiteBloodCell(unittest.TestCase):
         self.assertTrue(result)
         self.assertLess(bacteria.health, 50)
 
+    def test_pathogen_memory_holds_each_id_once(self):
+        """Test that repeated attacks remember a pathogen once, up to capacity"""
+        wbc = Neutrophil(105, 105, 10, (220, 220, 250), 1.0)
+        wbc.memory_capacity = 2
+        pathogens = [Bacteria(100, 100, 5, (200, 100, 100), 1.0) for _ in range(3)]
+        for bacteria in (pathogens[0], pathogens[0], pathogens[1], pathogens[2]):
+            bacteria.health = 100
+            wbc.interact(bacteria, self.environment)
+        self.assertEqual(list(wbc.pathogen_memory), [pathogens[0].id, pathogens[1].id])
+
+    def test_reproduce_gates_before_density_check(self):
+        """Test that failed reproduction gates return before any density work"""
+        environment = MagicMock()
+        self.wbc.energy = 50
+        self.assertIsNone(self.wbc.reproduce(environment))
+        environment.config.get.assert_not_called()
+
+        # Past the gates, a child inherits the parent's pathogen memory
+        self.wbc.energy = 150
+        self.wbc.pathogen_memory = {"abc": None}
+        with patch('src.organisms.white_blood_cell._rand', return_value=0.0):
+            child = self.wbc.reproduce(self.environment)
+        self.assertIsInstance(child, Neutrophil)
+        self.assertEqual(child.pathogen_memory, {"abc": None})
+        self.assertEqual(self.wbc.energy, 70)
+
+        # Child traits stay within the integer and uniform ranges they are drawn from
+        self.assertTrue(80 <= child.x < 120 and 80 <= child.y < 120)
+        self.assertTrue(9.5 <= child.size <= 10.5)
+        for parent_channel, channel in zip(self.wbc.color, child.color):
+            self.assertTrue(-5 <= channel - parent_channel < 5 or channel == 255)
+
+    def test_target_direction_inputs(self):
+        """Test the target direction inputs and decision blend toward a target"""
+        self.wbc.target = Bacteria(130, 140, 5, (200, 100, 100), 1.0)
+        inputs = self.wbc._get_neural_network_inputs(self.environment)
+        self.assertAlmostEqual(inputs[3], 0.6)
+        self.assertAlmostEqual(inputs[4], 0.8)
+
+        # A target on top of the cell keeps the direction finite
+        self.wbc.target = Bacteria(100.05, 100, 5, (200, 100, 100), 1.0)
+        self.assertAlmostEqual(self.wbc._get_neural_network_inputs(self.environment)[3], 0.5)
+
+        # Halfway into the blend range the step points between decision and target
+        self.wbc.target = Bacteria(100, 150, 5, (200, 100, 100), 1.0)
+        self.wbc._apply_decision([1.0, 0.0], self.environment)
+        self.assertAlmostEqual(self.wbc.x, 100 + math.sqrt(0.5))
+        self.assertAlmostEqual(self.wbc.y, 100 + math.sqrt(0.5))
+
+    def test_squared_radii_stay_in_sync(self):
+        """Test that cached squared radii follow radius changes"""
+        self.wbc.detection_radius = 150
+        self.assertEqual(self.wbc.detection_radius_sq, 150 * 150)
+
+        macrophage = Macrophage(100, 100, 10, (150, 150, 220), 0.5)
+        self.assertEqual(macrophage.detection_radius_sq, 250 * 250)
+        macrophage.phagocytosis_radius = 20
+        self.assertEqual(macrophage.phagocytosis_radius_sq, 400)
+
+    def test_update_batch_matches_update(self):
+        """Test that batched neutrophil movement matches updating each cell on its own"""
+        import copy
+
+        chaser = Neutrophil(100, 100, 10, (220, 220, 250), 1.0)
+        chaser.target = Bacteria(130, 100, 5, (200, 100, 100), 1.0)
+        wrapped = Neutrophil(790, 300, 10, (220, 220, 250), 1.0)
+        wrapped.target = Bacteria(20, 300, 5, (200, 100, 100), 1.0)
+        lost = Neutrophil(400, 400, 10, (220, 220, 250), 1.0)
+        lost.target = Bacteria(400, 400, 5, (200, 100, 100), 1.0)
+        lost.target.is_alive = False
+        wanderer = Neutrophil(50, 550, 10, (220, 220, 250), 1.0)
+        wanderer.vx, wanderer.vy = 3.0, -0.5
+        cells = [chaser, wrapped, lost, wanderer]
+        batched = copy.deepcopy(cells)
+        batch_environment = copy.deepcopy(self.environment)
+
+        # Jitter is switched off so both paths are deterministic
+        with patch('src.organisms.organism.noise', return_value=0.0), \
+                patch('src.organisms.white_blood_cell.noise', return_value=0.0), \
+                patch('numpy.random.standard_normal', side_effect=np.zeros):
+            for cell in cells:
+                cell.update(self.environment)
+            Neutrophil.update_batch(batched, batch_environment)
+
+        for cell, batch_cell in zip(cells, batched):
+            for name in ("x", "y", "vx", "vy", "energy", "age"):
+                self.assertAlmostEqual(getattr(batch_cell, name), getattr(cell, name), places=9)
+            self.assertEqual(batch_cell.target is None, cell.target is None)
+        self.assertIsNone(batched[2].target)
+        self.assertGreater(batched[1].vx, 0)
+
+    def test_update_batch_chases_target_from_list_turn(self):
+        """Test that prepared neutrophils chase where the target was at their own turn"""
+        import copy
+
+        chaser = Neutrophil(100, 100, 10, (220, 220, 250), 1.0)
+        chaser.target = Bacteria(100, 130, 5, (200, 100, 100), 1.0)
+        batched = copy.deepcopy(chaser)
+        batch_environment = copy.deepcopy(self.environment)
+
+        # The target moves after the chaser's turn in both update orders
+        with patch('src.organisms.organism.noise', return_value=0.0), \
+                patch('src.organisms.white_blood_cell.noise', return_value=0.0), \
+                patch('numpy.random.standard_normal', side_effect=np.zeros):
+            chaser.update(self.environment)
+            chaser.target.x, chaser.target.y = 140, 100
+            prepared = [batched._prepare_batch_update(batch_environment)]
+            batched.target.x, batched.target.y = 140, 100
+            Neutrophil.update_batch([batched], batch_environment, prepared)
+
+        for name in ("x", "y", "vx", "vy", "energy", "age"):
+            self.assertAlmostEqual(getattr(batched, name), getattr(chaser, name), places=9)
+        # Heading down towards (100, 130), not across towards (140, 100)
+        self.assertLess(abs(batched.vx), batched.vy)
+
+    def test_immune_cell_render(self):
+        """Test that immune cells render in each animation state"""
+        from src.organisms.white_blood_cell import fsin, fcos, _pseudopod_dirs, _wiggle_step
+
+        # Table-lookup trig stays close to libm
+        for x in (0.0, 0.5, 2.0, -1.3, 1000.7):
+            self.assertAlmostEqual(fsin(x), math.sin(x), delta=0.01)
+            self.assertAlmostEqual(fcos(x), math.cos(x), delta=0.01)
+
+        # Shared pseudopod directions follow the per-pseudopod wiggle formula
+        for i, (cos_a, sin_a) in enumerate(_pseudopod_dirs(5)):
+            angle = i * math.pi / 4 + math.sin(5 * math.tau / 32 + i) * 0.2
+            self.assertAlmostEqual(cos_a, math.cos(angle), delta=0.02)
+            self.assertAlmostEqual(sin_a, math.sin(angle), delta=0.02)
+
+        # Wiggle steps quantize the clock over one cycle of sin(now * 0.01)
+        self.assertEqual(_wiggle_step(0), 0)
+        self.assertEqual(_wiggle_step(math.tau * 100 * 5 / 32 + 1), 5)
+        self.assertEqual(_wiggle_step(math.tau * 100 * (1 + 5 / 32) + 1), 5)
+
+        screen = pygame.Surface((200, 200))
+        neutrophil = Neutrophil(100, 100, 10, (220, 220, 250), 1.0)
+        macrophage = Macrophage(100, 100, 10, (150, 150, 220), 0.5)
+        tcell = TCell(100, 100, 8, (100, 180, 255), 0.8)
+        for cell in (neutrophil, macrophage, tcell):
+            cell.render(screen, 100, 100, 1.0)
+
+        # Engulfing and digesting states
+        macrophage.engulfing_target = Virus(110, 100, 3, (255, 50, 50), 2.0)
+        macrophage.engulfing_progress = 0.5
+        macrophage.render(screen, 100, 100, 1.0)
+        macrophage.render(screen, 100, 100, 0.4)  # one-pixel pseudopods
+        macrophage.engulfing_target = None
+        macrophage.digesting = True
+        macrophage.engulfed_pathogens.append({"type": "virus", "size": 3, "color": (255, 50, 50)})
+        macrophage.render(screen, 100, 100, 1.0)
+        macrophage.engulfed_pathogens.extend([{"type": "Bacteria", "size": 3}] * 9)
+        macrophage.render(screen, 100, 100, 1.0)  # more pathogens than precomputed directions
+        from src.organisms.white_blood_cell import _engulfed_marker_color
+        self.assertEqual(_engulfed_marker_color("Bacteria"), (50, 150, 50))
+        self.assertEqual(_engulfed_marker_color("Influenza Virus"), (150, 50, 50))
+        self.assertEqual(_engulfed_marker_color("Unknown"), (100, 100, 100))
+        del macrophage.engulfed_pathogens[1:]
+
+        # Zoomed far out, each cell is a single pixel of its body color
+        tcell.activation_level = tcell.activation_threshold
+        for cell in (neutrophil, macrophage, tcell):
+            screen.fill((0, 0, 0))
+            cell.render(screen, 100, 100, 0.1)
+            self.assertNotEqual(screen.get_at((100, 100))[:3], (0, 0, 0))
+            self.assertEqual(screen.get_at((101, 100))[:3], (0, 0, 0))
+
+    def test_tcell_targeting_line(self):
+        """Test that activated T-Cells draw a dashed targeting line and others a solid one"""
+        tcell = TCell(100, 100, 8, (100, 180, 255), 0.8)
+        tcell.target = Virus(180, 100, 3, (255, 50, 50), 2.0)
+        screen = pygame.Surface((200, 200))
+
+        # Dashes cover every other eighth of the line; the gaps stay empty
+        tcell.activation_level = tcell.activation_threshold
+        tcell.render(screen, 100, 100, 1.0)
+        self.assertNotEqual(screen.get_at((125, 100))[:3], (0, 0, 0))
+        self.assertEqual(screen.get_at((115, 100))[:3], (0, 0, 0))
+
+        tcell.activation_level = 0
+        screen.fill((0, 0, 0))
+        tcell.render(screen, 100, 100, 1.0)
+        self.assertNotEqual(screen.get_at((115, 100))[:3], (0, 0, 0))
+
+    def test_render_color_tables(self):
+        """Test that cached render colors match the per-frame formulas they replace"""
+        from src.organisms import white_blood_cell
+
+        self.assertEqual(white_blood_cell.darken((220, 30, 250), 40), (180, 0, 210))
+        self.assertEqual(white_blood_cell.lighten((220, 30, 250), 20), (240, 50, 255))
+
+        # Gradient ends match the pulse formulas at their extremes
+        color = (150, 150, 220)
+        gradient = white_blood_cell._engulfing_gradient(color)
+        self.assertEqual(gradient[0], color)
+        self.assertEqual(gradient[-1], (195, 165, 242))
+        self.assertEqual(white_blood_cell._DIGESTING_GRADIENT[-1], (130, 100, 220))
+        for phase in (0.0, 1.0, 4.0, 1000.0):
+            self.assertIn(white_blood_cell._pulse_index(phase), range(len(gradient)))
+
+    def test_neutrophil_sprite_matches_direct_drawing(self):
+        """Test that the cached Neutrophil sprite looks the same as drawing the body"""
+        from src.organisms import white_blood_cell
+
+        neutrophil = Neutrophil(100, 100, 10, (220, 220, 250), 1.0)
+        blitted = pygame.Surface((200, 200))
+        neutrophil.render(blitted, 100, 100, 1.0)
+        drawn = pygame.Surface((200, 200))
+        white_blood_cell._draw_neutrophil_body(drawn, neutrophil.color, (100, 100), 10)
+        self.assertEqual(pygame.image.tobytes(blitted, "RGB"), pygame.image.tobytes(drawn, "RGB"))
+
+        # The sprite is built once per color and radius
+        self.assertIs(white_blood_cell.neutrophil_sprite(neutrophil.color, 10),
+                      white_blood_cell.neutrophil_sprite(neutrophil.color, 10))
+
+    def test_macrophage_sprite_matches_direct_draw(self):
+        """Test that resting macrophages blit the same pixels the direct draw produces"""
+        from src.organisms import white_blood_cell
+
+        color = (150, 150, 220)
+        for radius in (6, 10, 32):
+            direct = pygame.Surface((120, 120))
+            white_blood_cell._draw_macrophage_body(direct, color, (60, 60), radius, 7)
+            blitted = pygame.Surface((120, 120))
+            sprite = white_blood_cell.macrophage_sprite(color, radius, 7)
+            half = sprite.get_width() // 2
+            blitted.blit(sprite, (60 - half, 60 - half))
+            with self.subTest(radius=radius):
+                self.assertEqual(pygame.image.tobytes(direct, "RGB"), pygame.image.tobytes(blitted, "RGB"))
+        self.assertIs(sprite, white_blood_cell.macrophage_sprite(color, 32, 7))
+
+    def test_tcell_aura_sprites_shared(self):
+        """Test that activated T-Cells blit a cached aura shared across nearby opacities"""
+        from src.organisms import white_blood_cell
+
+        tcell = TCell(100, 100, 8, (100, 180, 255), 0.8)
+        tcell.activation_level = 60
+        screen = pygame.Surface((200, 200))
+        tcell.render(screen, 100, 100, 1.0)
+
+        self.assertIn((tcell.active_color, 11, 160), white_blood_cell._AURA_SPRITES)
+
+        # Activation 60 and 63 give opacities 160 and 163, which share a bucket
+        sprite = white_blood_cell.aura_sprite(tcell.active_color, 11, 160)
+        self.assertIs(sprite, white_blood_cell.aura_sprite(tcell.active_color, 11, 163))
+        self.assertIsNot(sprite, white_blood_cell.aura_sprite(tcell.active_color, 11, 176))
+        self.assertEqual(sprite.get_size(), (22, 22))
+        self.assertEqual(sprite.get_at((11, 11)).a, 160)
+
+        # Zoomed-in auras share sprites across neighbouring radii
+        large = white_blood_cell.aura_sprite(tcell.active_color, 41, 160)
+        self.assertIs(large, white_blood_cell.aura_sprite(tcell.active_color, 40, 160))
+        self.assertEqual(large.get_size(), (80, 80))
+        screen.fill((0, 0, 0))
+        tcell.render(screen, 100, 100, 4.0)
+        self.assertIn((tcell.active_color, 46, 160), white_blood_cell._AURA_SPRITES)
+        self.assertNotEqual(screen.get_at((100, 100 - 40))[:3], (0, 0, 0))
+
+    def test_tcell_render_batch_matches_render(self):
+        """Test that batched T-Cell rendering draws the same pixels as per-cell render"""
+        from src.organisms import white_blood_cell
+
+        idle = TCell(80, 100, 8, (100, 180, 255), 0.8)
+        active = TCell(130, 100, 8, (100, 180, 255), 0.8)
+        active.activation_level = active.activation_threshold
+        tiny = TCell(100, 150, 1, (100, 180, 255), 0.8)
+        offscreen = TCell(900, 900, 8, (100, 180, 255), 0.8)
+        cells = [idle, active, tiny, offscreen]
+
+        batched = pygame.Surface((200, 200))
+        TCell.render_batch(cells, batched, 100, 100, 1.0)
+        direct = pygame.Surface((200, 200))
+        for cell in cells:
+            cell.render(direct, 100, 100, 1.0)
+        self.assertEqual(pygame.image.tobytes(batched, "RGB"), pygame.image.tobytes(direct, "RGB"))
+
+        # Idle cells are stamped from the shared body sprite
+        self.assertIn((idle.color, 8), white_blood_cell._TCELL_SPRITES)
+
+    def test_immune_cell_state_in_slots(self):
+        """Test that immune cell state is read from slots, leaving the instance dict unused"""
+        import copy
+
+        for cell in (self.wbc, Macrophage(100, 100, 10, (150, 150, 220), 0.5),
+                     TCell(100, 100, 8, (100, 180, 255), 0.8)):
+            self.assertEqual(cell.__dict__, {})
+
+            # Ad-hoc attributes (e.g. treatment boosts) still work, and copies keep slot state
+            cell.speed_boost = 1.5
+            clone = copy.deepcopy(cell)
+            self.assertEqual(clone.speed_boost, 1.5)
+            self.assertEqual(clone.x, cell.x)
+            self.assertEqual(clone.detection_radius_sq, cell.detection_radius_sq)
+
+    def test_tcell_cooldowns_tick_in_batch(self):
+        """Test that T-Cell cooldowns are counted down by the shared timer table"""
+        from src.organisms.immune_timers import IMMUNE_TIMERS
+
+        first = TCell(100, 100, 8, (100, 180, 255), 0.8)
+        second = TCell(200, 200, 8, (100, 180, 255), 0.8)
+        first.attack_cooldown = 3
+        second.antibody_production_cooldown = 1
+
+        IMMUNE_TIMERS.tick()
+        self.assertEqual(first.attack_cooldown, 2)
+        self.assertEqual(second.antibody_production_cooldown, 0)
+
+        # Timers stop at zero
+        IMMUNE_TIMERS.tick()
+        self.assertEqual(second.antibody_production_cooldown, 0)
+
+        # Growing the table keeps existing timers, and every field ticks together
+        from src.organisms.immune_timers import ImmuneTimers
+        timers = ImmuneTimers(capacity=1)
+        owners = [MagicMock(), MagicMock()]
+        slots = [timers.allocate(owner) for owner in owners]
+        timers.cooldowns["attack_cooldown"][slots[0]] = 4
+        timers.cooldowns["antibody_cooldown"][slots[1]] = 2
+        self.assertEqual(timers.capacity, 2)
+        timers.tick()
+        self.assertEqual(timers.cooldowns["attack_cooldown"].tolist(), [3, 0])
+        self.assertEqual(timers.cooldowns["antibody_cooldown"].tolist(), [0, 1])
+        timers.release(slots[0])
+        self.assertEqual(timers.cooldowns["attack_cooldown"][slots[0]], 0)
+
+    def test_macrophage_memory_expires(self):
+        """Test that macrophages remember pathogens they attack and later forget them"""
+        macrophage = Macrophage(100, 100, 10, (150, 150, 220), 0.5)
+        bacteria = EColi(105, 100, 5, (200, 100, 100), 1.0)
+        with patch('random.random', return_value=0.99):
+            macrophage.interact(bacteria, self.environment)
+        self.assertIn(id(bacteria), macrophage.memory)
+
+        macrophage.age += macrophage.memory_duration
+        macrophage._forget_expired()
+        self.assertNotIn(id(bacteria), macrophage.memory)
+
+    def test_neutrophil_scan_vectorized(self):
+        """Test that the neutrophil scan scores threats across the world wrap"""
+        self.wbc.x, self.wbc.y = 5, 100
+        far_virus = Virus(90, 100, 3, (255, 50, 50), 2.0)
+        wrapped_staph = Staphylococcus(795, 100, 5, (200, 100, 100), 1.0)
+        friendly = BeneficialBacteria(6, 100, 5, (100, 200, 100), 1.0)
+        organisms = [self.wbc, far_virus, wrapped_staph, friendly]
+
+        # The staph is 10 units away across the left edge; the virus is 85 away
+        self.wbc.scan_for_targets(organisms, self.environment)
+        self.assertIs(self.wbc.target, wrapped_staph)
+
+        # A badly hurt virus nearby beats the staph once the lock is released
+        self.wbc.target = None
+        near_virus = Virus(12, 100, 3, (255, 50, 50), 2.0)
+        near_virus.health = 10
+        self.wbc.scan_for_targets(organisms + [near_virus], self.environment)
+        self.assertIs(self.wbc.target, near_virus)
+
+        # A target still in range is kept without being looked up in the scan list
+        out_of_range = Virus(400, 300, 3, (255, 50, 50), 2.0)
+        self.wbc.scan_for_targets([self.wbc, out_of_range], self.environment)
+        self.assertIs(self.wbc.target, near_virus)
+
+        # A target that moves out of range is dropped, and nothing out of range replaces it
+        near_virus.x, near_virus.y = 400, 300
+        self.wbc.scan_for_targets([self.wbc, out_of_range], self.environment)
+        self.assertIsNone(self.wbc.target)
+
+    def test_locked_target_skips_rescan(self):
+        """Test that a live, in-range target is kept without building scan columns"""
+        staph = Staphylococcus(110, 100, 5, (200, 100, 100), 1.0)
+        virus = Virus(105, 100, 3, (255, 50, 50), 2.0)
+        organisms = [self.wbc, staph, virus]
+        self.wbc.target = staph
+        with patch.object(Neutrophil, '_candidate_columns') as columns:
+            self.wbc.scan_for_targets(organisms, self.environment)
+        columns.assert_not_called()
+        self.assertIs(self.wbc.target, staph)
+        self.assertEqual(self.wbc.target_lock_time, 1)
+
+        # A target that dies in range is replaced straight away
+        staph.is_alive = False
+        self.wbc.scan_for_targets(organisms, self.environment)
+        self.assertIs(self.wbc.target, virus)
+        self.assertEqual(self.wbc.target_lock_time, 0)
+
+    def test_isolated_scan_drops_distant_target(self):
+        """Test that a scan with no nearby organisms still lets go of a distant or dead target"""
+        self.wbc.detection_radius = 200
+        staph = Staphylococcus(500, 400, 5, (200, 100, 100), 1.0)
+        self.wbc.target = staph
+        self.wbc.target_lock_time = 3
+        self.wbc.scan_for_targets([], self.environment)
+        self.assertIsNone(self.wbc.target)
+        self.assertEqual(self.wbc.target_lock_time, 0)
+
+        # A dead target is dropped the same way
+        self.wbc.target = Staphylococcus(110, 100, 5, (200, 100, 100), 1.0)
+        self.wbc.target.is_alive = False
+        self.wbc.scan_for_targets([], self.environment)
+        self.assertIsNone(self.wbc.target)
+
+    def test_virus_target_raises_activation(self):
+        """Test that locking onto a virus subtype raises activation via its type tags"""
+        self.wbc.x, self.wbc.y = 100, 100
+        self.wbc.activation_level = 0.0
+        staph = Staphylococcus(110, 100, 5, (200, 100, 100), 1.0)
+        self.wbc.scan_for_targets([self.wbc, staph], self.environment)
+        self.assertIs(self.wbc.target, staph)
+        self.assertEqual(self.wbc.activation_level, 0.0)
+
+        self.wbc.target = None
+        flu = Influenza(105, 100, 3, (255, 50, 50), 2.0)
+        self.wbc.scan_for_targets([self.wbc, flu], self.environment)
+        self.assertIs(self.wbc.target, flu)
+        self.assertEqual(self.wbc.activation_level, 2.0)
+
+    def test_screen_position_memoized_per_frame(self):
+        """Test that screen positions are shared within a render frame only"""
+        from src.organisms.organism import Organism
+
+        virus = Virus(110, 100, 3, (255, 50, 50), 2.0)
+        self.assertEqual(virus.screen_position(100, 100, 2.0, 50, 50), (70, 50))
+
+        # Outside a render pass nothing is cached
+        virus.x = 120
+        self.assertEqual(virus.screen_position(100, 100, 2.0, 50, 50), (90, 50))
+
+        Organism.begin_render_frame()
+        try:
+            self.assertEqual(virus.screen_position(100, 100, 2.0, 50, 50), (90, 50))
+            virus.x = 130
+            self.assertEqual(virus.screen_position(100, 100, 2.0, 50, 50), (90, 50))
+            Organism.begin_render_frame()
+            self.assertEqual(virus.screen_position(100, 100, 2.0, 50, 50), (110, 50))
+        finally:
+            Organism.render_frame = 0
+
+    def test_random_pool_refills(self):
+        """Test that pooled uniform draws stay in [0, 1) across refills"""
+        from src.organisms import white_blood_cell
+
+        draws = [white_blood_cell._rand() for _ in range(white_blood_cell._RAND_POOL_SIZE + 10)]
+        self.assertTrue(all(0.0 <= draw < 1.0 for draw in draws))
+        self.assertGreater(len(set(draws)), 1)
+
+    def test_noise_pool_refills(self):
+        """Test that pooled normal draws are scaled by sigma across refills"""
+        from src.organisms import organism
+
+        draws = np.array([organism.noise(0.5) for _ in range(organism._NOISE_POOL_SIZE + 10)])
+        self.assertAlmostEqual(draws.mean(), 0.0, delta=0.05)
+        self.assertAlmostEqual(draws.std(), 0.5, delta=0.05)
+
+    def test_batched_decisions_match_single(self):
+        """Test that the batched forward pass matches each organism's own decision"""
+        cells = [Neutrophil(100 + 50 * i, 100, 10, (220, 220, 250), 1.0) for i in range(4)]
+        inputs = [np.random.uniform(-1, 1, 5).tolist() for _ in cells]
+        decisions = Neutrophil.neural_network_decisions(cells, inputs)
+        self.assertEqual(decisions.shape, (4, 4))
+        for cell, row, cell_inputs in zip(cells, decisions, inputs):
+            np.testing.assert_allclose(row, cell.neural_network_decision(cell_inputs), atol=1e-12)
+
+    def test_base_composition_single_pass(self):
+        """Test that the base composition matches counting each base separately"""
+        bacteria = Bacteria(100, 100, 5, (0, 255, 0), 1.0)
+        bacteria.dna = list("AATGCCCG") + [0, 1]
+        composition = bacteria._base_composition()
+        self.assertEqual(set(composition), {'A', 'T', 'G', 'C'})
+        for base in 'ATGC':
+            self.assertAlmostEqual(composition[base], bacteria.dna.count(base) / 8)
+        self.assertEqual(len(bacteria._generate_dna(25)), 25)
+
+    def test_tcell_memory_expires_lazily(self):
+        """Test that refreshed T-Cell memories outlive their original expiry age"""
+        tcell = TCell(100, 100, 8, (100, 180, 255), 0.8)
+        first = Influenza(105, 100, 3, (255, 50, 50), 2.0)
+        second = Influenza(106, 100, 3, (255, 50, 50), 2.0)
+        tcell._remember(first)
+        tcell._remember(second)
+
+        # Seeing the first virus again halfway through pushes its expiry back
+        tcell.age += tcell.memory_duration // 2
+        tcell._remember(first)
+        tcell.age = tcell.memory_duration
+        tcell._forget_expired()
+        self.assertIn(id(first), tcell.memory)
+        self.assertNotIn(id(second), tcell.memory)
+
+        tcell.age += tcell.memory_duration
+        tcell._forget_expired()
+        self.assertEqual(len(tcell.memory), 0)
+        self.assertEqual(list(tcell.memory), [])
+
+    def test_memory_table_matches_set(self):
+        """Test that the memory table agrees with a plain set through growth and expiry"""
+        from src.organisms.memory_table import MemoryTable
+
+        table = MemoryTable(4)
+        # Writes that fit store into the existing slot buffers
+        keys_buffer, expiry_buffer = table.keys, table.expiry
+        table.remember(64, 5)
+        table.remember(64, 8)
+        self.assertIs(table.keys, keys_buffer)
+        self.assertIs(table.expiry, expiry_buffer)
+        self.assertEqual(len(table), 1)
+        table.clear()
+
+        rng = random.Random(7)
+        keys = [rng.randrange(1 << 40) * 16 for _ in range(50)]
+        for age, key in enumerate(keys):
+            table.remember(key, age + 10)
+        self.assertEqual(len(table), 50)
+        self.assertGreaterEqual(table.capacity, 100)
+        self.assertEqual(set(table), set(keys))
+
+        # Keys remembered at ages 0-19 expire by age 29
+        self.assertEqual(table.expire(29), 20)
+        expected = set(keys[20:])
+        probes = np.array(keys + [12345, 67890], dtype=np.int64)
+        self.assertEqual(table.contains_many(probes).tolist(),
+                         [key in expected for key in probes.tolist()])
+        self.assertTrue(all(key in table for key in expected))
+        self.assertNotIn(keys[0], table)
+
+        # Small batches, as lists or arrays, give the same answers key by key
+        few = [keys[0], keys[25], 12345]
+        self.assertEqual(table.contains_many(few).tolist(), [False, True, False])
+        self.assertEqual(table.contains_many(np.array(few, dtype=np.int64)).tolist(), [False, True, False])
+
+        # Survivors are reinserted with their own expiry ages
+        self.assertEqual(table.next_expiry, 30)
+        self.assertEqual(table.expire(39), 10)
+        self.assertEqual(set(table), set(keys[30:]))
+        self.assertLessEqual(table.max_probe, len(keys))
+
+        # Nothing is due before the earliest remaining expiry
+        self.assertEqual(table.expire(39), 0)
+        table.clear()
+        self.assertFalse(table)
+
+    def test_type_tags_resolved_at_birth(self):
+        """Test that organisms carry type codes and tags from construction"""
+        from src.organisms import organism_types
+
+        self.assertEqual(self.virus.type_code, organism_types.VIRUS)
+        self.assertTrue(self.virus.type_tags & organism_types.TAG_VIRUS)
+        staph = Staphylococcus(100, 100, 5, (200, 100, 100), 1.0)
+        self.assertTrue(staph.type_tags & organism_types.TAG_HARMFUL_BACTERIA)
+        beneficial = BeneficialBacteria(100, 100, 5, (100, 200, 100), 1.0)
+        self.assertTrue(beneficial.type_tags & organism_types.EXEMPT_MASK)
+        self.assertTrue(self.wbc.type_tags & organism_types.TAG_IMMUNE)
+
+        # Objects without tags are classified from their type/name strings
+        mock_staph = MagicMock()
+        mock_staph.get_type = MagicMock(return_value="bacteria")
+        mock_staph.get_name = MagicMock(return_value="Staphylococcus")
+        self.assertEqual(organism_types.organism_tags(mock_staph), staph.type_tags)
+
+    def test_capabilities_cached_per_class(self):
+        """Test that optional-method capabilities are resolved once per class"""
+        from src.organisms import organism_types
+        from src.organisms.body_cells import Platelet
+
+        caps = organism_types.capabilities_of(self.wbc)
+        self.assertTrue(caps & organism_types.CAN_INTERACT)
+        self.assertTrue(caps & organism_types.CAN_SCAN_TARGETS)
+        self.assertFalse(caps & organism_types.CAN_SCAN_PLATELETS)
+        self.assertIn(Neutrophil, organism_types._class_capabilities)
+
+        platelet_caps = organism_types.capabilities_of(Platelet(100, 100, 3, (200, 200, 200), 0.5))
+        self.assertTrue(platelet_caps & organism_types.CAN_SCAN_PLATELETS)
+        self.assertTrue(platelet_caps & organism_types.CAN_ACTIVATE)
+        self.assertFalse(organism_types.capabilities_of(self.virus) & organism_types.CAN_SCAN_TARGETS)
+
+    def test_platelet_scan_skips_itself(self):
+        """Test that a platelet scanning its neighbour block finds only other activated platelets"""
+        from src.organisms.body_cells import Platelet
+
+        platelet = Platelet(100, 100, 3, (200, 200, 200), 0.5)
+        other = Platelet(105, 100, 3, (200, 200, 200), 0.5)
+        platelet.activate()
+        other.activate()
+        platelet.scan_for_platelets([platelet, other, self.virus])
+        self.assertEqual(platelet.nearby_platelets, [other])
+
+    def test_type_resolved_once_per_class(self):
+        """Test that type info and target labels come from per-class resolution"""
+        from src.organisms import organism_types
+
+        staph = Staphylococcus(120, 100, 5, (200, 100, 100), 1.0)
+        self.assertEqual(organism_types.type_info_of(staph),
+                         (organism_types.type_code_of(staph), organism_types.organism_tags(staph)))
+        self.assertEqual(organism_types.type_label(staph), "Staphylococcus")
+        self.assertEqual(organism_types._class_labels[Staphylococcus], "Staphylococcus")
+
+        # Test doubles are labelled from their own strings and never cached
+        mock = MagicMock()
+        mock.get_type.return_value = "virus"
+        code, tags = organism_types.type_info_of(mock)
+        self.assertTrue(tags & organism_types.TAG_VIRUS)
+        self.assertEqual(organism_types.type_label(mock), "Virus")
+        self.assertNotIn(type(mock), organism_types._class_labels)
+
+    def test_tcell_targets_match_type_mask(self):
+        """Test that T-Cells select targets by type code rather than by substring"""
+        tcell = TCell(100, 100, 8, (100, 100, 255), 1.0)
+        staph = Staphylococcus(120, 100, 5, (200, 100, 100), 1.0)
+        ecoli = EColi(110, 100, 5, (200, 100, 100), 1.0)
+        organisms = [tcell, ecoli, staph]
+
+        # Viruses report get_type() == "virus" and are still recognised as viruses
+        virus = Influenza(105, 100, 3, (255, 50, 50), 2.0)
+        health = virus.health
+        self.assertTrue(tcell.interact(virus, MockEnvironment()))
+        self.assertLessEqual(virus.health, health - tcell.attack_strength * 2.0)
+        tcell.attack_cooldown = 0
+
+        # EColi is not in the T-Cell's target list, so the farther staph wins
+        self.assertIs(tcell.scan_for_targets(organisms, MockEnvironment()), staph)
+        self.assertFalse(tcell.interact(ecoli, MockEnvironment()))
+
+        # Reassigning the target list rebuilds the mask
+        tcell.potential_targets = ["Bacteria"]
+        self.assertIs(tcell.scan_for_targets(organisms, MockEnvironment()), ecoli)
+
+    def test_interact_skips_organisms_outside_scan(self):
+        """Test that immune cells reject organisms their last scan did not see in range"""
+        tcell = TCell(100, 100, 8, (100, 100, 255), 1.0)
+        near = Influenza(105, 100, 3, (255, 50, 50), 2.0)
+        unseen = Influenza(104, 100, 3, (255, 50, 50), 2.0)
+        tcell.scan_for_targets([tcell, near], MockEnvironment())
+        self.assertFalse(tcell.interact(unseen, MockEnvironment()))
+        self.assertTrue(tcell.interact(near, MockEnvironment()))
+
+        # Updating clears the cache, so unscanned organisms are checked directly
+        tcell.update(self.environment)
+        tcell.x, tcell.y = 100, 100
+        tcell.attack_cooldown = 0
+        self.assertTrue(tcell.interact(unseen, MockEnvironment()))
+
+    def test_scan_scores_only_in_range_candidates(self):
+        """Test that memory lookups and scoring see only the in-range candidates"""
+        macrophage = Macrophage(100, 100, 10, (150, 150, 220), 0.5)
+        remembered_virus = Influenza(140, 100, 3, (255, 50, 50), 2.0)
+        near_virus = Influenza(130, 100, 3, (255, 50, 50), 2.0)
+        far = [Influenza(700, 500, 3, (255, 50, 50), 2.0) for _ in range(5)]
+        macrophage._remember(remembered_virus)
+
+        with patch.object(type(macrophage.memory), 'contains_many',
+                          autospec=True, side_effect=lambda table, keys: np.array(keys) == id(remembered_virus)) as lookup:
+            target = macrophage.scan_for_targets(far + [near_virus, remembered_virus], MockEnvironment())
+        self.assertEqual(len(lookup.call_args[0][1]), 2)
+        self.assertIs(target, remembered_virus)
+        self.assertEqual(macrophage._scan_candidates_cache, {id(near_virus), id(remembered_virus)})
+
+        # Later scans refill the same set
+        candidates = macrophage._scan_candidates_cache
+        macrophage.scan_for_targets(far, MockEnvironment())
+        self.assertIs(macrophage._scan_candidates_cache, candidates)
+        self.assertEqual(candidates, set())
+
+    def test_completed_engulf_records_pathogen(self):
+        """Test that a finished engulf records the pathogen's type, size and color"""
+        macrophage = Macrophage(100, 100, 10, (150, 150, 220), 0.5)
+        virus = Influenza(105, 100, 3, (255, 50, 50), 2.0)
+        macrophage.engulfing_target = virus
+        macrophage.engulfing_starting_distance = 5
+        macrophage.engulfing_progress = 1.0
+        macrophage.update(self.environment)
+        self.assertFalse(virus.is_alive)
+        self.assertEqual(macrophage.engulfed_pathogens[0]["type"], virus.type)
+        self.assertEqual(macrophage.engulfed_pathogens[0]["color"], virus.color)
+
+        # Objects without a type attribute fall back to get_type()
+        stand_in = MagicMock(spec=["get_type", "size", "is_alive"])
+        stand_in.get_type.return_value = "Rhinovirus"
+        stand_in.size = 3
+        macrophage.engulfing_target = stand_in
+        macrophage.engulfing_progress = 1.0
+        macrophage.update(self.environment)
+        self.assertEqual(macrophage.engulfed_pathogens[-1],
+                         {"type": "Rhinovirus", "size": 3, "color": (150, 50, 50)})
+
+    def test_engulf_chance_table(self):
+        """Test that engulf chances come from the target's tags in ladder order"""
+        from src.organisms import organism_types
+
+        chances = Macrophage._ENGULF_CHANCES
+        for organism, expected in ((Influenza(0, 0, 3, (255, 50, 50), 2.0), 0.25),
+                                   (EColi(0, 0, 5, (200, 100, 100), 1.0), 0.5),
+                                   (Salmonella(0, 0, 5, (200, 100, 100), 1.0), 0.5)):
+            self.assertEqual(chances[organism_types.organism_tags(organism) & organism_types.TARGET_MASK],
+                             expected)
+        self.assertEqual(chances[organism_types.TAG_DEAD], 0.7)
+        self.assertEqual(chances[organism_types.TAG_VIRUS | organism_types.TAG_DAMAGED], 0.25)
+
+    def test_macrophage_scan_uses_organism_arrays(self):
+        """Test that the vectorized macrophage scan matches with and without a snapshot"""
+        macrophage = Macrophage(100, 100, 10, (150, 150, 220), 0.5)
+        bacteria = EColi(160, 100, 5, (200, 100, 100), 1.0)
+        near_virus = Influenza(140, 100, 3, (255, 50, 50), 2.0)
+        marked_virus = Rhinovirus(150, 100, 3, (255, 50, 50), 2.0)
+        marked_virus.antibody_marked = True
+        friendly = BeneficialBacteria(101, 100, 5, (100, 200, 100), 1.0)
+        organisms = [macrophage, bacteria, near_virus, marked_virus, friendly]
+
+        # Without a snapshot the columns are built from the objects
+        target = macrophage.scan_for_targets(organisms, MockEnvironment())
+        self.assertIs(target, marked_virus)
+
+        # With a snapshot the columns come from the environment's arrays
+        self.environment.update_soa(organisms)
+        self.assertEqual(self.environment.organism_arrays.count, len(organisms))
+        macrophage.target = None
+        target = macrophage.scan_for_targets(organisms, self.environment)
+        self.assertIs(target, marked_virus)
+
+        # Dead organisms are never selected
+        marked_virus.is_alive = False
+        self.environment.update_soa(organisms)
+        self.assertIs(macrophage.scan_for_targets(organisms, self.environment), near_virus)
+
+    def test_macrophage_scan_scores_by_distance(self):
+        """Test that threat falls off with distance, so a heavier-weighted virus can beat closer bacteria"""
+        macrophage = Macrophage(100, 100, 10, (150, 150, 220), 0.5)
+        bacteria = EColi(110, 100, 5, (200, 100, 100), 1.0)
+        virus = Influenza(115, 100, 3, (255, 50, 50), 2.0)
+        organisms = [macrophage, bacteria, virus]
+
+        # 3.75 * r / 15 beats 2 * r / 10 (under r^2 / d^2 the bacteria would win)
+        self.environment.update_soa(organisms)
+        self.assertIs(macrophage.scan_for_targets(organisms, self.environment), virus)
+
+    def test_best_threat_kernel(self):
+        """Test the threat-scoring kernel against the NumPy reference"""
+        from src.organisms import organism_types
+        from src.organisms._scan_kernels import best_threat, _best_threat_numpy
+
+        codes = np.array([organism_types.MACROPHAGE, organism_types.ECOLI,
+                          organism_types.INFLUENZA, organism_types.RHINOVIRUS], dtype=np.int8)
+        xs = np.array([0, 25, 40, 50], dtype=np.float32)
+        ys = np.zeros(4, dtype=np.float32)
+        alive = np.ones(4, dtype=bool)
+        marked = np.array([False, False, False, True])
+        health_ratio = np.ones(4, dtype=np.float32)
+        target_table = organism_types.codes_for_names(["Virus", "EColi"])
+        args = (0.0, 0.0, xs, ys, codes, alive, marked, health_ratio, np.zeros(0, dtype=bool),
+                250.0 ** 2, target_table, Macrophage._THREAT_WEIGHTS, organism_types.IS_VIRUS)
+
+        index, score = best_threat(*args)
+        self.assertEqual(index, 3)
+        self.assertEqual((index, score), _best_threat_numpy(*args))
+
+        # Remembering the bacteria makes it the highest threat among unmarked candidates,
+        # but a remembered bacteria does not outrank the marked virus
+        remembered = np.array([False, True, False, False])
+        index, _ = best_threat(*(args[:6] + (np.zeros(4, dtype=bool),) + args[7:8] + (remembered,) + args[9:]))
+        self.assertEqual(index, 1)
+        index, _ = best_threat(*(args[:8] + (remembered,) + args[9:]))
+        self.assertEqual(index, 3)
+
+        # Damaged candidates score 1.3x
+        flu_only = args[:10] + (organism_types.codes_for_names(["Influenza"]),) + args[11:]
+        _, healthy_score = best_threat(*flu_only)
+        damaged = np.array([1.0, 1.0, 0.5, 1.0], dtype=np.float32)
+        index, damaged_score = best_threat(*(flu_only[:7] + (damaged,) + flu_only[8:]))
+        self.assertEqual(index, 2)
+        self.assertAlmostEqual(damaged_score, healthy_score * 1.3)
+
+        # Marked, remembered and damaged multipliers combine into one factor
+        everything = (args[:7] + (damaged, np.ones(4, dtype=bool), args[9],
+                                  organism_types.codes_for_names(["Virus"])) + args[11:])
+        index, score = _best_threat_numpy(*everything)
+        self.assertEqual(index, 3)
+        self.assertAlmostEqual(score, 250.0 / 50 * 2.5 * 1.5 * 3.0 * 2.0)
+        index, score = _best_threat_numpy(*(everything[:6] + (np.zeros(4, dtype=bool),) + everything[7:]))
+        self.assertEqual(index, 2)
+        self.assertAlmostEqual(score, 250.0 / 40 * 2.5 * 1.5 * 2.0 * 1.3)
+
+        # Nothing within range
+        index, _ = best_threat(*(args[:9] + (1.0,) + args[10:]))
+        self.assertEqual(index, -1)
+
+    def test_within_radius_prefilter(self):
+        """Test that the bounding-box prefilter keeps exactly the offsets inside the circle"""
+        from src.organisms._scan_kernels import within_radius
+
+        rng = np.random.default_rng(3)
+        dx = rng.uniform(-100, 100, 500)
+        dy = rng.uniform(-100, 100, 500)
+        np.testing.assert_array_equal(within_radius(dx, dy, 40.0 ** 2), dx*dx + dy*dy <= 40.0 ** 2)
+
+        # Points on the circle and box corners outside it
+        edge = within_radius(np.array([40.0, 0.0, 30.0]), np.array([0.0, -40.0, 30.0]), 40.0 ** 2)
+        self.assertEqual(edge.tolist(), [True, True, False])
+
+    def test_kernel_warm_up_arguments(self):
+        """Test that the import-time warm-up calls each kernel with valid arguments"""
+        from src.organisms import _scan_kernels
+
+        # Runs the NumPy kernels when Numba is absent, so the argument shapes are checked either way
+        _scan_kernels._warm_up()
+
+    def test_minimum_image_matches_branching_wrap(self):
+        """Test that the branchless wrap picks the same offset as the branching one"""
+        from src.organisms._scan_kernels import minimum_image
+
+        width = 800.0
+        d = np.random.default_rng(5).uniform(-width, width, 500)
+        expected = np.where(np.abs(d) > width / 2, -np.copysign(width - np.abs(d), d), d)
+        np.testing.assert_allclose(minimum_image(d, width), expected, atol=1e-9)
+        self.assertAlmostEqual(minimum_image(790.0, width), -10.0)
+        self.assertAlmostEqual(minimum_image(-30.0, width), -30.0)
+
+    def test_best_proximity_threat_kernel(self):
+        """Test the Neutrophil proximity-weighted kernel against the NumPy reference"""
+        from src.organisms import organism_types, white_blood_cell
+        from src.organisms._scan_kernels import best_proximity_threat, _best_proximity_threat_numpy
+
+        codes = np.array([organism_types.NEUTROPHIL, organism_types.ECOLI,
+                          organism_types.VIRUS, organism_types.BENEFICIAL_BACTERIA], dtype=np.int8)
+        xs = np.array([0.0, 20.0, 60.0, 5.0], dtype=np.float32)
+        ys = np.zeros(4, dtype=np.float32)
+        alive = np.ones(4, dtype=bool)
+        health = np.full(4, 100.0, dtype=np.float32)
+        args = (0.0, 0.0, xs, ys, codes, alive, health, 800, 600, 200.0,
+                white_blood_cell._NEUTROPHIL_THREAT_LEVELS)
+
+        # The nearby E. coli outweighs the more dangerous but distant virus
+        self.assertEqual(best_proximity_threat(*args), 1)
+        self.assertEqual(best_proximity_threat(*args), _best_proximity_threat_numpy(*args))
+
+        # With the E. coli dead the virus is next, and out-of-range candidates never qualify
+        alive[1] = False
+        self.assertEqual(best_proximity_threat(*args), 2)
+        xs[2] = 300.0
+        self.assertEqual(best_proximity_threat(*args), -1)
+
+        # Candidates across the world edge are measured the short way round
+        xs[2] = 760.0
+        self.assertEqual(best_proximity_threat(*args), 2)
+        self.assertEqual(_best_proximity_threat_numpy(*args), 2)
+
+    def test_close_pairs_kernel(self):
+        """Test the interaction pair filter against the NumPy reference"""
+        from src.organisms._scan_kernels import close_pairs, _close_pairs_numpy
+
+        xs = np.array([0.0, 20.0, 25.0, 100.0])
+        ys = np.zeros(4)
+        sizes = np.array([5.0, 5.0, 1.0, 5.0])
+        first = np.array([0, 0, 1, 2], dtype=np.intp)
+        second = np.array([1, 2, 2, 3], dtype=np.intp)
+
+        # Reach is both sizes plus the interaction radius, inclusive at the edge
+        expected = [True, False, True, False]
+        self.assertEqual(close_pairs(xs, ys, sizes, first, second, 10.0).tolist(), expected)
+        self.assertEqual(_close_pairs_numpy(xs, ys, sizes, first, second, 10.0).tolist(), expected)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
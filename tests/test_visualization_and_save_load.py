@@ -12,7 +12,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.visualization.renderer import Renderer
 from src.environment.environment import Environment
-from src.simulation import BioSimulation
+from src.simulation import BioSimulation, _scan_neighbors
 from src.utils.save_load import save_simulation, load_simulation, list_saved_simulations
 
 class TestEnvironmentViewMode(unittest.TestCase):
@@ -115,6 +115,29 @@ class TestEnvironmentViewMode(unittest.TestCase):
         self.assertTrue(result)  # Event was handled
         self.assertTrue(self.renderer.show_environment)  # View should be enabled
         self.assertEqual(self.renderer.env_view_mode, 1)  # Mode should be incremented
+    
+    def test_render_organisms_culls_offscreen(self):
+        """Test that organisms outside the view are counted but not drawn"""
+        self.renderer.camera_x = 400
+        self.renderer.camera_y = 300
+        self.renderer.zoom = 1.0
+        
+        visible = MagicMock()
+        visible.x, visible.y = 400, 300
+        visible.health = 100
+        visible.is_alive = True
+        visible.get_type.return_value = "bacteria"
+        offscreen = MagicMock()
+        offscreen.x, offscreen.y = 5000, 300
+        offscreen.health = 100
+        offscreen.is_alive = True
+        offscreen.get_type.return_value = "bacteria"
+        
+        self.renderer.render_organisms([visible, offscreen])
+        
+        visible.render.assert_called_once()
+        offscreen.render.assert_not_called()
+        self.assertEqual(self.renderer.stats["bacteria"], 2)
         
     def tearDown(self):
         """Clean up resources"""
@@ -294,7 +317,113 @@ class TestSaveLoadSimulation(unittest.TestCase):
         
         # Clean up pygame
         pygame.quit()
-    
+
+    def test_headless_simulation_skips_rendering(self):
+        """Test that a headless simulation draws nothing"""
+        pygame.init()
+        screen = pygame.Surface((800, 600))
+
+        with patch('pygame.display.set_mode', return_value=screen), \
+             patch('src.simulation.BioSimulation.initialize_simulation'):
+            for headless in (True, False):
+                self.config["simulation"]["headless"] = headless
+                simulation = BioSimulation(self.config)
+                self.assertEqual(simulation.headless, headless)
+
+                simulation.renderer = MagicMock()
+                simulation.treatment_panel = MagicMock()
+                with patch('pygame.display.flip'):
+                    simulation.render()
+                self.assertEqual(simulation.renderer.render_all.called, not headless)
+
+        pygame.quit()
+
+    def test_remove_dead_organisms_in_place(self):
+        """Test that dead organisms are dropped from the same list, keeping survivor order"""
+        pygame.init()
+        screen = pygame.Surface((800, 600))
+
+        with patch('pygame.display.set_mode', return_value=screen), \
+             patch('src.simulation.BioSimulation.initialize_simulation'):
+            simulation = BioSimulation(self.config)
+            organisms = self.organisms
+            organisms[0].is_alive = False
+            organisms[3].is_alive = False
+            survivors = [organisms[1], organisms[2], organisms[4]]
+            simulation.organisms = organisms
+            simulation.remove_dead_organisms()
+            self.assertIs(simulation.organisms, organisms)
+            self.assertEqual(organisms, survivors)
+
+        pygame.quit()
+
+    def test_spawn_cells_on_interval_ticks(self):
+        """Test that cells spawn on every interval tick, starting from the first"""
+        pygame.init()
+        screen = pygame.Surface((800, 600))
+        self.config["simulation_settings"] = {
+            "cell_spawn_interval": 3,
+            "cell_spawn_count": 1,
+            "cell_types_to_spawn": ["red_blood_cell"]
+        }
+
+        with patch('pygame.display.set_mode', return_value=screen), \
+             patch('src.simulation.BioSimulation.initialize_simulation'), \
+             patch('src.simulation.create_organism', return_value=MagicMock()) as create:
+            simulation = BioSimulation(self.config)
+            simulation.environment = self.environment
+            spawned_on = []
+            for tick in range(8):
+                simulation.update_count = tick
+                calls = create.call_count
+                simulation.spawn_cells()
+                if create.call_count > calls:
+                    spawned_on.append(tick)
+            self.assertEqual(spawned_on, [0, 3, 6])
+
+            # Spawning stays off when disabled
+            self.config["simulation_settings"]["cell_spawn_interval"] = 0
+            simulation.read_settings()
+            simulation.spawn_cells()
+            self.assertEqual(create.call_count, 3)
+
+        pygame.quit()
+
+    def test_scan_neighbors_wrap_world_edges(self):
+        """Test that batched scan neighbors match a wrapped distance check"""
+        rng = np.random.default_rng(3)
+        xs = np.append(rng.uniform(0, 800, 60), [795.0, 5.0])
+        ys = np.append(rng.uniform(0, 600, 60), [300.0, 300.0])
+        alive = np.ones(xs.size, dtype=np.uint8)
+        alive[::7] = 0
+        organisms = list(range(xs.size))
+        scanners = np.array([0, 5, 60, 61])
+        radii = np.array([150.0, 90.0, 20.0, 20.0])
+
+        nearby = _scan_neighbors(organisms, (xs, ys, alive), scanners, radii, (800, 600))
+        for i, r, found in zip(scanners, radii, nearby):
+            dx = np.abs(xs - xs[i])
+            dy = np.abs(ys - ys[i])
+            dx = np.minimum(dx, 800 - dx)
+            dy = np.minimum(dy, 600 - dy)
+            expected = np.flatnonzero((dx*dx + dy*dy <= r*r) & (alive != 0))
+            self.assertEqual(found, [j for j in expected.tolist() if j != i])
+        self.assertEqual(nearby[2], [61])
+
+        # Coordinates a hair below zero wrap to the far edge rather than past it
+        xs = np.array([-1e-14, 795.0, 400.0])
+        ys = np.array([300.0, 300.0, -1e-14])
+        nearby = _scan_neighbors(organisms, (xs, ys, np.ones(3, dtype=np.uint8)),
+                                 np.array([0, 2]), np.array([10.0, 10.0]), (800, 600))
+        self.assertEqual(nearby, [[1], []])
+
+        # Organisms exactly on the far edges are found from across the wrap
+        xs = np.array([5.0, 800.0, 400.0, 400.0])
+        ys = np.array([300.0, 300.0, 600.0, 5.0])
+        nearby = _scan_neighbors(organisms, (xs, ys, np.ones(4, dtype=np.uint8)),
+                                 np.array([0, 3]), np.array([10.0, 10.0]), (800, 600))
+        self.assertEqual(nearby, [[1], [2]])
+
     def tearDown(self):
         """Clean up resources"""
         # Remove the temporary directory